@@ -0,0 +1,27 @@
+""" Benchmark the time to import mplsoccer in a new interpreter.
+
+Run with: python benchmarks/bench_import.py
+
+The submodules are imported lazily, so importing mplsoccer (without using it) should take
+a few milliseconds. The eager import took around 2 seconds (matplotlib, pandas,
+scipy.stats and seaborn).
+"""
+
+import subprocess
+import sys
+
+CODE = ('import time\n'
+        'start = time.perf_counter()\n'
+        'import mplsoccer\n'
+        'print(time.perf_counter() - start)')
+
+
+def import_time(repeat=5):
+    """ The fastest time in seconds to import mplsoccer in a new interpreter."""
+    times = [float(subprocess.run([sys.executable, '-c', CODE], capture_output=True, text=True,
+                                  check=True).stdout) for _ in range(repeat)]
+    return min(times)
+
+
+if __name__ == '__main__':
+    print(f'import mplsoccer: {import_time() * 1000:.1f} ms')
@@ -0,0 +1,62 @@
+""" Benchmark drawing comet lines with a fixed and an adaptive number of segments.
+
+Run with: python benchmarks/bench_lines.py
+
+Each comet/ transparent line is split into segments of increasing width and opacity.
+n_segments='auto' uses about one segment per 3 points of on-screen length, rather than
+a fixed 100 segments per line, so short passes use far fewer segments. For 5,000 passes
+'auto' used about a quarter of the segments, a third of the peak memory and was around
+three times faster to create than n_segments=100.
+"""
+
+import io
+import time
+import tracemalloc
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from mplsoccer import Pitch
+
+
+def passes(num_passes=5000, seed=42):
+    """ Random passes with a length of around 15 meters."""
+    rng = np.random.default_rng(seed)
+    xstart = rng.uniform(0, 120, num_passes)
+    ystart = rng.uniform(0, 80, num_passes)
+    xend = np.clip(xstart + rng.normal(0, 15, num_passes), 0, 120)
+    yend = np.clip(ystart + rng.normal(0, 15, num_passes), 0, 80)
+    return xstart, ystart, xend, yend
+
+
+def draw_lines(n_segments, num_passes=5000):
+    """ The number of segments and the seconds to create and save the lines."""
+    pitch = Pitch()
+    fig, ax = pitch.draw(figsize=(10, 7))
+    start = time.perf_counter()
+    collection = pitch.lines(*passes(num_passes), comet=True, transparent=True,
+                             n_segments=n_segments, ax=ax)
+    create = time.perf_counter() - start
+    start = time.perf_counter()
+    fig.savefig(io.BytesIO(), format='png')
+    save = time.perf_counter() - start
+    plt.close(fig)
+    return len(collection.get_segments()), create, save
+
+
+def peak_memory(n_segments, num_passes=5000):
+    """ The peak memory in MB allocated while creating and saving the lines.
+    Measured separately, as tracing the memory slows down the drawing."""
+    tracemalloc.start()
+    draw_lines(n_segments, num_passes=num_passes)
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == '__main__':
+    for n_segments in [100, 'auto']:
+        segments, create, save = draw_lines(n_segments)
+        peak = peak_memory(n_segments)
+        print(f'n_segments={n_segments!r:>6}: {segments:>7,} segments, create {create:5.1f} s, '
+              f'savefig {save:4.1f} s, peak {peak:4.0f} MB')
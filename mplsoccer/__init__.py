@@ -1,18 +1,67 @@
 """ This module imports the mplsoccer classes/ functions so that they can be used like
-from mplsoccer import Pitch."""
+from mplsoccer import Pitch.
+
+The submodules are imported when one of their classes/ functions is first used (PEP 562),
+so importing mplsoccer is fast and, for example, using Pitch does not import the StatsBomb
+parser (requests) or the radar/ pizza charts."""
+
+import importlib
 
 from .__about__ import __version__
-from .soccer.statsbomb import Sbopen, Sbapi,  Sblocal
-from .soccer.markers import *
-from .soccer.dimensions import Standardizer
-from .soccer.pitch import *
-from .cm import *
-from .linecollection import *
-from .quiver import *
-from .radar_chart import *
-from .scatterutils import *
-from .text import *
-from .utils import *
-from .bumpy_chart import *
-from .py_pizza import *
-from .grid import *
+# the grid functions are quick to import and are imported now, so importing the grid submodule
+# later (e.g. import mplsoccer.grid) does not replace the grid function with the submodule
+from .grid import _grid_dimensions, _draw_grid, grid, grid_dimensions
+
+# the classes/ functions imported from each submodule (the submodule's __all__)
+_SUBMODULE_NAMES = {
+    '.soccer.statsbomb': ['Sbopen', 'Sbapi', 'Sblocal'],
+    '.soccer.markers': ['scatter_football', 'football_shirt_marker', 'football_left_boot_marker',
+                        'football_right_boot_marker'],
+    '.soccer.dimensions': ['Standardizer'],
+    '.soccer.transforms': ['CoordinateTransform'],
+    '.soccer.direction': ['DirectionNormalizer'],
+    '.soccer.kinematics': ['Kinematics'],
+    '.soccer.pitch': ['Pitch', 'VerticalPitch'],
+    '.cm': ['create_transparent_cmap', 'grass_cmap'],
+    '.linecollection': ['lines'],
+    '.quiver': ['arrows'],
+    '.radar_chart': ['Radar'],
+    '.scatterutils': ['scatter_rotation', 'rotate_markers', 'arrowhead_marker'],
+    '.text': ['CurvedText', 'text_collection'],
+    '.utils': ['add_image', 'validate_ax', 'inset_axes', 'set_visible', 'FontManager',
+               'set_labels', 'get_aspect', 'copy_doc', 'inset_image', 'inset_images',
+               'ImageCache'],
+    '.bumpy_chart': ['Bumpy'],
+    '.py_pizza': ['PyPizza'],
+    '.canvas': ['PitchCanvas'],
+    '.batch': ['BatchResult', 'render_batch'],
+    '.density': ['DensityImage', 'scatter_density'],
+    '.heatmap_render': ['heatmap_image', 'heatmap_png'],
+}
+_LAZY_NAMES = {name: submodule for submodule, names in _SUBMODULE_NAMES.items()
+               for name in names}
+
+__all__ = (['__version__', '_grid_dimensions', '_draw_grid', 'grid', 'grid_dimensions'] +
+           list(_LAZY_NAMES))
+
+_SUBMODULES = {submodule.split('.')[1] for submodule in _SUBMODULE_NAMES} | {'grid'}
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+        # cache the value so __getattr__ is only called once per name
+        globals()[name] = value
+        return value
+    if not name.startswith('__'):
+        # submodules, e.g. mplsoccer.utils
+        try:
+            return importlib.import_module(f'.{name}', __name__)
+        except ModuleNotFoundError as err:
+            if err.name != f'{__name__}.{name}':
+                raise
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(__all__) | _SUBMODULES)
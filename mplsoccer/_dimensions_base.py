@@ -1,6 +1,6 @@
 """ Base pitch dimensions common to many sports."""
 
-from dataclasses import dataclass, KW_ONLY
+from dataclasses import dataclass, FrozenInstanceError, KW_ONLY
 from typing import Optional
 
 import numpy as np
@@ -31,6 +31,24 @@ class BaseDims:
     pitch_extent: Optional[np.array] = None
     standardized_extent: Optional[np.array] = None
 
+    # set by freeze, not a dataclass field
+    _frozen = False
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise FrozenInstanceError(f'cannot assign to {name!r}: the pitch dimensions are '
+                                      'read-only as they are shared between pitches. '
+                                      'Use dataclasses.replace to create a modified copy.')
+        super().__setattr__(name, value)
+
+    def freeze(self):
+        """ Make the dimensions (including the NumPy arrays) read-only, so they can be
+        safely shared between pitches."""
+        for value in vars(self).values():
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+        object.__setattr__(self, '_frozen', True)
+
     @staticmethod
     def intersection_arc(diameter_length, diameter_width, center_x, center_y, line_x):
         radius_length = diameter_length / 2
@@ -0,0 +1,99 @@
+""" Helper functions for coordinates on a fixed lattice, e.g. the integer or one decimal place
+coordinates of the 0-100 'opta' and 'wyscout' pitches.
+
+A function of the coordinates (e.g. standardizing them or finding their bin) is calculated
+once for each lattice point and then looked up by indexing a table. The lattice points are
+calculated in the same way as parsing the coordinates (e.g. 3 / 10 is the same float as 0.3),
+so the lookup gives the same result as calculating the function for each coordinate.
+Coordinates that are not lattice points (e.g. NaN) are calculated with the function.
+The table is not used if it would have more points than there are coordinates or more
+than a fixed maximum, e.g. for a fine lattice on the 'tracab' centimeter pitch.
+"""
+
+import numpy as np
+
+__all__ = ['lattice_scale', 'lattice_map']
+
+# the number of points per unit tried by lattice='auto': integers, one and two decimal places
+_AUTO_SCALES = (1, 10, 100)
+_AUTO_SAMPLE = 10_000
+# the maximum number of lattice points in a table
+_MAX_TABLE = 100_000
+
+
+def lattice_scale(values, lattice):
+    """ The number of lattice points per unit (the reciprocal of the lattice spacing).
+
+    Parameters
+    ----------
+    values : array-like
+        The coordinates.
+    lattice : float or 'auto'
+        The spacing of the lattice, e.g. 1 for integer coordinates or 0.1 for coordinates with
+        one decimal place. If 'auto', the spacing is detected from a sample of the values.
+
+    Returns
+    -------
+    scale : float or None
+        The number of lattice points per unit or None if lattice='auto' and the values
+        are not integers or have more than two decimal places.
+    """
+    if isinstance(lattice, str):
+        if lattice != 'auto':
+            raise TypeError("Invalid argument: lattice should be a number or 'auto'.")
+        sample = np.ravel(values)[:_AUTO_SAMPLE]
+        if sample.dtype.kind in 'iu':
+            return 1
+        sample = sample[np.isfinite(sample)]
+        for scale in _AUTO_SCALES:
+            if np.array_equal(np.rint(sample * scale) / scale, sample):
+                return scale
+        return None
+    if lattice <= 0:
+        raise ValueError('lattice must be a positive spacing.')
+    scale = 1 / lattice
+    # e.g. a spacing of 0.1 is exactly 10 points per unit
+    return round(scale) if np.isclose(scale, round(scale)) else scale
+
+
+def lattice_map(values, function, low, high, scale):
+    """ Calculate function(values) by looking up a table of the function at the
+    lattice points between low and high. If the table would have more points than the
+    values (or more than _MAX_TABLE), the function is calculated directly instead.
+
+    Parameters
+    ----------
+    values : array-like
+        The coordinates.
+    function : callable
+        A function of an array of coordinates, returning an array with the same shape.
+    low, high : float
+        The range of the lattice points in the table.
+    scale : float
+        The number of lattice points per unit, e.g. from lattice_scale.
+
+    Returns
+    -------
+    result : numpy.ndarray
+    """
+    values = np.asarray(values)
+    start = np.ceil(low * scale)
+    stop = np.floor(high * scale) + 1
+    # a table larger than the values would be slower than calculating the function directly
+    if values.ndim == 0 or not 0 < stop - start <= min(values.size, _MAX_TABLE):
+        return np.asarray(function(values))
+    start = int(start)
+    points = np.arange(start, int(stop)) / scale
+    table = np.asarray(function(points))
+    # the nearest lattice point (fmin/ fmax set NaN to the first point)
+    index = np.rint(values * scale)
+    index -= start
+    np.fmax(index, 0, out=index)
+    np.fmin(index, points.size - 1, out=index)
+    index = index.astype(np.intp)
+    result = table[index]
+    # the values that are not lattice points, e.g. NaN or outside the table
+    other = points[index] != values
+    if other.any():
+        result[other] = function(values[other])
+    return result
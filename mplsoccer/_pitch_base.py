@@ -4,24 +4,33 @@ import warnings
 from abc import ABC, abstractmethod
 
 import numpy as np
-import seaborn as sns
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib import rcParams
-from matplotlib.collections import PatchCollection
+from matplotlib import cbook, rcParams
+from matplotlib.animation import FuncAnimation, writers as animation_writers
+from matplotlib.collections import PatchCollection, PathCollection, PolyCollection
 from matplotlib.transforms import Affine2D
-from scipy.spatial import Voronoi, ConvexHull
-from scipy.stats import circmean
 
 from .heatmap import (bin_statistic, bin_statistic_sonar, sonar, heatmap,
                       bin_statistic_zones, zone_statistic_from_binnumber, heatmap_zones,
                       bin_statistic_sonar_zones, zone_sonar_from_binnumber, _sonar,
-                      mirror_zones)
+                      mirror_zones, flow_statistic)
+from .density import scatter_density
+from .heatmap_render import heatmap_image, heatmap_png
+from .animation import _TrackingArtists, _frame_range, _save_animation, _validate_tracking
 from .linecollection import lines
 from .quiver import arrows
 from .scatterutils import scatter_rotation
-from .utils import validate_ax, copy_doc, set_visible, inset_axes, inset_image
+from .text import text_collection, _FONT_KWARGS
+from .utils import validate_ax, copy_doc, set_visible, inset_axes, inset_image, inset_images
 from .grid import _grid_dimensions, _draw_grid, grid_dimensions
+from ._shared_artists import _SharedArtists
+
+# the number of records kept in BasePitch.rasterized_layers
+_MAX_RASTERIZED_LAYERS = 100
+# the keyword arguments of text_collection that are not passed on to the PathCollection
+_COLLECTION_TEXT_KWARGS = {*_FONT_KWARGS, 'color', 'c', 'fontproperties', 'font_properties',
+                           'font'}
 
 
 class BasePitch(ABC):
@@ -37,6 +46,7 @@ class BasePitch(ABC):
                  shade_middle=False, shade_color='#f2f2f2', shade_alpha=1, shade_zorder=0.7,
                  pitch_length=None, pitch_width=None,
                  axis=False, label=False, tick=False,
+                 rasterize_threshold=None,
                  ):
         """ Initilize attributes common to all sport."""
         self.dim = dim
@@ -65,6 +75,13 @@ class BasePitch(ABC):
         self.axis = axis
         self.label = label
         self.tick = tick
+        self.rasterize_threshold = rasterize_threshold
+        # a record of the data layers rasterized because of the rasterize_threshold
+        self.rasterized_layers = []
+        if rasterize_threshold is not None and (isinstance(rasterize_threshold, bool) or
+                                                not isinstance(rasterize_threshold,
+                                                               (int, np.integer))):
+            raise TypeError("Invalid argument: 'rasterize_threshold' should be an int or None.")
 
         # completed by the each Sport's base class
         self.goal_right = None
@@ -107,12 +124,30 @@ class BasePitch(ABC):
         # validate the padding
         self._validate_pad()
 
+    def _rasterize_layer(self, layer, artists, n_elements, kwargs):
+        """ Rasterize the data layer if it has more elements than the rasterize_threshold.
+
+        The layer is left alone if the rasterized keyword was given explicitly.
+        Each rasterized layer is recorded in rasterized_layers as a dictionary
+        with the keys 'layer' (the method name) and 'elements'. The artists are not kept,
+        so a pitch reused for many figures does not keep the old figures alive, and only
+        the most recent records are kept.
+        """
+        if (self.rasterize_threshold is None or 'rasterized' in kwargs or
+                n_elements <= self.rasterize_threshold):
+            return artists
+        for artist in (artists if isinstance(artists, (tuple, list)) else [artists]):
+            artist.set_rasterized(True)
+        self.rasterized_layers.append({'layer': layer, 'elements': int(n_elements)})
+        del self.rasterized_layers[:-_MAX_RASTERIZED_LAYERS]
+        return artists
+
     @staticmethod
     def _to_ax_coord(ax, coord_system, point):
         return coord_system.inverted().transform(ax.transData.transform_point(point))
 
     def draw(self, ax=None, figsize=None, nrows=1, ncols=1,
-             tight_layout=True, constrained_layout=False):
+             tight_layout=True, constrained_layout=False, shared_markings=False):
         """ Draws the specified soccer/ football pitch(es).
         If an ax is specified the pitch is drawn on an existing axis.
 
@@ -129,6 +164,12 @@ class BasePitch(ABC):
             Whether to use Matplotlib's tight layout.
         constrained_layout : bool, default False
             Whether to use Matplotlib's constrained layout.
+        shared_markings : bool, default False
+            Whether to create the pitch markings once and share them between the axes
+            when there are multiple pitches (nrows or ncols > 1). The pitch is drawn on the
+            first axes and the other axes draw the same marking artists in their own box,
+            so there are far fewer artists to create. The other axes only contain a few
+            shared artists and the data, and all the pitch methods work as usual.
 
         Returns
         -------
@@ -157,8 +198,11 @@ class BasePitch(ABC):
         if ax is None:
             fig, axs = self._setup_subplots(nrows, ncols, figsize, constrained_layout)
             fig.set_layout_engine('tight' if tight_layout else 'none')
-            for axis in axs.flat:
-                self._draw_ax(axis)
+            if shared_markings:
+                self._draw_shared(axs)
+            else:
+                for axis in axs.flat:
+                    self._draw_ax(axis)
             if axs.size == 1:
                 axs = axs.item()
             return fig, axs
@@ -166,6 +210,22 @@ class BasePitch(ABC):
         self._draw_ax(ax)
         return None
 
+    def _draw_shared(self, axs):
+        """ Draw the pitch on the first axes and share the pitch artists with the other axes."""
+        axs = list(np.ravel(axs))
+        template = axs[0]
+        before = set(template.get_children())
+        self._draw_ax(template)
+        artists = [artist for artist in template.get_children() if artist not in before]
+        zorders = sorted({artist.get_zorder() for artist in artists})
+        for ax in axs[1:]:
+            self._set_axes(ax)
+            ax.set_facecolor(template.get_facecolor())
+            for zorder in zorders:
+                ax.add_artist(_SharedArtists([artist for artist in artists
+                                              if artist.get_zorder() == zorder],
+                                             template, zorder))
+
     @staticmethod
     def _setup_subplots(nrows, ncols, figsize, constrained_layout):
         fig, axs = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize,
@@ -270,9 +330,55 @@ class BasePitch(ABC):
         return inset_image(x=x, y=y, image=image, width=width, height=height,
                            vertical=self.vertical, ax=ax, **kwargs)
 
+    def inset_images(self, x, y, images, width=None, height=None, dpi=None, cache=None, ax=None,
+                     **kwargs):
+        """ Adds many images centered on the x/y coordinates without creating an axes per image.
+
+        Each image is drawn as a matplotlib.image.AxesImage on the axes with an extent
+        in data coordinates, and is downsampled to its on-screen size with an ImageCache.
+        This is much faster than inset_image for many images, e.g. club badges.
+
+        Parameters
+        ----------
+        x, y: array-like or float
+            The x/y coordinates of the centers of the images.
+        images : sequence of images or an image
+            The images as file paths, URLs, arrays or PIL images. Either an image for each
+            coordinate or a single image used for all the coordinates.
+        width, height: float, default None
+            The width or height of the images in the data coordinates. Give only one of these
+            and the other is calculated from the aspect ratio of each image.
+        dpi : float, default None
+            The resolution to downsample the images for. If None, uses the figure dpi.
+            Set this to the dpi used in savefig if it is higher than the figure dpi.
+        cache : mplsoccer.ImageCache, default None
+            The cache for the decoded and resized images. If None, a module-level cache is used.
+            Unless the cache has cache_arrays=True, in-memory images are only cached for
+            this call.
+        ax : matplotlib.axes.Axes, default None
+            The axis to plot on.
+        **kwargs : All other keyword arguments are passed on to matplotlib.image.AxesImage,
+            e.g. alpha, zorder and interpolation.
+
+        Returns
+        -------
+        list of matplotlib.image.AxesImage
+
+        Examples
+        --------
+        >>> from mplsoccer import VerticalPitch
+        >>> import numpy as np
+        >>> pitch = VerticalPitch()
+        >>> fig, ax = pitch.draw()
+        >>> badge = np.random.randint(0, 255, size=(1024, 1024, 4), dtype=np.uint8)
+        >>> images = pitch.inset_images([20, 60, 100], [40, 40, 40], badge, width=10, ax=ax)
+        """
+        return inset_images(x=x, y=y, images=images, width=width, height=height,
+                            vertical=self.vertical, dpi=dpi, cache=cache, ax=ax, **kwargs)
+
     def grid(self, figheight=9, nrows=1, ncols=1, grid_height=0.715, grid_width=0.95, space=0.05,
              left=None, bottom=None, endnote_height=0.065, endnote_space=0.01,
-             title_height=0.15, title_space=0.01, axis=True):
+             title_height=0.15, title_space=0.01, axis=True, shared_markings=False):
         """ A helper to create a grid of pitches in a specified location
 
         Parameters
@@ -316,6 +422,11 @@ class BasePitch(ABC):
             If title_height=0, then the title_space is set to zero.
         axis : bool, default True
             Whether the endnote and title axes are 'on'.
+        shared_markings : bool, default False
+            Whether to create the pitch markings once and share them between the pitches.
+            The pitch is drawn on the first pitch axes and the other pitch axes draw the
+            same marking artists in their own box, which is much faster for small multiples.
+            All the pitch methods (e.g. bin_statistic and heatmap) work as usual on each axes.
 
         Returns
         -------
@@ -342,11 +453,11 @@ class BasePitch(ABC):
         fig, axs = _draw_grid(dimensions=dim, left_pad=left_pad, right_pad=right_pad,
                               axis=axis, grid_key='pitch')
 
-        if endnote_height > 0 or title_height > 0:
-            for ax in np.asarray(axs['pitch']).flat:
-                self.draw(ax=ax)
+        pitch_axs = axs['pitch'] if endnote_height > 0 or title_height > 0 else axs
+        if shared_markings:
+            self._draw_shared(pitch_axs)
         else:
-            for ax in np.asarray(axs).flat:
+            for ax in np.asarray(pitch_axs).flat:
                 self.draw(ax=ax)
 
         return fig, axs
@@ -623,7 +734,7 @@ class BasePitch(ABC):
 
         return fig, axs
 
-    def flip_side(self, x, y, flip):
+    def flip_side(self, x, y, flip, dtype=None):
         """ A method to flip the coordinates to the other side of the pitch.
 
         Parameters
@@ -632,6 +743,10 @@ class BasePitch(ABC):
             The x, y coordinates that you want to flip.
         flip : array-like of boolean or boolean
             Whether to flip each individual coordinate.
+        dtype : numpy dtype, default None
+            The dtype of the flipped coordinates, e.g. numpy.float32 to halve the memory.
+            Coordinates that are already this dtype are not converted.
+            If None, the dtype of x and y is used.
 
         Returns
         -------
@@ -643,8 +758,8 @@ class BasePitch(ABC):
         >>> pitch = Pitch()
         >>> new_x, new_y = pitch.flip_side(20, 20, True)
         """
-        x = np.ravel(x)
-        y = np.ravel(y)
+        x = np.ravel(np.asarray(x, dtype=dtype))
+        y = np.ravel(np.asarray(y, dtype=dtype))
         flip = np.ravel(flip)
         if x.size != y.size:
             raise ValueError("x and y must be the same size")
@@ -735,9 +850,19 @@ class BasePitch(ABC):
             marker = rcParams['scatter.marker']
 
         if rotation_degrees is not None:
-            return scatter_rotation(x, y, rotation_degrees, marker=marker,
-                                    vertical=self.vertical, ax=ax, **kwargs)
-        return ax.scatter(x, y, marker=marker, **kwargs)
+            scatter = scatter_rotation(x, y, rotation_degrees, marker=marker,
+                                       vertical=self.vertical, ax=ax, **kwargs)
+        else:
+            scatter = ax.scatter(x, y, marker=marker, **kwargs)
+        return self._rasterize_layer('scatter', scatter, x.size, kwargs)
+
+    @copy_doc(scatter_density)
+    def scatter_density(self, x, y, ax=None, categories=None, colors=None, pixel_size=1,
+                        min_alpha=0.25, **kwargs):
+        validate_ax(ax)
+        return scatter_density(x, y, ax=ax, vertical=self.vertical, categories=categories,
+                               colors=colors, pixel_size=pixel_size, min_alpha=min_alpha,
+                               **kwargs)
 
     def _reflect_2d(self, x, y, standardized=False):
         """ Reflect data in the pitch lines."""
@@ -787,7 +912,16 @@ class BasePitch(ABC):
 
         x, y = self._reverse_if_vertical(x, y)
 
-        return sns.kdeplot(x=x, y=y, ax=ax, clip=self.kde_clip, **kwargs)
+        # seaborn is slow to import, so it is imported when first used
+        import seaborn as sns
+        collections = list(ax.collections)
+        result = sns.kdeplot(x=x, y=y, ax=ax, clip=self.kde_clip, **kwargs)
+        # the contour vertices added by seaborn
+        contours = [collection for collection in ax.collections if collection not in collections]
+        n_vertices = sum(len(path.vertices) for contour in contours
+                         for path in contour.get_paths())
+        self._rasterize_layer('kdeplot', contours, n_vertices, kwargs)
+        return result
 
     def hexbin(self, x, y, ax=None, **kwargs):
         """ Utility wrapper around matplotlib.axes.Axes.hexbin,
@@ -844,9 +978,9 @@ class BasePitch(ABC):
                                   fill=False)
         ax.add_patch(rect)
         hexbin.set_clip_path(rect)
-        return hexbin
+        return self._rasterize_layer('hexbin', hexbin, len(hexbin.get_offsets()), kwargs)
 
-    def polygon(self, verts, ax=None, **kwargs):
+    def polygon(self, verts, ax=None, collection=False, **kwargs):
         """ Plot polygons.
         Automatically flips the x and y vertices if the pitch is vertical.
 
@@ -856,12 +990,21 @@ class BasePitch(ABC):
             where verts_i is a numpy array of shape (number of vertices, 2).
         ax : matplotlib.axes.Axes, default None
             The axis to plot on.
+        collection : bool, default False
+            Whether to plot the polygons as a single matplotlib.collections.PolyCollection,
+            which is much faster to draw for many polygons (e.g. shot angles or Voronoi regions).
+            The collection supports a color per polygon (e.g. facecolor=['red', 'blue']),
+            or colormapping with array=values and cmap. The vertices stay in pitch coordinates
+            (the collection is flipped with a transform for vertical pitches), so they can be
+            updated in place with PolyCollection.set_verts, e.g. for animations.
         **kwargs : All other keyword arguments are passed on to
-            matplotlib.patches.Polygon
+            matplotlib.patches.Polygon or matplotlib.collections.PolyCollection
+            if collection=True.
 
         Returns
         -------
         list of matplotlib.patches.Polygon
+            or matplotlib.collections.PolyCollection if collection=True.
 
         Examples
         --------
@@ -873,8 +1016,32 @@ class BasePitch(ABC):
         >>> shape2 = np.array([[70, 70], [60, 50], [40, 40]])
         >>> verts = [shape1, shape2]
         >>> pitch.polygon(verts, color='red', alpha=0.3, ax=ax)
+
+        >>> from mplsoccer import Pitch
+        >>> import numpy as np
+        >>> pitch = Pitch()
+        >>> fig, ax = pitch.draw()
+        >>> x = np.random.uniform(0, 120, 22)
+        >>> y = np.random.uniform(0, 80, 22)
+        >>> team1, team2 = pitch.voronoi(x, y, np.repeat([0, 1], 11))
+        >>> pc = pitch.polygon(list(team1), collection=True, array=np.arange(len(team1)),
+        ...                    cmap='viridis', alpha=0.5, ax=ax)
+        >>> x = np.random.uniform(0, 120, 22)
+        >>> y = np.random.uniform(0, 80, 22)
+        >>> team1, team2 = pitch.voronoi(x, y, np.repeat([0, 1], 11))
+        >>> pc.set_verts(list(team1))
         """
         validate_ax(ax)
+        if collection:
+            poly_collection = PolyCollection([np.asarray(vert) for vert in verts],
+                                             closed=True, **kwargs)
+            if self.vertical:
+                # the polygons are authored in pitch coordinates; swap the x and y
+                # coordinates of the whole collection with an affine transform
+                swap = Affine2D(np.array([[0., 1., 0.], [1., 0., 0.], [0., 0., 1.]]))
+                poly_collection.set_transform(swap + ax.transData)
+            ax.add_collection(poly_collection)
+            return poly_collection
         patch_list = []
         for vert in verts:
             vert = np.asarray(vert)
@@ -884,7 +1051,7 @@ class BasePitch(ABC):
             ax.add_patch(polygon)
         return patch_list
 
-    def goal_angle(self, x, y, ax=None, goal='right', **kwargs):
+    def goal_angle(self, x, y, ax=None, goal='right', collection=False, **kwargs):
         """ Plot a polygon with the angle to the goal using matplotlib.patches.Polygon.
         See: https://matplotlib.org/stable/api/collections_api.html.
         Valid Collection keyword arguments: edgecolors, facecolors, linewidths, antialiaseds,
@@ -898,12 +1065,17 @@ class BasePitch(ABC):
             The goal to plot, either 'left' or 'right'.
         ax : matplotlib.axes.Axes, default None
             The axis to plot on.
+        collection : bool, default False
+            Whether to plot the angles as a single matplotlib.collections.PolyCollection,
+            which is much faster for many shots. See the polygon method.
         **kwargs : All other keyword arguments are passed on to
-             matplotlib.collections.PathCollection.
+             matplotlib.patches.Polygon or matplotlib.collections.PolyCollection
+             if collection=True.
 
         Returns
         -------
-        Polygon : matplotlib.patches.Polygon
+        list of matplotlib.patches.Polygon
+            or matplotlib.collections.PolyCollection if collection=True.
 
         Examples
         --------
@@ -925,7 +1097,7 @@ class BasePitch(ABC):
         verts[:, 0, 0] = x
         verts[:, 0, 1] = y
         verts[:, 1:, :] = np.expand_dims(goal_coordinates, 0)
-        return self.polygon(verts, ax=ax, **kwargs)
+        return self.polygon(verts, ax=ax, collection=collection, **kwargs)
 
     def annotate(self, text, xy, xytext=None, ax=None, **kwargs):
         """ Utility wrapper around ax.annotate
@@ -997,18 +1169,22 @@ class BasePitch(ABC):
 
     @copy_doc(bin_statistic)
     def bin_statistic(self, x, y, values=None, statistic='count', bins=(5, 4),
-                      normalize=False, standardized=False):
+                      normalize=False, standardized=False, standardizer=None,
+                      binnumber_dtype=None, lattice=None):
         return bin_statistic(x, y, values=values, dim=self.dim, statistic=statistic,
-                             bins=bins, normalize=normalize, standardized=standardized)
+                             bins=bins, normalize=normalize, standardized=standardized,
+                             standardizer=standardizer, binnumber_dtype=binnumber_dtype,
+                             lattice=lattice)
 
     @copy_doc(bin_statistic_sonar)
     def bin_statistic_sonar(self, x, y, angle, values=None,
                             statistic='count', bins=(5, 4, 10),
-                            normalize=False, standardized=False, center=True):
+                            normalize=False, standardized=False, center=True,
+                            binnumber_dtype=None):
         return bin_statistic_sonar(x, y, angle, values=values, dim=self.dim,
                                    statistic=statistic, bins=bins,
                                    normalize=normalize, standardized=standardized,
-                                   center=center)
+                                   center=center, binnumber_dtype=binnumber_dtype)
 
     @staticmethod
     @copy_doc(sonar)
@@ -1285,14 +1461,31 @@ class BasePitch(ABC):
 
     @copy_doc(heatmap)
     def heatmap(self, stats, ax=None, **kwargs):
-        return heatmap(stats, ax=ax, vertical=self.vertical, **kwargs)
+        mesh = heatmap(stats, ax=ax, vertical=self.vertical, **kwargs)
+        return self._rasterize_layer('heatmap', mesh, np.size(stats['statistic']), kwargs)
+
+    @copy_doc(heatmap_image)
+    def heatmap_image(self, stats, width=200, height=None, cmap=None, vmin=None, vmax=None,
+                      norm=None, alpha=1, background=True, markings=True):
+        return heatmap_image(stats, self, width=width, height=height, cmap=cmap, vmin=vmin,
+                             vmax=vmax, norm=norm, alpha=alpha, background=background,
+                             markings=markings)
+
+    @copy_doc(heatmap_png)
+    def heatmap_png(self, stats, width=200, height=None, cmap=None, vmin=None, vmax=None,
+                    norm=None, alpha=1, background=True, markings=True, compress_level=6):
+        return heatmap_png(stats, self, width=width, height=height, cmap=cmap, vmin=vmin,
+                           vmax=vmax, norm=norm, alpha=alpha, background=background,
+                           markings=markings, compress_level=compress_level)
 
     @copy_doc(bin_statistic_zones)
     def bin_statistic_zones(self, x, y, zones, values=None, statistic='count',
-                            normalize=False, standardized=False, names=None, edge_tol=None):
+                            normalize=False, standardized=False, names=None, edge_tol=None,
+                            standardizer=None, binnumber_dtype=None):
         return bin_statistic_zones(x, y, zones, dim=self.dim, values=values,
                                    statistic=statistic, normalize=normalize,
-                                   standardized=standardized, names=names, edge_tol=edge_tol)
+                                   standardized=standardized, names=names, edge_tol=edge_tol,
+                                   standardizer=standardizer, binnumber_dtype=binnumber_dtype)
 
     @staticmethod
     @copy_doc(zone_statistic_from_binnumber)
@@ -1307,11 +1500,12 @@ class BasePitch(ABC):
     def bin_statistic_sonar_zones(self, x, y, angle, zones, values=None,
                                   statistic='count', angle_bins=10, normalize=False,
                                   standardized=False, names=None, edge_tol=None,
-                                  center=True):
+                                  center=True, binnumber_dtype=None):
         return bin_statistic_sonar_zones(x, y, angle, zones, dim=self.dim, values=values,
                                          statistic=statistic, angle_bins=angle_bins,
                                          normalize=normalize, standardized=standardized,
-                                         names=names, edge_tol=edge_tol, center=center)
+                                         names=names, edge_tol=edge_tol, center=center,
+                                         binnumber_dtype=binnumber_dtype)
 
     @staticmethod
     @copy_doc(zone_sonar_from_binnumber)
@@ -1420,7 +1614,7 @@ class BasePitch(ABC):
         return mirror_zones(zones, dim=self.dim, names=names, axis=axis, suffixes=suffixes)
 
     def label_heatmap(self, stats, str_format=None, exclude_zeros=False, exclude_nan=False,
-                      xoffset=0, yoffset=0, ax=None, **kwargs):
+                      xoffset=0, yoffset=0, ax=None, collection=False, **kwargs):
         """ Labels the heatmap(s) and automatically flips the coordinates if the pitch is vertical.
 
         The labels are clipped to the axes, so labels for hidden parts of the
@@ -1441,12 +1635,20 @@ class BasePitch(ABC):
             The amount in data coordinates to offset the labels from the center of the grid cell.
         ax : matplotlib.axes.Axes, default None
             The axis to plot on.
+        collection : bool, default False
+            Whether to draw all the labels as a single matplotlib.collections.PathCollection
+            via mplsoccer.text.text_collection, which is much faster for many labels.
+            The glyphs are laid out once per unique label. If the labels need features
+            only a matplotlib.text.Text supports (path_effects, bbox, rotation, picker or
+            math text), a list of Text is returned instead.
 
-        **kwargs : All other keyword arguments are passed on to matplotlib.text.Text.
+        **kwargs : All other keyword arguments are passed on to matplotlib.text.Text
+            (or mplsoccer.text.text_collection if collection=True).
 
         Returns
         -------
-        text : A list of matplotlib.text.Text.
+        text : A list of matplotlib.text.Text,
+            or a matplotlib.collections.PathCollection if collection=True.
 
         Examples
         --------
@@ -1464,8 +1666,8 @@ class BasePitch(ABC):
         ...                            va='center', path_effects=path_eff, str_format='{:.0f}')
         """
         validate_ax(ax)
-        va = kwargs.pop('va', 'center')
-        ha = kwargs.pop('ha', 'center')
+        va = kwargs.pop('va', kwargs.pop('verticalalignment', 'center'))
+        ha = kwargs.pop('ha', kwargs.pop('horizontalalignment', 'center'))
         # clip labels to the axes so they do not draw outside the pitch
         # when parts of the pitch are hidden (e.g. negative pads or a half pitch)
         clip_on = kwargs.pop('clip_on', True)
@@ -1473,7 +1675,7 @@ class BasePitch(ABC):
         if not isinstance(stats, list):
             stats = [stats]
 
-        annotation_list = []
+        labels = []
         for bin_stat in stats:
             # remove labels outside the plot extents
             mask_x_outside1 = bin_stat['cx'] < self.dim.pitch_extent[0]
@@ -1493,26 +1695,57 @@ class BasePitch(ABC):
             for idx, text_str in enumerate(text):
                 if str_format is not None:
                     text_str = str_format.format(text_str)
-                annotation = self.text(cx[idx], cy[idx], text_str, ax=ax,
-                                       va=va, ha=ha, clip_on=clip_on, **kwargs)
-                annotation_list.append(annotation)
+                labels.append((cx[idx], cy[idx], text_str))
+
+        if collection and self._label_collection_supported(labels, ha, va, kwargs):
+            cx, cy, text = zip(*labels) if labels else ([], [], [])
+            return text_collection(cx, cy, [str(text_str) for text_str in text], ax=ax,
+                                   vertical=self.vertical, ha=ha, va=va, clip_on=clip_on,
+                                   **kwargs)
+
+        annotation_list = []
+        for x, y, text_str in labels:
+            annotation = self.text(x, y, text_str, ax=ax, va=va, ha=ha, clip_on=clip_on, **kwargs)
+            annotation_list.append(annotation)
 
         return annotation_list
 
+    @staticmethod
+    def _label_collection_supported(labels, ha, va, kwargs):
+        """ Whether the labels can be drawn with text_collection rather than Text."""
+        # these are accepted by a PathCollection, but apply to each label of a Text
+        text_only = ['path_effects', 'picker', 'url']
+        if any(kwargs.get(key) is not None for key in text_only):
+            return False
+        # other keywords must be font keywords or accepted by the PathCollection,
+        # e.g. multialignment, bbox and rotation need a Text per label
+        if not all(key in _COLLECTION_TEXT_KWARGS or hasattr(PathCollection, f'set_{key}')
+                   for key in kwargs):
+            return False
+        if ha not in ['center', 'left', 'right'] or va not in ['center', 'top', 'bottom',
+                                                               'baseline']:
+            return False
+        return not any(cbook.is_math_text(str(text_str)) or '\n' in str(text_str)
+                       for _, _, text_str in labels)
+
     @copy_doc(arrows)
     def arrows(self, xstart, ystart, xend, yend, *args, ax=None, **kwargs):
         validate_ax(ax)
-        return arrows(xstart, ystart, xend, yend, *args, ax=ax, vertical=self.vertical, **kwargs)
+        quiver = arrows(xstart, ystart, xend, yend, *args, ax=ax, vertical=self.vertical,
+                        **kwargs)
+        return self._rasterize_layer('arrows', quiver, quiver.N, kwargs)
 
     @copy_doc(lines)
     def lines(self, xstart, ystart, xend, yend, color=None, n_segments=100,
               comet=False, transparent=False, alpha_start=0.01,
               alpha_end=1, cmap=None, ax=None, **kwargs):
         validate_ax(ax)
-        return lines(xstart, ystart, xend, yend, color=color, n_segments=n_segments,
-                     comet=comet, transparent=transparent, alpha_start=alpha_start,
-                     alpha_end=alpha_end, cmap=cmap, ax=ax, vertical=self.vertical,
-                     reverse_cmap=self.reverse_cmap, **kwargs)
+        line_collection = lines(xstart, ystart, xend, yend, color=color, n_segments=n_segments,
+                                comet=comet, transparent=transparent, alpha_start=alpha_start,
+                                alpha_end=alpha_end, cmap=cmap, ax=ax, vertical=self.vertical,
+                                reverse_cmap=self.reverse_cmap, **kwargs)
+        return self._rasterize_layer('lines', line_collection,
+                                     len(line_collection.get_segments()), kwargs)
 
     def convexhull(self, x, y):
         """ Get lines of Convex Hull for a set of coordinates
@@ -1537,6 +1770,7 @@ class BasePitch(ABC):
         >>> hull = pitch.convexhull(x, y)
         >>> poly = pitch.polygon(hull, ax=ax, facecolor='cornflowerblue', alpha=0.3)
         """
+        from scipy.spatial import ConvexHull
         points = np.vstack([x, y]).T
         hull = ConvexHull(points)
         return points[hull.vertices].reshape(1, -1, 2)
@@ -1611,6 +1845,7 @@ class BasePitch(ABC):
         reflect = np.vstack([reflect_x, reflect_y]).T
 
         # create Voronoi
+        from scipy.spatial import Voronoi
         vor = Voronoi(reflect)
 
         # get region vertices
@@ -1635,7 +1870,8 @@ class BasePitch(ABC):
 
         return team1, team2
 
-    def calculate_angle_and_distance(self, xstart, ystart, xend, yend, degrees=False):
+    def calculate_angle_and_distance(self, xstart, ystart, xend, yend, degrees=False,
+                                     dtype=None):
         """ Calculates the angle in radians counter-clockwise and the distance
         between a start and end location. Where the angle 0 is this way →
         (the straight line from left to right) in a horizontally orientated pitch
@@ -1650,6 +1886,10 @@ class BasePitch(ABC):
         degrees : bool, default False
             If False, the angle is returned in radians counter-clockwise in the range [0, 2pi]
             If True, the angle is returned in degrees clockwise in the range [0, 360].
+        dtype : numpy dtype, default None
+            The dtype used for the calculation and the results, e.g. numpy.float32 to
+            halve the memory. Coordinates that are already this dtype are not converted.
+            If None, the dtype of the coordinates is used (float64 after standardizing).
 
         Returns
         -------
@@ -1668,10 +1908,10 @@ class BasePitch(ABC):
         >>> pitch.calculate_angle_and_distance(0, 40, 30, 20, degrees=True)
         (array([326.30993247]), array([36.05551275]))
         """
-        xstart = np.ravel(xstart)
-        ystart = np.ravel(ystart)
-        xend = np.ravel(xend)
-        yend = np.ravel(yend)
+        xstart = np.ravel(np.asarray(xstart, dtype=dtype))
+        ystart = np.ravel(np.asarray(ystart, dtype=dtype))
+        xend = np.ravel(np.asarray(xend, dtype=dtype))
+        yend = np.ravel(np.asarray(yend, dtype=dtype))
         if xstart.size != ystart.size:
             raise ValueError("xstart and ystart must be the same size")
         if xstart.size != xend.size:
@@ -1680,8 +1920,8 @@ class BasePitch(ABC):
             raise ValueError("ystart and yend must be the same size")
 
         if not self.dim.aspect_equal:
-            xstart, ystart = self.standardizer.transform(xstart, ystart)
-            xend, yend = self.standardizer.transform(xend, yend)
+            xstart, ystart = self.standardizer.transform(xstart, ystart, dtype=dtype)
+            xend, yend = self.standardizer.transform(xend, yend, dtype=dtype)
             standardized = True
         else:
             standardized = False
@@ -1711,6 +1951,9 @@ class BasePitch(ABC):
         """ Create a flow map by binning the data into cells and calculating the average
         angles and distances.
 
+        This is flow_statistic followed by flow_arrows. Use them separately to reuse
+        the statistics, e.g. to draw the counts as a heatmap under the arrows.
+
         Parameters
         ----------
         xstart, ystart, xend, yend: array-like or scalar.
@@ -1766,59 +2009,145 @@ class BasePitch(ABC):
         ...                 headaxislength=2, ax=ax)
         """
         validate_ax(ax)
-        # calculate  the binned statistics
-        angle, distance = self.calculate_angle_and_distance(xstart, ystart, xend, yend)
+        stats = self.flow_statistic(xstart, ystart, xend, yend, bins=bins)
+        return self.flow_arrows(stats, arrow_type=arrow_type, arrow_length=arrow_length,
+                                color=color, ax=ax, **kwargs)
 
-        if not self.dim.aspect_equal:
-            standardized = True
-            # slightly inefficient as we also transform the data
-            # in the calculate_angle_and_distance method
-            # but I wanted to make it easier for users as this way they do not need
-            # to know whether their data needs
-            # to be transformed for calculate_angle_and_distance
-            xstart, ystart = self.standardizer.transform(xstart, ystart)
-            xend, yend = self.standardizer.transform(xend, yend)
-        else:
-            standardized = False
+    def flow_statistic(self, xstart, ystart, xend, yend, bins=(5, 4)):
+        """ Calculate the flow map statistics in a single pass: the count, mean distance
+        and circular mean angle of the movements (e.g. passes) starting in each bin.
+
+        The start locations are binned once and the statistics are calculated with
+        numpy.bincount, with the circular mean from the mean resultant vector.
+        The result can be drawn with flow_arrows and heatmap (the 'statistic' is the count).
+
+        Parameters
+        ----------
+        xstart, ystart, xend, yend: array-like or scalar.
+            Commonly, these parameters are 1D arrays.
+            These should be the start and end coordinates of the movements.
+        bins : int or [int, int] or array_like or [array, array], optional
+            The bin specification for binning the data to calculate the angles/ distances.
+              * the number of bins for the two dimensions (nx = ny = bins),
+              * the number of bins in each dimension (nx, ny = bins),
+              * the bin edges for the two dimensions (x_edge = y_edge = bins),
+              * the bin edges in each dimension (x_edge, y_edge = bins).
+                If the bin edges are specified, the number of bins will be,
+                (nx = len(x_edge)-1, ny = len(y_edge)-1).
+
+        Returns
+        -------
+        flow_statistic : dict.
+            The same keys as bin_statistic with 'statistic' the count of movements in each
+            bin, plus 'angle' (the circular mean angle in radians) and 'distance'
+            (the mean distance). The angles and distances are calculated like
+            calculate_angle_and_distance, so for pitches where the aspect is not equal
+            (e.g. 'opta') they are in the standardized coordinates (105m x 68m).
+            The grids and centers are in the pitch coordinates.
+
+        Examples
+        --------
+        >>> from mplsoccer import Pitch
+        >>> import numpy as np
+        >>> pitch = Pitch()
+        >>> xstart = np.random.uniform(low=0, high=120, size=100)
+        >>> ystart = np.random.uniform(low=0, high=80, size=100)
+        >>> xend = np.random.uniform(low=0, high=120, size=100)
+        >>> yend = np.random.uniform(low=0, high=80, size=100)
+        >>> stats = pitch.flow_statistic(xstart, ystart, xend, yend, bins=(6, 4))
+        >>> fig, ax = pitch.draw()
+        >>> hm = pitch.heatmap(stats, ax=ax, cmap='Blues')
+        >>> fm = pitch.flow_arrows(stats, color='black', ax=ax)
+        """
+        standardized = not self.dim.aspect_equal
+        if standardized:
+            xstart, ystart = self.standardizer.transform(np.ravel(xstart), np.ravel(ystart))
+            xend, yend = self.standardizer.transform(np.ravel(xend), np.ravel(yend))
+        stats = flow_statistic(xstart, ystart, xend, yend, dim=self.dim, bins=bins,
+                               standardized=standardized)
+        if standardized:
+            # convert the grids and centers back to the pitch coordinates
+            for x_key, y_key in [('x_grid', 'y_grid'), ('cx', 'cy')]:
+                shape = stats[x_key].shape
+                x, y = self.standardizer.transform(stats[x_key].ravel(), stats[y_key].ravel(),
+                                                   reverse=True)
+                stats[x_key], stats[y_key] = x.reshape(shape), y.reshape(shape)
+        return stats
+
+    def flow_arrows(self, stats, arrow_type='same', arrow_length=5, color=None, ax=None,
+                    **kwargs):
+        """ Draw the arrows of a flow map from the result of flow_statistic.
 
-        bs_distance = self.bin_statistic(xstart, ystart, values=distance,
-                                         statistic='mean', bins=bins, standardized=standardized)
-        bs_angle = self.bin_statistic(xstart, ystart, values=angle,
-                                      statistic=circmean, bins=bins, standardized=standardized)
+        Parameters
+        ----------
+        stats : dict.
+            The result of flow_statistic.
+        arrow_type : str, default 'same'
+            The supported arrow types are: 'same', 'scale', and 'average'.
+            'same' makes the arrows the same size (arrow_length).
+            'scale' scales the arrow length by the average distance
+            in the cell (up to a max of arrow_length).
+            'average' makes the arrow size the average distance in the cell.
+        arrow_length : float, default 5
+            The arrow_length for the flow map. If the arrow_type='same',
+            all the arrows will be arrow_length. If the arrow_type='scale',
+            the arrows will be scaled by the average distance.
+            If the arrow_type='average', the arrows_length is ignored
+            This is automatically multipled by 100 if using a 'tracab' pitch
+            (i.e. the default is 500).
+        color : A matplotlib color, defaults to None.
+            Defaults to None. In that case the marker color is
+            determined by the cmap (default 'viridis').
+            and the counts of the starting positions in each bin.
+        ax : matplotlib.axes.Axes, default None
+            The axis to plot on.
+        **kwargs : All other keyword arguments are passed on to matplotlib.axes.Axes.quiver.
 
+        Returns
+        -------
+        PolyCollection : matplotlib.quiver.Quiver
+        """
+        validate_ax(ax)
         # calculate the arrow length
         if self.dim.pad_multiplier != 1:
             arrow_length = arrow_length * self.dim.pad_multiplier
         if arrow_type == 'scale':
-            new_d = (bs_distance['statistic'] * arrow_length /
-                     np.nan_to_num(bs_distance['statistic']).max(initial=None))
+            new_d = (stats['distance'] * arrow_length /
+                     np.nan_to_num(stats['distance']).max(initial=None))
         elif arrow_type == 'same':
             new_d = arrow_length
         elif arrow_type == 'average':
-            new_d = bs_distance['statistic']
+            new_d = stats['distance']
         else:
             valid_arrows = ['scale', 'same', 'average']
             raise TypeError(f'Invalid argument: arrow_type should be in {valid_arrows}')
 
+        # the angles are in the standardized coordinates if the aspect is not equal
+        standardized = not self.dim.aspect_equal
+        cx, cy = stats['cx'], stats['cy']
+        if standardized:
+            shape = cx.shape
+            cx, cy = self.standardizer.transform(cx.ravel(), cy.ravel())
+            cx, cy = cx.reshape(shape), cy.reshape(shape)
+
         # calculate the end positions of the arrows
-        endx = bs_angle['cx'] + (np.cos(bs_angle['statistic']) * new_d)
+        endx = cx + (np.cos(stats['angle']) * new_d)
         if self.dim.invert_y and not standardized:
-            endy = bs_angle['cy'] - (np.sin(bs_angle['statistic']) * new_d)  # invert_y
+            endy = cy - (np.sin(stats['angle']) * new_d)  # invert_y
         else:
-            endy = bs_angle['cy'] + (np.sin(bs_angle['statistic']) * new_d)
+            endy = cy + (np.sin(stats['angle']) * new_d)
 
-        # get coordinates and convert back to the pitch coordinates if necessary
-        cx, cy = bs_angle['cx'], bs_angle['cy']
+        # convert back to the pitch coordinates if necessary
+        cx, cy = stats['cx'], stats['cy']
         if standardized:
-            cx, cy = self.standardizer.transform(cx, cy, reverse=True)
-            endx, endy = self.standardizer.transform(endx, endy, reverse=True)
+            shape = endx.shape
+            endx, endy = self.standardizer.transform(endx.ravel(), endy.ravel(), reverse=True)
+            endx, endy = endx.reshape(shape), endy.reshape(shape)
 
         # plot arrows
         if color is not None:
             return self.arrows(cx, cy, endx, endy, color=color, ax=ax, **kwargs)
-        bs_count = self.bin_statistic(xstart, ystart, statistic='count',
-                                      bins=bins, standardized=standardized)
-        return self.arrows(cx, cy, endx, endy, bs_count['statistic'], ax=ax, **kwargs)
+        return self.arrows(cx, cy, endx, endy, stats['statistic'], ax=ax, **kwargs)
 
     def triplot(self, x, y, ax=None, **kwargs):
         """ Utility wrapper around matplotlib.axes.Axes.triplot
@@ -1835,6 +2164,167 @@ class BasePitch(ABC):
         x, y = self._reverse_if_vertical(x, y)
         return ax.triplot(x, y, **kwargs)
 
+    def animate(self, frames_xy, teams=None, ball_xy=None, ax=None, start=0, stop=None, step=1,
+                interval=40, colors=None, ball_color='black', trail_length=0, overlay=None,
+                overlay_alpha=0.3, blit=True, filename=None, writer=None, fps=None, dpi=None,
+                scatter_kwargs=None, ball_kwargs=None, trail_kwargs=None):
+        """ Animate tracking data stored in dense arrays.
+
+        The artists are created once and updated in place for each frame
+        (scatter offsets, trail segments and overlay vertices). When blitting,
+        only the updated artists are redrawn over the cached pitch background.
+
+        Parameters
+        ----------
+        frames_xy : array-like of shape (n_frames, n_players, 2)
+            The player x, y coordinates for each frame. Missing players should be NaN.
+        teams : array-like of shape (n_players,), default None
+            The team of each player. Each team is plotted as a single scatter.
+            If None, all players are on the same team.
+        ball_xy : array-like of shape (n_frames, 2), default None
+            The ball x, y coordinates for each frame.
+        ax : matplotlib.axes.Axes, default None
+            The axis to plot on.
+        start, stop, step : int, default 0, None, 1
+            The frame range to animate (the same as slicing a list), e.g. step=5
+            animates every fifth frame.
+        interval : float, default 40
+            The delay between frames in milliseconds.
+        colors : sequence or dict of colors, default None
+            The colors for each team (in the sorted order of the team values),
+            or a dictionary of team: color. If None, uses rcParams['axes.prop_cycle'].
+        ball_color : any Matplotlib color, default 'black'
+        trail_length : int, default 0
+            If greater than zero, draws a trail of the previous trail_length frames
+            for each player and the ball.
+        overlay : str, default None
+            Whether to draw a 'voronoi' (requires two teams) or convex 'hull' overlay
+            for each team, which is recalculated for each frame.
+        overlay_alpha : float, default 0.3
+            The transparency of the overlay.
+        blit : bool, default True
+            Whether to use blitting in the returned FuncAnimation.
+        filename : str, default None
+            If given, the frames are written directly to the writer without
+            creating a FuncAnimation.
+        writer : str or matplotlib.animation.MovieWriter, default None
+            The writer used if a filename is given.
+            If None, uses rcParams['animation.writer'].
+        fps : float, default None
+            The frames per second for the writer. If None, uses 1000 / interval.
+        dpi : float, default None
+            The dpi for the writer. If None, uses the figure dpi.
+        scatter_kwargs, ball_kwargs, trail_kwargs : dict, default None
+            Keyword arguments passed on to the player scatters, ball scatter and
+            the trail LineCollection, e.g. dict(s=100, edgecolor='black').
+
+        Returns
+        -------
+        matplotlib.animation.FuncAnimation or None if a filename is given.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from mplsoccer import Pitch
+        >>> pitch = Pitch()
+        >>> fig, ax = pitch.draw()
+        >>> frames_xy = np.random.uniform(0, 80, size=(100, 22, 2))
+        >>> teams = np.repeat(['home', 'away'], 11)
+        >>> ball_xy = np.random.uniform(0, 80, size=(100, 2))
+        >>> anim = pitch.animate(frames_xy, teams, ball_xy, ax=ax, step=2, trail_length=10)
+        """
+        validate_ax(ax)
+        frames = _frame_range(np.shape(frames_xy)[0], start=start, stop=stop, step=step)
+        tracking = _TrackingArtists(self, ax, frames_xy, teams=teams, ball_xy=ball_xy,
+                                    colors=colors, ball_color=ball_color,
+                                    trail_length=trail_length, overlay=overlay,
+                                    overlay_alpha=overlay_alpha, scatter_kwargs=scatter_kwargs,
+                                    ball_kwargs=ball_kwargs, trail_kwargs=trail_kwargs)
+        if filename is None:
+            return FuncAnimation(ax.figure, tracking.update, frames=frames,
+                                 init_func=lambda: tracking.update(frames[0]),
+                                 interval=interval, blit=blit)
+        if writer is None:
+            writer = rcParams['animation.writer']
+        if isinstance(writer, str):
+            writer = animation_writers[writer](fps=1000 / interval if fps is None else fps)
+        with writer.saving(ax.figure, filename, dpi):
+            for frame in frames:
+                tracking.update(frame)
+                writer.grab_frame()
+        return None
+
+    def save_animation(self, frames_xy, teams=None, ball_xy=None, filename='animation.mp4',
+                       fps=25, start=0, stop=None, step=1, figsize=None, dpi=100,
+                       frame_format=None, n_jobs=None, chunk_size=None, **kwargs):
+        """ Export an animation of tracking data by rendering chunks of frames in parallel.
+
+        The frame range is split into chunks and each chunk is rendered in a separate
+        process with its own copy of the pitch, blitting the players over the cached
+        pitch background. If ffmpeg is installed, each chunk is encoded to a video
+        segment and the segments are joined without re-encoding.
+        Otherwise, the frames are written as a numbered PNG sequence.
+
+        Parameters
+        ----------
+        frames_xy : array-like of shape (n_frames, n_players, 2)
+            The player x, y coordinates for each frame. Missing players should be NaN.
+            Only the frames needed for each chunk are sent to the worker processes,
+            so this can be a numpy.memmap.
+        teams : array-like of shape (n_players,), default None
+            The team of each player. If None, all players are on the same team.
+        ball_xy : array-like of shape (n_frames, 2), default None
+            The ball x, y coordinates for each frame.
+        filename : str or pathlib.Path, default 'animation.mp4'
+            The video file name. For image sequences, the frames are written to
+            a directory with the same name without the suffix, e.g. 'animation/'.
+        fps : float, default 25
+            The frames per second of the video.
+        start, stop, step : int, default 0, None, 1
+            The frame range to export (the same as slicing a list).
+        figsize : tuple of float, default Matplotlib figure size
+            The figure size in inches by default uses rcParams["figure.figsize"].
+        dpi : float, default 100
+            The resolution of the frames in dots per inch.
+        frame_format : str, default None
+            One of 'video', 'png' or 'rgba'. 'png' writes frame_000000.png etc.
+            'rgba' writes the raw RGBA bytes for each chunk in frames_000000.rgba etc.,
+            which can be read with
+            numpy.fromfile(file, dtype=np.uint8).reshape(-1, height, width, 4)
+            with the width and height in pixels (figsize * dpi).
+            If None, uses 'video' if ffmpeg is found and 'png' otherwise.
+        n_jobs : int, default None
+            The number of processes. If None, uses os.cpu_count().
+        chunk_size : int, default None
+            The number of frames rendered in each process at a time.
+            If None, the frames are split equally between the processes.
+        **kwargs : All other keyword arguments (colors, ball_color, trail_length,
+            overlay, overlay_alpha, scatter_kwargs, ball_kwargs and trail_kwargs)
+            are the same as the animate method.
+
+        Returns
+        -------
+        str
+            The video file name or the directory of the image sequence.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from mplsoccer import Pitch
+        >>> pitch = Pitch(pitch_type='metricasports', pitch_length=105, pitch_width=68)
+        >>> frames_xy = np.random.uniform(0, 1, size=(1000, 22, 2))
+        >>> teams = np.repeat(['home', 'away'], 11)
+        >>> ball_xy = np.random.uniform(0, 1, size=(1000, 2))
+        >>> output = pitch.save_animation(frames_xy, teams, ball_xy, filename='match.mp4',
+        ...                               n_jobs=4, trail_length=10)
+        """
+        if figsize is None:
+            figsize = rcParams['figure.figsize']
+        frames = _frame_range(np.shape(frames_xy)[0], start=start, stop=stop, step=step)
+        _validate_tracking(frames_xy[:1], teams, None if ball_xy is None else ball_xy[:1])
+        return _save_animation(self, frames_xy, teams, ball_xy, filename, fps, frames,
+                               figsize, dpi, frame_format, n_jobs, chunk_size, kwargs)
+
     # The methods below for drawing/ setting attributes for some pitch elements
     # are defined in pitch.py (Pitch/ VerticalPitch classes)
     # as they differ for horizontal/ vertical pitches
@@ -0,0 +1,55 @@
+""" An artist for drawing the pitch markings of a template axes in other axes of a grid."""
+
+from matplotlib.artist import Artist
+from matplotlib.collections import Collection
+
+__all__ = ['_SharedArtists']
+
+
+class _SharedArtists(Artist):
+    """ Draws artists that belong to a template axes in another axes of the same size.
+
+    This lets a grid of pitches create the pitch markings once on the template axes.
+    Each of the other axes gets one _SharedArtists per zorder, which draws the template
+    artists mapped from the template axes box to its own axes box and clipped to its own axes,
+    so the data plotted on each axes is layered above or below the markings as usual.
+    """
+
+    def __init__(self, artists, template, zorder):
+        super().__init__()
+        self._artists = artists
+        self._template = template
+        self.set_zorder(zorder)
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        # map the template display coordinates to this axes' display coordinates
+        offset = self._template.transAxes.inverted() + self.axes.transAxes
+        for artist in self._artists:
+            if not artist.get_visible():
+                continue
+            # stop the temporary changes marking the template figure as stale
+            stale_callback = artist.stale_callback
+            artist.stale_callback = None
+            transform = Artist.get_transform(artist)
+            clip_path = artist.get_clip_path()
+            clip_box = artist.get_clip_box()
+            artist.set_transform(transform + offset)
+            if isinstance(artist, Collection):
+                offset_transform = artist.get_offset_transform()
+                artist.set_offset_transform(offset_transform + offset)
+            if clip_path is not None:
+                artist.set_clip_path(self.axes.patch)
+            if clip_box is not None:
+                artist.set_clip_box(self.axes.bbox)
+            try:
+                artist.draw(renderer)
+            finally:
+                artist.set_transform(transform)
+                if isinstance(artist, Collection):
+                    artist.set_offset_transform(offset_transform)
+                artist.set_clip_path(clip_path)
+                artist.set_clip_box(clip_box)
+                artist.stale_callback = stale_callback
+        self.stale = False
@@ -0,0 +1,283 @@
+""" A module with the artists for animating tracking data on a pitch
+and exporting the animation in parallel."""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+__all__ = []
+
+
+def _frame_range(n_frames, start=0, stop=None, step=1):
+    """ Validate the frame range and return it as a range."""
+    frames = range(n_frames)[slice(start, stop, step)]
+    if len(frames) == 0:
+        raise ValueError('Invalid argument: the frame range (start, stop, step) is empty.')
+    return frames
+
+
+def _validate_tracking(frames_xy, teams, ball_xy):
+    frames_xy = np.asarray(frames_xy)
+    if frames_xy.ndim != 3 or frames_xy.shape[2] != 2:
+        raise ValueError('frames_xy must be an array of shape (n_frames, n_players, 2)')
+    n_frames, n_players, _ = frames_xy.shape
+    teams = np.zeros(n_players, dtype=int) if teams is None else np.ravel(teams)
+    if teams.size != n_players:
+        raise ValueError('teams must be the same size as the number of players in frames_xy')
+    if ball_xy is not None:
+        ball_xy = np.asarray(ball_xy)
+        if ball_xy.shape != (n_frames, 2):
+            raise ValueError('ball_xy must be an array of shape (n_frames, 2)')
+    return frames_xy, teams, ball_xy
+
+
+class _TrackingArtists:
+    """ Pre-created artists for tracking data, which are updated in place for each frame.
+
+    The artists are created once (a scatter per team, a ball marker and optional trails
+    and voronoi/ convex hull overlays), and each frame only updates their offsets,
+    segments or vertices, so there is no per-frame artist creation or data lookups.
+    """
+
+    def __init__(self, pitch, ax, frames_xy, teams=None, ball_xy=None, colors=None,
+                 ball_color='black', trail_length=0, overlay=None, overlay_alpha=0.3,
+                 scatter_kwargs=None, ball_kwargs=None, trail_kwargs=None):
+        self.frames_xy, self.teams, self.ball_xy = _validate_tracking(frames_xy, teams, ball_xy)
+        valid_overlay = [None, 'voronoi', 'hull']
+        if overlay not in valid_overlay:
+            raise TypeError(f'Invalid argument: overlay should be in {valid_overlay}')
+        if overlay == 'voronoi' and np.unique(self.teams).size != 2:
+            raise ValueError('teams must contain two teams for the voronoi overlay')
+        self.pitch = pitch
+        self.trail_length = trail_length
+        self.overlay = overlay
+        # swap the x and y columns for vertical pitches
+        self._columns = [1, 0] if pitch.vertical else [0, 1]
+        self.team_names = np.unique(self.teams)
+        self._team_index = [np.flatnonzero(self.teams == team) for team in self.team_names]
+        if colors is None:
+            cycle = rcParams['axes.prop_cycle'].by_key()['color']
+            colors = [cycle[i % len(cycle)] for i in range(self.team_names.size)]
+        elif isinstance(colors, dict):
+            colors = [colors[team] for team in self.team_names]
+        scatter_kwargs = {} if scatter_kwargs is None else scatter_kwargs
+        ball_kwargs = {} if ball_kwargs is None else ball_kwargs
+        trail_kwargs = {} if trail_kwargs is None else trail_kwargs
+
+        frame = 0
+        self.team_scatters = [ax.scatter(*self._xy(self.frames_xy[frame, index]).T,
+                                         color=color, zorder=3, **scatter_kwargs)
+                              for index, color in zip(self._team_index, colors)]
+        self.artists = list(self.team_scatters)
+
+        self.ball = None
+        if self.ball_xy is not None:
+            self.ball = ax.scatter(*self._xy(self.ball_xy[frame: frame + 1]).T,
+                                   color=ball_color, zorder=4, **ball_kwargs)
+            self.artists.append(self.ball)
+
+        self.trails = None
+        if trail_length > 0:
+            trail_colors = [None] * self.teams.size
+            for index, color in zip(self._team_index, colors):
+                for player in index:
+                    trail_colors[player] = color
+            if self.ball_xy is not None:
+                trail_colors.append(ball_color)
+            self.trails = LineCollection(self._trail_segments(frame), colors=trail_colors,
+                                         zorder=2, **{'linewidth': 1, 'alpha': 0.5,
+                                                      **trail_kwargs})
+            ax.add_collection(self.trails, autolim=False)
+            self.artists.append(self.trails)
+
+        self.overlays = []
+        if overlay is not None:
+            for color in colors[:len(self._team_index)]:
+                self.overlays.append(pitch.polygon([], collection=True, ax=ax, facecolor=color,
+                                                   edgecolor=color, alpha=overlay_alpha,
+                                                   zorder=1))
+            self.artists.extend(self.overlays)
+            self._update_overlay(frame)
+
+    def _xy(self, xy):
+        return xy[..., self._columns]
+
+    def _trail_segments(self, frame):
+        first = max(frame - self.trail_length, 0)
+        trails = self.frames_xy[first: frame + 1]
+        if self.ball_xy is not None:
+            trails = np.concatenate([trails, self.ball_xy[first: frame + 1, np.newaxis]], axis=1)
+        # (n_players, trail_length + 1, 2), NaN positions are not drawn
+        return self._xy(trails.transpose(1, 0, 2))
+
+    def _update_overlay(self, frame):
+        xy = self.frames_xy[frame]
+        on_pitch = ~np.isnan(xy).any(axis=1)
+        if self.overlay == 'voronoi':
+            team1 = self.teams[on_pitch] == self.team_names[0]
+            if not on_pitch.any():
+                regions = ([], [])
+            else:
+                regions = self.pitch.voronoi(xy[on_pitch, 0], xy[on_pitch, 1], team1)
+            # voronoi returns team1 (True) first
+            for collection, verts in zip(self.overlays, regions):
+                collection.set_verts([vert.astype(float) for vert in verts])
+            return
+        for collection, index in zip(self.overlays, self._team_index):
+            index = index[on_pitch[index]]
+            if index.size < 3:
+                collection.set_verts([])
+                continue
+            hull = self.pitch.convexhull(xy[index, 0], xy[index, 1])
+            collection.set_verts(hull)
+
+    def update(self, frame):
+        """ Update the artists to the frame and return the updated artists."""
+        for scatter, index in zip(self.team_scatters, self._team_index):
+            scatter.set_offsets(self._xy(self.frames_xy[frame, index]))
+        if self.ball is not None:
+            self.ball.set_offsets(self._xy(self.ball_xy[frame: frame + 1]))
+        if self.trails is not None:
+            self.trails.set_segments(self._trail_segments(frame))
+        if self.overlay is not None:
+            self._update_overlay(frame)
+        return self.artists
+
+
+def _chunk_tasks(pitch, frames_xy, teams, ball_xy, frames, chunk_size, trail_length):
+    """ Split the frames into chunks, slicing only the tracking data each chunk needs."""
+    tasks = []
+    for chunk, first_position in enumerate(range(0, len(frames), chunk_size)):
+        chunk_frames = frames[first_position: first_position + chunk_size]
+        # include the previous frames for the trails
+        first = max(chunk_frames[0] - trail_length, 0)
+        last = chunk_frames[-1] + 1
+        tasks.append((pitch, chunk, first_position, chunk_frames, first,
+                      np.asarray(frames_xy[first: last]), teams,
+                      None if ball_xy is None else np.asarray(ball_xy[first: last])))
+    return tasks
+
+
+def _ffmpeg_segment(filename, width, height, fps):
+    """ Start an ffmpeg process that encodes raw RGBA frames from stdin."""
+    command = ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+               '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+               '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', str(filename)]
+    return subprocess.Popen(command, stdin=subprocess.PIPE)
+
+
+def _render_chunk(task, figsize, dpi, frame_format, directory, fps, suffix, kwargs):
+    """ Render a chunk of frames in a worker process, blitting over the pitch background."""
+    pitch, chunk, first_position, frames, offset, frames_xy, teams, ball_xy = task
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    pitch.draw(ax=ax)
+    fig.set_layout_engine('tight')
+    tracking = _TrackingArtists(pitch, ax, frames_xy, teams=teams, ball_xy=ball_xy, **kwargs)
+    artists = sorted(tracking.artists, key=lambda artist: artist.get_zorder())
+    for artist in artists:
+        artist.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    width, height = canvas.get_width_height()
+
+    process = file = None
+    try:
+        if frame_format == 'video':
+            output = Path(directory) / f'segment_{chunk:06d}{suffix}'
+            process = _ffmpeg_segment(output, width, height, fps)
+        elif frame_format == 'rgba':
+            file = open(Path(directory) / f'frames_{chunk:06d}.rgba', 'wb')
+
+        for position, frame in enumerate(frames, start=first_position):
+            canvas.restore_region(background)
+            tracking.update(frame - offset)
+            for artist in artists:
+                ax.draw_artist(artist)
+            buffer = canvas.buffer_rgba()
+            if frame_format == 'png':
+                from PIL import Image
+                Image.fromarray(np.asarray(buffer)).save(Path(directory) /
+                                                         f'frame_{position:06d}.png')
+            elif frame_format == 'video':
+                process.stdin.write(buffer)
+            else:
+                file.write(buffer)
+
+        if process is not None:
+            process.stdin.close()
+            if process.wait() != 0:
+                raise RuntimeError(f'ffmpeg failed to encode {output}')
+    finally:
+        if file is not None:
+            file.close()
+        # stop ffmpeg if the chunk failed before it finished encoding
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+    return chunk
+
+
+def _render_chunks(pitch, frames_xy, teams, ball_xy, directory, suffix, fps, frames, figsize,
+                   dpi, frame_format, n_jobs, chunk_size, kwargs):
+    """ Render the chunks of frames to the directory, in parallel if n_jobs is not one."""
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = -(-len(frames) // n_jobs)
+    tasks = _chunk_tasks(pitch, frames_xy, teams, ball_xy, frames, chunk_size,
+                         kwargs.get('trail_length', 0))
+    render = partial(_render_chunk, figsize=figsize, dpi=dpi, frame_format=frame_format,
+                     directory=directory, fps=fps, suffix=suffix, kwargs=kwargs)
+    if n_jobs == 1 or len(tasks) == 1:
+        return list(map(render, tasks))
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(render, tasks))
+
+
+def _save_animation(pitch, frames_xy, teams, ball_xy, filename, fps, frames, figsize, dpi,
+                    frame_format, n_jobs, chunk_size, kwargs):
+    """ Render the frames in parallel and join them with ffmpeg or write image sequences."""
+    valid_format = [None, 'video', 'png', 'rgba']
+    if frame_format not in valid_format:
+        raise TypeError(f'Invalid argument: frame_format should be in {valid_format}')
+    ffmpeg_found = shutil.which('ffmpeg') is not None
+    if frame_format is None:
+        frame_format = 'video' if ffmpeg_found else 'png'
+    if frame_format == 'video' and not ffmpeg_found:
+        raise ValueError("ffmpeg was not found, use frame_format='png' or 'rgba' instead.")
+
+    filename = Path(filename)
+    if frame_format != 'video':
+        # image sequences are written to a directory named after the file
+        directory = filename.with_suffix('') if filename.suffix else filename
+        directory.mkdir(parents=True, exist_ok=True)
+        _render_chunks(pitch, frames_xy, teams, ball_xy, directory, filename.suffix, fps,
+                       frames, figsize, dpi, frame_format, n_jobs, chunk_size, kwargs)
+        return str(directory)
+
+    # the segments are removed even if rendering or joining them fails
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=filename.parent) as directory:
+        chunks = _render_chunks(pitch, frames_xy, teams, ball_xy, directory, filename.suffix,
+                                fps, frames, figsize, dpi, frame_format, n_jobs, chunk_size,
+                                kwargs)
+        # join the segments without re-encoding
+        directory = Path(directory)
+        segments = directory / 'segments.txt'
+        segments.write_text(''.join(f"file '{directory / f'segment_{chunk:06d}{filename.suffix}'}'"
+                                    '\n' for chunk in chunks))
+        subprocess.run(['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                        '-i', str(segments), '-c', 'copy', str(filename)], check=True)
+    return str(filename)
@@ -0,0 +1,209 @@
+""" A module for rendering many pitch charts in parallel across a process pool."""
+
+import inspect
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Union
+
+import matplotlib.pyplot as plt
+
+from .canvas import PitchCanvas
+
+__all__ = ['BatchResult', 'render_batch']
+
+# the canvases of a pool worker, created by the worker initializer
+_WORKER_CANVASES = None
+
+
+@dataclass
+class BatchResult:
+    """ A finished chart from ``render_batch``.
+
+    Parameters
+    ----------
+    index : int
+        The position of the chart spec in the list of specs.
+    output : str or bytes
+        The file path if the spec has a 'filename', otherwise the PNG bytes.
+    seconds : float
+        The time taken to plot and save the chart in seconds.
+    """
+    index: int
+    output: Union[str, bytes]
+    seconds: float
+
+
+@lru_cache(maxsize=None)
+def _font(url):
+    """ Download a font once per worker."""
+    from .utils import FontManager
+    return FontManager(url).prop
+
+
+def _spec_key(spec):
+    return repr((spec.get('vertical', False),
+                 sorted(spec.get('pitch', {}).items()),
+                 sorted(spec.get('draw', {}).items())))
+
+
+def _canvas(spec, canvases):
+    """ Get a cached canvas for the spec, drawing the pitch on first use."""
+    key = _spec_key(spec)
+    if key not in canvases:
+        from .soccer.pitch import Pitch, VerticalPitch
+        pitch_class = VerticalPitch if spec.get('vertical', False) else Pitch
+        canvases[key] = PitchCanvas(pitch_class(**spec.get('pitch', {})), **spec.get('draw', {}))
+    return canvases[key]
+
+
+def _init_worker():
+    """ Start an empty pool of canvases in each worker process."""
+    global _WORKER_CANVASES
+    _WORKER_CANVASES = {}
+
+
+def _render_worker(task):
+    """ Render a single spec with the canvases of the worker process."""
+    return _render(task, _WORKER_CANVASES)
+
+
+def _call_layer(pitch, ax, layer):
+    method, args, kwargs = (tuple(layer) + ((), {}))[:3]
+    kwargs = dict(kwargs)
+    font_url = kwargs.pop('font_url', None)
+    if font_url is not None:
+        kwargs['fontproperties'] = _font(font_url)
+    if method.startswith('ax.'):
+        return getattr(ax, method[3:])(*args, **kwargs)
+    func = getattr(pitch, method)
+    if 'ax' in inspect.signature(func).parameters:
+        kwargs['ax'] = ax
+    return func(*args, **kwargs)
+
+
+def _save(fig, filename, savefig_kwargs):
+    if filename is not None:
+        fig.savefig(filename, **savefig_kwargs)
+        return os.fspath(filename)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **{'format': 'png', **savefig_kwargs})
+    return buffer.getvalue()
+
+
+def _render(task, canvases):
+    """ Render a single spec, reusing the canvases for dictionary specs."""
+    index, spec, savefig_kwargs = task
+    start = time.perf_counter()
+    if callable(spec):
+        fig = spec()
+        output = _save(fig, None, savefig_kwargs)
+        plt.close(fig)
+        return BatchResult(index, output, time.perf_counter() - start)
+
+    savefig_kwargs = {**savefig_kwargs, **spec.get('savefig', {})}
+    canvas = _canvas(spec, canvases)
+    try:
+        if 'func' in spec:
+            spec['func'](canvas.pitch, canvas.ax)
+        for layer in spec.get('layers', []):
+            _call_layer(canvas.pitch, canvas.ax, layer)
+        output = _save(canvas.fig, spec.get('filename'), savefig_kwargs)
+    finally:
+        canvas.clear_data()
+    return BatchResult(index, output, time.perf_counter() - start)
+
+
+def render_batch(specs, max_workers=None, chunksize=None, savefig_kwargs=None):
+    """ Render many pitch charts across a pool of processes.
+
+    Each worker draws the pitch once per distinct pitch/draw setup and reuses
+    the figure for every chart with the same setup, removing the plotted data
+    between charts. Fonts given by 'font_url' are downloaded once per worker.
+
+    Parameters
+    ----------
+    specs : sequence of dict or callable
+        The charts to render. A callable takes no arguments and returns a
+        matplotlib.figure.Figure, which is closed after saving.
+        A dict is a declarative spec with the keys:
+
+        * 'pitch' : dict of keyword arguments for Pitch (default {}).
+        * 'vertical' : bool, whether to use a VerticalPitch (default False).
+        * 'draw' : dict of keyword arguments for the draw method, e.g. figsize.
+        * 'layers' : list of (method, args, kwargs) tuples. The method is the name
+          of a pitch method, e.g. 'scatter', or an Axes method prefixed with 'ax.',
+          e.g. 'ax.set_title'. The ax is passed automatically to pitch methods.
+          A 'font_url' keyword is replaced by the cached font's fontproperties.
+        * 'func' : a callable func(pitch, ax) for plotting that does not fit the layers.
+        * 'filename' : str, if given the chart is saved to this path, otherwise
+          the PNG bytes are returned.
+        * 'savefig' : dict of keyword arguments for savefig for this chart.
+
+        Callables and data in the specs must be picklable (e.g. module-level functions).
+    max_workers : int, default None
+        The number of worker processes. If None, uses os.cpu_count().
+        If 1, the charts are rendered in the current process without a pool.
+    chunksize : int, default None
+        The number of specs sent to a worker at once.
+        If None, splits the specs into about four chunks per worker.
+    savefig_kwargs : dict, default None
+        Keyword arguments passed to savefig for all charts, e.g. dict(dpi=100).
+
+    Returns
+    -------
+    iterator of BatchResult
+        The index, output (file path or PNG bytes) and seconds taken for each chart,
+        in the same order as the specs. Results are yielded as they finish,
+        so you can consume them before the whole batch is complete.
+        If you stop early, the charts that have not started rendering are cancelled.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mplsoccer import render_batch
+    >>> specs = [{'pitch': {'pitch_type': 'opta'},
+    ...           'layers': [('scatter', (np.random.uniform(0, 100, 10),
+    ...                                   np.random.uniform(0, 100, 10)), {'s': 20})],
+    ...           'filename': f'chart_{i}.png'} for i in range(100)]
+    >>> for result in render_batch(specs, max_workers=4):
+    ...     print(result.output, result.seconds)
+    """
+    specs = list(specs)
+    for spec in specs:
+        if not (callable(spec) or isinstance(spec, dict)):
+            raise TypeError(f'Invalid argument: specs should be a sequence of dict or callable, '
+                            f'got {type(spec).__name__}.')
+    savefig_kwargs = {} if savefig_kwargs is None else savefig_kwargs
+    tasks = [(index, spec, savefig_kwargs) for index, spec in enumerate(specs)]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers == 1 or len(tasks) <= 1:
+        return _render_serial(tasks)
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (4 * max_workers))
+    return _render_parallel(tasks, max_workers, chunksize)
+
+
+def _render_serial(tasks):
+    """ Render the tasks in the current process."""
+    # the canvases are only kept for this batch, so their figures are not left open
+    canvases = {}
+    try:
+        yield from map(partial(_render, canvases=canvases), tasks)
+    finally:
+        for canvas in canvases.values():
+            plt.close(canvas.fig)
+
+
+def _render_parallel(tasks, max_workers, chunksize):
+    """ Render the tasks across a pool of processes."""
+    executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker)
+    try:
+        yield from executor.map(_render_worker, tasks, chunksize=chunksize)
+    finally:
+        # if the results are not all consumed, the chunks that have not started are cancelled
+        executor.shutdown(wait=True, cancel_futures=True)
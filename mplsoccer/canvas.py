@@ -0,0 +1,129 @@
+""" A module with a reusable figure for drawing many charts on the same pitch."""
+
+import itertools
+
+import numpy as np
+
+__all__ = ['PitchCanvas']
+
+_TITLE_LOCATIONS = ['left', 'center', 'right']
+
+
+class PitchCanvas:
+    """ A figure with the pitch drawn once that can be cleared and reused for many charts.
+
+    The artists created when drawing the pitch (markings, stripes, goals etc.) are tagged
+    as pitch artists. Everything added afterwards (scatter, heatmaps, lines, arrows, text,
+    legends, colorbars and inset axes) is a data artist and is removed by ``clear_data``,
+    which returns the figure to the state it was in after drawing the pitch.
+    This avoids creating the figure and redrawing the markings for each chart.
+
+    Parameters
+    ----------
+    pitch : mplsoccer pitch, e.g. mplsoccer.Pitch or mplsoccer.VerticalPitch
+        The pitch to draw.
+    ax : matplotlib.axes.Axes, default None
+        An existing axes to draw the pitch on. If None, a new figure is created.
+    **kwargs : All other keyword arguments are passed on to the pitch draw method,
+        e.g. figsize, nrows, ncols, tight_layout and constrained_layout.
+
+    Attributes
+    ----------
+    fig : matplotlib.figure.Figure
+    ax : matplotlib.axes.Axes or numpy.ndarray of Axes
+        An array of Axes if the pitch was drawn with nrows or ncols greater than one.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mplsoccer import Pitch, PitchCanvas
+    >>> canvas = PitchCanvas(Pitch(), figsize=(8, 6))
+    >>> for i in range(10):
+    ...     canvas.pitch.scatter(np.random.uniform(0, 120, 10),
+    ...                          np.random.uniform(0, 80, 10), ax=canvas.ax)
+    ...     canvas.fig.savefig(f'chart_{i}.png')
+    ...     canvas.clear_data()
+    """
+
+    def __init__(self, pitch, ax=None, **kwargs):
+        self.pitch = pitch
+        if ax is None:
+            self.fig, self.ax = pitch.draw(**kwargs)
+        else:
+            pitch.draw(ax=ax)
+            self.fig, self.ax = ax.figure, ax
+        self._axes = list(np.ravel(self.ax))
+        self._pitch_axes = set(self.fig.axes)
+        self._pitch_artists = {artist for axis in self._axes for artist in axis.get_children()}
+        self._figure_artists = set(self.fig.get_children())
+        self._limits = [(axis.get_xlim(), axis.get_ylim()) for axis in self._axes]
+        self._titles = [{loc: axis.get_title(loc=loc) for loc in _TITLE_LOCATIONS}
+                        for axis in self._axes]
+        self._subplotspecs = [axis.get_subplotspec() for axis in self._axes]
+        self._positions = [axis.get_position(original=True) for axis in self._axes]
+        self._anchors = [axis.get_anchor() for axis in self._axes]
+        self._subplotpars = {key: getattr(self.fig.subplotpars, key)
+                             for key in ['left', 'bottom', 'right', 'top', 'wspace', 'hspace']}
+
+    def is_pitch_artist(self, artist):
+        """ Whether the artist was created when drawing the pitch.
+
+        Parameters
+        ----------
+        artist : matplotlib.artist.Artist
+
+        Returns
+        -------
+        bool
+        """
+        return artist in self._pitch_artists or artist in self._pitch_axes
+
+    def data_artists(self):
+        """ The artists added since drawing the pitch.
+
+        Returns
+        -------
+        list of matplotlib.artist.Artist
+            Includes any axes added to the figure, e.g. colorbars or inset axes.
+        """
+        artists = [axis for axis in self.fig.axes if axis not in self._pitch_axes]
+        # the ids of the artists already listed, e.g. the added axes are also figure children
+        seen = {id(artist) for artist in artists}
+        for artist in itertools.chain((artist for axis in self._axes
+                                       for artist in axis.get_children()),
+                                      self.fig.get_children()):
+            if (id(artist) not in seen and artist not in self._pitch_artists and
+                    artist not in self._figure_artists):
+                seen.add(id(artist))
+                artists.append(artist)
+        return artists
+
+    def clear_data(self):
+        """ Remove the data artists and return the figure to its state after drawing the pitch.
+
+        This resets the axes limits, titles, the color cycle and the figure layout
+        (which is adjusted by the layout engine and colorbars).
+        """
+        for artist in self.data_artists():
+            artist.remove()
+        # the layout engine adjusts the subplot parameters when saving
+        layout_engine = self.fig.get_layout_engine()
+        if layout_engine is None or layout_engine.adjust_compatible:
+            self.fig.subplots_adjust(**self._subplotpars)
+        for axis, (xlim, ylim), titles, subplotspec, position, anchor in zip(
+                self._axes, self._limits, self._titles, self._subplotspecs,
+                self._positions, self._anchors):
+            for loc, text in titles.items():
+                if axis.get_title(loc=loc) != text:
+                    axis.set_title(text, loc=loc)
+            axis.set_xlim(xlim)
+            axis.set_ylim(ylim)
+            axis.set_prop_cycle(None)
+            # colorbars steal space from the axes
+            if subplotspec is not None:
+                axis.set_subplotspec(subplotspec)
+            axis.set_position(position)
+            axis.set_anchor(anchor)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(pitch={self.pitch!r})'
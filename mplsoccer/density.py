@@ -0,0 +1,203 @@
+""" A module for plotting millions of points as a density raster that is recomputed
+at the on-screen resolution, similar to datashader."""
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.colors import to_rgba_array
+from matplotlib.image import AxesImage
+
+from .utils import validate_ax
+
+__all__ = ['DensityImage', 'scatter_density']
+
+
+class DensityImage(AxesImage):
+    """ An image of the number of points in each screen pixel.
+
+    The points are binned at the axes' on-screen size and DPI each time the image
+    is drawn with a different view (zoom/ pan) or axes size (resize), so the image
+    always has one bin per ``pixel_size`` screen pixels. The counts are calculated
+    with a single numpy.bincount.
+
+    It is usually created with ``scatter_density`` or ``Pitch.scatter_density``.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axis to plot on.
+    x, y : array-like
+        The point coordinates in data coordinates.
+    categories : array-like, default None
+        A category for each point (e.g. the team or event type). If given, each pixel
+        is colored by the mix of the category colors weighted by the counts, and the
+        alpha is the normalized total count.
+    colors : dict or sequence of colors, default None
+        The category colors. Either a dictionary of category to color or a sequence of colors
+        in the order of the sorted unique categories. If None, the color cycle is used.
+    pixel_size : int, default 1
+        The size of each bin in screen pixels.
+    min_alpha : float, default 0.25
+        The alpha of the pixels with the lowest count if there are categories,
+        so pixels with few points stay visible.
+    vmin, vmax : float, default None
+        The count limits for the colormap. If None, the limits are scaled to the counts
+        in the current view.
+    **kwargs : All other keyword arguments are passed on to matplotlib.image.AxesImage,
+        e.g. cmap, norm, alpha and zorder.
+    """
+
+    def __init__(self, ax, x, y, categories=None, colors=None, pixel_size=1, min_alpha=0.25,
+                 vmin=None, vmax=None, **kwargs):
+        kwargs.setdefault('interpolation', 'nearest')
+        super().__init__(ax, origin='lower', **kwargs)
+        if vmin is not None or vmax is not None:
+            self.set_clim(vmin, vmax)
+        x = np.ravel(x).astype(float)
+        y = np.ravel(y).astype(float)
+        if x.size != y.size:
+            raise ValueError("x and y must be the same size")
+        if not isinstance(pixel_size, (int, np.integer)) or pixel_size < 1:
+            raise TypeError("Invalid argument: 'pixel_size' should be a positive int.")
+        mask = np.isnan(x) | np.isnan(y)
+        self.categories = None
+        self.category_colors = None
+        self._codes = None
+        if categories is not None:
+            categories = np.ravel(categories)
+            if categories.size != x.size:
+                raise ValueError("x and categories must be the same size")
+            categories = categories[~mask]
+            self.categories, self._codes = np.unique(categories, return_inverse=True)
+            if colors is None:
+                cycle = rcParams['axes.prop_cycle'].by_key()['color']
+                colors = [cycle[i % len(cycle)] for i in range(self.categories.size)]
+            elif isinstance(colors, dict):
+                colors = [colors[category] for category in self.categories]
+            if len(colors) != self.categories.size:
+                raise ValueError("colors must have a color for each category")
+            self.category_colors = to_rgba_array(colors)
+        self._x = x[~mask]
+        self._y = y[~mask]
+        self.pixel_size = pixel_size
+        self.min_alpha = min_alpha
+        # the norm limits given by the user, other limits are rescaled to each view
+        self._norm_limits = (self.norm.vmin, self.norm.vmax)
+        self._view = None
+        self._update_density()
+
+    def _current_view(self):
+        bbox = self.axes.bbox
+        width = max(int(np.ceil(bbox.width / self.pixel_size)), 1)
+        height = max(int(np.ceil(bbox.height / self.pixel_size)), 1)
+        return tuple(self.axes.get_xlim()) + tuple(self.axes.get_ylim()) + (width, height)
+
+    def counts(self):
+        """ The number of points in each pixel for the current view.
+
+        Returns
+        -------
+        counts : numpy.ndarray
+            An array of shape (height, width), or (number of categories, height, width)
+            if there are categories. The first row is the bottom of the view
+            (ylim[0]) and the first column the left of the view (xlim[0]).
+        """
+        xmin, xmax, ymin, ymax, width, height = self._current_view()
+        # the limits can be inverted, e.g. for pitches with an inverted y-axis
+        xbin = np.floor((self._x - xmin) / (xmax - xmin) * width)
+        ybin = np.floor((self._y - ymin) / (ymax - ymin) * height)
+        inside = (xbin >= 0) & (xbin < width) & (ybin >= 0) & (ybin < height)
+        index = ybin[inside].astype(np.intp) * width + xbin[inside].astype(np.intp)
+        if self._codes is None:
+            return np.bincount(index, minlength=width * height).reshape(height, width)
+        n_categories = self.categories.size
+        index = self._codes[inside] * (width * height) + index
+        return np.bincount(index, minlength=n_categories * width * height).reshape(
+            n_categories, height, width)
+
+    def _update_density(self):
+        view = self._current_view()
+        if view == self._view:
+            return
+        self._view = view
+        counts = self.counts()
+        # reset the norm so the colors are scaled to the counts in view
+        self.norm.vmin, self.norm.vmax = self._norm_limits
+        if self._codes is None:
+            self.set_data(np.ma.masked_equal(counts, 0))
+        else:
+            total = counts.sum(axis=0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                rgba = np.einsum('chw,cj->hwj', counts, self.category_colors) / total[..., None]
+            total = np.ma.masked_equal(total, 0)
+            self.norm.autoscale_None(total)
+            if self.norm.vmin == self.norm.vmax:
+                alpha = np.ones(total.shape)
+            else:
+                alpha = np.clip(np.ma.filled(self.norm(total), 0), 0, 1)
+            alpha = self.min_alpha + (1 - self.min_alpha) * alpha
+            alpha[np.ma.getmaskarray(total)] = 0
+            rgba[..., 3] = alpha * rgba[..., 3]
+            self.set_data(np.nan_to_num(rgba))
+        self._extent = view[:4]
+
+    def draw(self, renderer):
+        # recompute on zoom/ pan/ resize
+        self._update_density()
+        super().draw(renderer)
+
+
+def scatter_density(x, y, ax=None, vertical=False, categories=None, colors=None,
+                    pixel_size=1, min_alpha=0.25, **kwargs):
+    """ Plot points as a density raster with the number of points in each screen pixel.
+
+    This is much faster than a scatter plot for millions of points. The points are
+    binned at the axes' on-screen size and DPI, and the raster is recomputed when
+    the axes are zoomed or resized. Pixels without any points are transparent.
+
+    Parameters
+    ----------
+    x, y : array-like
+        The point coordinates.
+    ax : matplotlib.axes.Axes, default None
+        The axis to plot on.
+    vertical : bool, default False
+        If the orientation is vertical (True), then the code switches the x and y coordinates.
+    categories : array-like, default None
+        A category for each point (e.g. the team or event type). If given, each pixel
+        is colored by the mix of the category colors weighted by the counts, and the
+        alpha is the normalized total count (e.g. use norm='log').
+    colors : dict or sequence of colors, default None
+        The category colors. Either a dictionary of category to color or a sequence of colors
+        in the order of the sorted unique categories. If None, the color cycle is used.
+    pixel_size : int, default 1
+        The size of each bin in screen pixels.
+    min_alpha : float, default 0.25
+        The alpha of the pixels with the lowest count if there are categories,
+        so pixels with few points stay visible.
+    **kwargs : All other keyword arguments are passed on to matplotlib.image.AxesImage,
+        e.g. cmap, norm, vmin, vmax, alpha and zorder.
+
+    Returns
+    -------
+    image : mplsoccer.density.DensityImage
+
+    Examples
+    --------
+    >>> from mplsoccer import Pitch
+    >>> import numpy as np
+    >>> pitch = Pitch()
+    >>> fig, ax = pitch.draw()
+    >>> x = np.random.uniform(low=0, high=120, size=1000000)
+    >>> y = np.random.uniform(low=0, high=80, size=1000000)
+    >>> team = np.random.choice(['home', 'away'], size=1000000)
+    >>> image = pitch.scatter_density(x, y, categories=team, norm='log', ax=ax,
+    ...                               colors={'home': 'red', 'away': 'blue'})
+    """
+    validate_ax(ax)
+    if vertical:
+        x, y = y, x
+    kwargs.setdefault('zorder', 1)
+    image = DensityImage(ax, x, y, categories=categories, colors=colors,
+                         pixel_size=pixel_size, min_alpha=min_alpha, **kwargs)
+    ax.add_image(image)
+    return image
@@ -1,8 +1,5 @@
 """ Functions to plot a grid of axes with an endnote and title."""
 
-import matplotlib.pyplot as plt
-import numpy as np
-
 __all__ = ['_grid_dimensions', '_draw_grid', 'grid', 'grid_dimensions']
 
 
@@ -160,6 +157,10 @@ def _draw_grid(dimensions, left_pad=0, right_pad=0, axis=True, grid_key='grid'):
     axs : dict[label, Axes]
         A dictionary mapping the labels to the Axes objects.
     """
+    # imported here so importing mplsoccer, which imports the grid functions, stays fast
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     dims = dimensions
     bottom_coordinates = np.tile(dims['spaceheight'] + dims['axheight'],
                                  reps=dims['nrows'] - 1).cumsum()
@@ -1,7 +1,7 @@
 """ A module with functions for binning data into 2d bins and plotting heatmaps.
 
-The regular functions (bin_statistic, bin_statistic_sonar) bin x/y coordinates
-into a grid via scipy.
+The regular functions (bin_statistic, bin_statistic_sonar, flow_statistic) bin x/y
+coordinates into a grid via scipy.
 
 The zone functions (bin_statistic_zones, bin_statistic_sonar_zones) take any
 tiling of the pitch by rectangles. The zones do not need to line up in a
@@ -12,7 +12,9 @@ each cell belongs to exactly one zone. The points are binned on the fine
 grid with scipy and the results aggregated per zone.
 The results are flat arrays with one value per zone, in the order
 the zones were supplied. Each binning function has a plotting counterpart
-that draws the result
+that draws the result.
+
+scipy.stats is imported inside the functions as it is slow to import.
 """
 
 from dataclasses import dataclass, asdict
@@ -20,7 +22,6 @@ from functools import partial
 from typing import Optional
 
 import numpy as np
-from scipy.stats import binned_statistic, binned_statistic_2d, binned_statistic_dd, circmean
 from matplotlib.projections.polar import PolarAxes
 from matplotlib import colormaps
 from matplotlib.collections import PatchCollection
@@ -29,6 +30,7 @@ from matplotlib.patches import Rectangle
 from matplotlib.path import Path
 from matplotlib.transforms import Affine2D
 
+from ._lattice import lattice_map, lattice_scale
 from .utils import validate_ax
 
 
@@ -77,6 +79,7 @@ def _nan_safe(statistic):
     elif statistic == 'max':
         statistic = np.nanmax
     elif statistic == 'circmean':
+        from scipy.stats import circmean
         statistic = partial(circmean, nan_policy='omit')
     return statistic
 
@@ -98,6 +101,81 @@ def _center_angles(angle, angle_bins, center):
     return angle, first_width
 
 
+def _ravel_float(values):
+    """ Flatten the values to a float array, only copying values that are not floats
+    (e.g. float32 coordinates are not converted to float64)."""
+    values = np.ravel(values)
+    return values if values.dtype.kind == 'f' else values.astype(float)
+
+
+def _binnumber_dtype(binnumber_dtype, num_bins):
+    """ Validate the binnumber dtype is a signed integer (for the -1 outside the pitch)
+    that is large enough for the number of bins."""
+    if binnumber_dtype is None:
+        return np.dtype(np.intp)
+    binnumber_dtype = np.dtype(binnumber_dtype)
+    if not np.issubdtype(binnumber_dtype, np.signedinteger):
+        raise TypeError('Invalid argument: binnumber_dtype should be a signed integer dtype, '
+                        'e.g. numpy.int32 or numpy.int16.')
+    if num_bins - 1 > np.iinfo(binnumber_dtype).max:
+        raise ValueError(f'binnumber_dtype {binnumber_dtype} is too small for {num_bins} bins.')
+    return binnumber_dtype
+
+
+def _lattice_binned_statistic_2d(x, y, values, statistic, bins, pitch_range, lattice,
+                                  y_bottom=None):
+    """ The same as scipy.stats.binned_statistic_2d (with expand_binnumbers=True)
+    for coordinates on a lattice. The bin of each lattice point is calculated once and
+    looked up rather than finding the bin of every coordinate.
+    If y_bottom is not None, the y-coordinates are binned as y_bottom - y."""
+    from scipy.stats import binned_statistic
+    try:
+        num = len(bins)
+    except TypeError:
+        axis_bins = (bins, bins)  # a single number of bins for both dimensions
+    else:
+        # (nx, ny), (x_edges, y_edges) or a mix, otherwise edges for both dimensions
+        axis_bins = bins if num == 2 else (bins, bins)
+    bin_edges = []
+    binnumber = np.empty((2, x.size), dtype=np.intp)
+    for axis, (coordinate, axis_bin, axis_range) in enumerate(zip((x, y), axis_bins,
+                                                                  pitch_range)):
+        offset = y_bottom if axis == 1 else None
+
+        def digitize(values, axis_bin=axis_bin, axis_range=axis_range, offset=offset):
+            """ The 1-indexed bins like binned_statistic (0 and n + 1 are outside)."""
+            if offset is not None:
+                values = offset - values
+            return binned_statistic(values, values, statistic='count', bins=axis_bin,
+                                    range=axis_range)[2]
+
+        if np.iterable(axis_bin):
+            bin_edges.append(np.asarray(axis_bin, dtype=float))
+        else:
+            bin_edges.append(np.linspace(*axis_range, int(axis_bin) + 1))
+        low, high = axis_range if offset is None else (offset - axis_range[1],
+                                                       offset - axis_range[0])
+        scale = lattice_scale(coordinate, lattice)
+        if scale is None:
+            binnumber[axis] = digitize(coordinate)
+        else:
+            binnumber[axis] = lattice_map(coordinate, digitize, min(low, high),
+                                          max(low, high), scale)
+    num_x = bin_edges[0].size - 1
+    num_y = bin_edges[1].size - 1
+    # the flat index of the (num_x + 2, num_y + 2) bins, including the bins outside the pitch
+    flat = binnumber[0] * (num_y + 2)
+    flat += binnumber[1]
+    num_flat = (num_x + 2) * (num_y + 2)
+    if statistic == 'count':
+        result = np.bincount(flat, minlength=num_flat).astype(float)
+    else:
+        result = binned_statistic(flat, np.ravel(values), statistic=statistic,
+                                  bins=num_flat, range=(-0.5, num_flat - 0.5))[0]
+    result = result.reshape(num_x + 2, num_y + 2)[1:-1, 1:-1]
+    return result, bin_edges[0], bin_edges[1], binnumber
+
+
 def _flip_y_bin_edges(bins, bottom):
     """ Reflect explicit y bin-edges (y -> bottom - y), reversed back
     to ascending order. """
@@ -116,8 +194,78 @@ def _flip_y_bin_edges(bins, bottom):
     return (edges, (bottom - edges)[::-1]), edges
 
 
+def _standardizer_dim(dim, standardizer):
+    """ Get the pitch_from dimensions of the standardizer, checking they match dim."""
+    dim_from = standardizer.dim_from
+    if dim is not None and not np.array_equal(dim.pitch_extent, dim_from.pitch_extent):
+        raise ValueError('the standardizer must convert from the pitch coordinates '
+                         '(pitch_from should be the pitch_type)')
+    return dim_from
+
+
+def _clip_to_pitch(x, y, dim):
+    """ Clip the coordinates to the pitch extent like Standardizer.transform."""
+    return (np.clip(x, dim.left, dim.right),
+            np.clip(y, dim.pitch_extent[2], dim.pitch_extent[3]))
+
+
+def _standardizer_axis(standardizer, values, axis):
+    """ Convert values along one axis (0 for x, 1 for y) from the standardizer's
+    pitch_to coordinates to its pitch_from coordinates."""
+    values = np.asarray(values, dtype=float)
+    dim = standardizer.dim_to
+    other = np.full(values.shape, dim.center_width if axis == 0 else dim.center_length,
+                    dtype=float)
+    xy = (values, other) if axis == 0 else (other, values)
+    return standardizer.transform(*xy, reverse=True)[axis]
+
+
+def _standardizer_bin_edges(bins, standardizer):
+    """ Convert the bin specification in the standardizer's pitch_to coordinates
+    to explicit (ascending) bin edges in its pitch_from coordinates.
+
+    The edges are piecewise-linear in the pitch markings so binning the raw points
+    on these edges gives the same bins as standardizing the points first."""
+    try:
+        num = len(bins)
+    except TypeError:
+        axis_bins = (bins, bins)  # a single number of bins for both dimensions
+    else:
+        # (nx, ny), (x_edges, y_edges) or a mix, otherwise edges for both dimensions
+        axis_bins = bins if num == 2 else (bins, bins)
+    extent = standardizer.dim_to.pitch_extent
+    bin_edges = []
+    for axis, axis_bin in enumerate(axis_bins):
+        if np.iterable(axis_bin):
+            edges = np.asarray(axis_bin, dtype=float)
+        else:
+            low, high = sorted(extent[axis * 2: axis * 2 + 2])
+            edges = np.linspace(low, high, int(axis_bin) + 1)
+        edges = np.sort(_standardizer_axis(standardizer, edges, axis))
+        if edges.size < 2 or (np.diff(edges) <= 0).any():
+            raise ValueError('the bin edges must be strictly increasing after clipping '
+                             'them to the pitch_to extent of the standardizer')
+        bin_edges.append(edges)
+    return bin_edges
+
+
+def _standardizer_zones(zones, standardizer, edge_tol):
+    """ Convert (x0, x1, y0, y1) zones in the standardizer's pitch_to coordinates
+    to zones in its pitch_from coordinates."""
+    extent = np.asarray(standardizer.dim_to.pitch_extent, dtype=float)
+    if edge_tol is None:
+        edge_tol = np.abs(extent).max() * 1e-9
+    zones = _validate_zones(zones, extent, edge_tol)[0]
+    source = np.empty_like(zones)
+    source[:, :2] = _standardizer_axis(standardizer, zones[:, :2], 0)
+    # the y-axis is reversed if only one of the pitches has an inverted y-axis
+    source[:, 2:] = np.sort(_standardizer_axis(standardizer, zones[:, 2:], 1), axis=1)
+    return source
+
+
 def bin_statistic(x, y, values=None, dim=None, statistic='count',
-                  bins=(5, 4), normalize=False, standardized=False):
+                  bins=(5, 4), normalize=False, standardized=False, standardizer=None,
+                  binnumber_dtype=None, lattice=None):
     """ Calculates binned statistics using scipy.stats.binned_statistic_2d.
 
     This method automatically sets the range, changes the scipy defaults,
@@ -152,6 +300,23 @@ def bin_statistic(x, y, values=None, dim=None, statistic='count',
     standardized : bool, default False
         Whether the x, y values have been standardized to the
         'uefa' pitch coordinates (105m x 68m)
+    standardizer : mplsoccer.Standardizer, default None
+        If given, the raw x, y values (in the standardizer's pitch_from coordinates)
+        are binned as if they were standardized first with ``standardizer.transform``.
+        The bins are in the pitch_to coordinates and instead of transforming every point
+        the bin edges are converted to the pitch_from coordinates, so the statistic and
+        binnumber are the same as binning the standardized points. The grids and
+        centers are in the pitch_from coordinates.
+    binnumber_dtype : numpy dtype, default None
+        The signed integer dtype of the binnumber, e.g. numpy.int32 or numpy.int16
+        to reduce the memory for many points. If None, uses numpy.intp (int64).
+    lattice : float or 'auto', default None
+        The spacing of the x, y coordinates if they are on a fixed lattice, e.g. lattice=1
+        for integer or lattice=0.1 for one decimal place 'opta' coordinates. The bin of each
+        lattice point is calculated once and looked up, rather than finding the bin of every
+        coordinate. If 'auto', the spacing (1, 0.1 or 0.01) is detected from a sample
+        of the coordinates. The results are the same: coordinates that are not on the
+        lattice are binned as usual. Not used if values is a list of arrays.
 
     Returns
     -------
@@ -183,21 +348,37 @@ def bin_statistic(x, y, values=None, dim=None, statistic='count',
         values = x
     if (values is None) & (statistic != 'count'):
         raise ValueError("values on which to calculate the statistic are missing")
+    if standardizer is not None:
+        if standardized:
+            raise ValueError('standardized and standardizer can not be used together')
+        dim = _standardizer_dim(dim, standardizer)
+        bins = _standardizer_bin_edges(bins, standardizer)
+        x, y = _clip_to_pitch(x, y, dim)
     y_edge_original = None
     if standardized:
         pitch_range = np.array([dim.standardized_extent[0:2],
                                 dim.standardized_extent[2:]])
     elif dim.invert_y:
         pitch_range = [[dim.left, dim.right], [dim.top, dim.bottom]]
-        y = dim.bottom - y
+        # the y-coordinates are binned as dim.bottom - y;
         # explicit y-edges must be flipped with the data; the original edges
         # are restored after binning for building the grids/ centers
         bins, y_edge_original = _flip_y_bin_edges(bins, dim.bottom)
     else:
         pitch_range = [[dim.left, dim.right], [dim.bottom, dim.top]]
-    statistic, x_edge, y_edge, binnumber = binned_statistic_2d(x, y, values, statistic=statistic,
-                                                               bins=bins, range=pitch_range,
-                                                               expand_binnumbers=True)
+    y_bottom = dim.bottom if dim.invert_y and not standardized else None
+
+    if lattice is not None and np.ndim(values) == 1:
+        statistic, x_edge, y_edge, binnumber = _lattice_binned_statistic_2d(
+            x, y, values, statistic, bins, pitch_range, lattice, y_bottom=y_bottom)
+    else:
+        if y_bottom is not None:
+            y = y_bottom - y
+        from scipy.stats import binned_statistic_2d
+        statistic, x_edge, y_edge, binnumber = binned_statistic_2d(x, y, values,
+                                                                   statistic=statistic,
+                                                                   bins=bins, range=pitch_range,
+                                                                   expand_binnumbers=True)
     if y_edge_original is not None:
         y_edge = y_edge_original
 
@@ -208,7 +389,8 @@ def bin_statistic(x, y, values=None, dim=None, statistic='count',
         num_y, num_x = statistic.shape
     if normalize:
         statistic = statistic / statistic.sum()
-    binnumber[1, :] = num_y - binnumber[1, :] + 1
+    # flip the y bins so they start from the top of the pitch
+    np.subtract(num_y + 1, binnumber[1], out=binnumber[1])
     x_grid, y_grid = np.meshgrid(x_edge, y_edge)
     cx, cy = np.meshgrid(x_edge[:-1] + 0.5 * np.diff(x_edge), y_edge[:-1] + 0.5 * np.diff(y_edge))
 
@@ -216,25 +398,111 @@ def bin_statistic(x, y, values=None, dim=None, statistic='count',
         y_grid = np.flip(y_grid, axis=0)
         cy = np.flip(cy, axis=0)
 
-    # if outside the pitch set the bin number to minus one
-    # else zero index the results by removing one
-    mask_x_out = np.logical_or(binnumber[0, :] == 0,
-                               binnumber[0, :] == num_x + 1)
-    binnumber[0, mask_x_out] = -1
-    binnumber[0, ~mask_x_out] = binnumber[0, ~mask_x_out] - 1
-
-    mask_y_out = np.logical_or(binnumber[1, :] == 0,
-                               binnumber[1, :] == num_y + 1)
-    binnumber[1, mask_y_out] = -1
-    binnumber[1, ~mask_y_out] = binnumber[1, ~mask_y_out] - 1
-    inside = np.logical_and(~mask_x_out, ~mask_y_out)
+    # zero index the results by removing one, then if outside the pitch
+    # set the bin number to minus one (the first bin is already minus one)
+    binnumber -= 1
+    binnumber[0, binnumber[0] == num_x] = -1
+    binnumber[1, binnumber[1] == num_y] = -1
+    inside = (binnumber[0] >= 0) & (binnumber[1] >= 0)
+    binnumber = binnumber.astype(_binnumber_dtype(binnumber_dtype, max(num_x, num_y)),
+                                 copy=False)
     return asdict(BinnedStatisticResult(statistic, x_grid, y_grid,
                                         cx, cy, binnumber=binnumber,
                                         inside=inside))
 
 
+def flow_statistic(xstart, ystart, xend, yend, dim=None, bins=(5, 4), standardized=False):
+    """ Calculates the flow map statistics for movements (e.g. passes) in a single pass.
+
+    The start locations are binned once and the count, the mean distance and the
+    circular mean angle of the movements starting in each bin are calculated with
+    numpy.bincount. The circular mean is the angle of the mean resultant vector
+    (the sum of the cosine and sine of the angles in each bin), which avoids
+    calling scipy.stats.circmean for each bin.
+    Movements with a missing (NaN) end location are counted but excluded from the mean
+    distance and angle.
+
+    Parameters
+    ----------
+    xstart, ystart, xend, yend : array-like or scalar.
+        Commonly, these parameters are 1D arrays.
+        The start and end coordinates of the movements.
+    dim : mplsoccer pitch dimensions
+        One of FixedDims, MetricasportsDims, VariableCenterDims, or CustomDims.
+        Automatically populated when using Pitch/ VerticalPitch class
+    bins : int or [int, int] or array_like or [array, array], optional
+        The bin specification.
+          * the number of bins for the two dimensions (nx = ny = bins),
+          * the number of bins in each dimension (nx, ny = bins),
+          * the bin edges for the two dimensions (x_edge = y_edge = bins),
+          * the bin edges in each dimension (x_edge, y_edge = bins).
+            If the bin edges are specified, the number of bins will be,
+            (nx = len(x_edge)-1, ny = len(y_edge)-1).
+    standardized : bool, default False
+        Whether the x, y values have been standardized to the
+        'uefa' pitch coordinates (105m x 68m)
+
+    Returns
+    -------
+    flow_statistic : dict.
+        The same keys as bin_statistic with 'statistic' the count of movements in each bin,
+        plus 'angle' (the circular mean angle in radians between 0 and 2 pi, measured
+        counter-clockwise like calculate_angle_and_distance) and 'distance'
+        (the mean distance). Empty bins have an angle and distance of NaN.
+
+    Examples
+    --------
+    >>> from mplsoccer import Pitch
+    >>> import numpy as np
+    >>> pitch = Pitch()
+    >>> xstart = np.random.uniform(low=0, high=120, size=100)
+    >>> ystart = np.random.uniform(low=0, high=80, size=100)
+    >>> xend = np.random.uniform(low=0, high=120, size=100)
+    >>> yend = np.random.uniform(low=0, high=80, size=100)
+    >>> stats = pitch.flow_statistic(xstart, ystart, xend, yend, bins=(6, 4))
+    """
+    xstart = np.ravel(xstart)
+    ystart = np.ravel(ystart)
+    xend = np.ravel(xend)
+    yend = np.ravel(yend)
+    if xstart.size != ystart.size:
+        raise ValueError("xstart and ystart must be the same size")
+    if xstart.size != xend.size:
+        raise ValueError("xstart and xend must be the same size")
+    if ystart.size != yend.size:
+        raise ValueError("ystart and yend must be the same size")
+    stats = bin_statistic(xstart, ystart, dim=dim, statistic='count', bins=bins,
+                          standardized=standardized)
+
+    x_dist = xend - xstart
+    if dim.invert_y and standardized is False:
+        y_dist = ystart - yend
+    else:
+        y_dist = yend - ystart
+    angle = np.arctan2(y_dist, x_dist)
+    distance = np.hypot(x_dist, y_dist)
+
+    # sum the distances and the resultant vector components per bin
+    num_y, num_x = stats['statistic'].shape
+    valid = stats['inside'] & ~np.isnan(distance)
+    index = stats['binnumber'][1, valid] * num_x + stats['binnumber'][0, valid]
+    count = np.bincount(index, minlength=num_x * num_y)
+    distance_sum = np.bincount(index, weights=distance[valid], minlength=num_x * num_y)
+    cos_sum = np.bincount(index, weights=np.cos(angle[valid]), minlength=num_x * num_y)
+    sin_sum = np.bincount(index, weights=np.sin(angle[valid]), minlength=num_x * num_y)
+    empty = count == 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_distance = distance_sum / count
+    mean_angle = np.mod(np.arctan2(sin_sum, cos_sum), 2 * np.pi)
+    mean_angle[empty] = np.nan
+    stats['angle'] = mean_angle.reshape(num_y, num_x)
+    stats['distance'] = mean_distance.reshape(num_y, num_x)
+    return stats
+
+
 def bin_statistic_sonar(x, y, angle, values=None, dim=None, statistic='count',
-                        bins=(5, 4, 10), normalize=False, standardized=False, center=True):
+                        bins=(5, 4, 10), normalize=False, standardized=False, center=True,
+                        binnumber_dtype=None):
     """ Calculates binned statistics using scipy.stats.binned_statistic_dd.
     This method automatically sets the range, changes the scipy defaults,
     and outputs the grids and centers for plotting.
@@ -268,6 +536,9 @@ def bin_statistic_sonar(x, y, angle, values=None, dim=None, statistic='count',
         Whether to center the sonars so the first segment is centered around zero (True)
         or starts at zero (False). Centering shifts the angles by half the
         width of the first segment.
+    binnumber_dtype : numpy dtype, default None
+        The signed integer dtype of the binnumber, e.g. numpy.int32 or numpy.int16
+        to reduce the memory for many points. If None, uses numpy.intp (int64).
     Returns
     -------
     bin_statistic : dict.
@@ -324,6 +595,7 @@ def bin_statistic_sonar(x, y, angle, values=None, dim=None, statistic='count',
         else:
             pitch_range = [[dim.left, dim.right], [dim.bottom, dim.top], [0, 2 * np.pi]]
 
+    from scipy.stats import binned_statistic_dd
     (statistic, bin_edges,
      binnumber) = binned_statistic_dd([x, y, angle], values, statistic=statistic,
                                       bins=bins, range=pitch_range,
@@ -368,6 +640,8 @@ def bin_statistic_sonar(x, y, angle, values=None, dim=None, statistic='count',
     angle_grid = angle_grid[:-1]
 
     inside = np.logical_and(~mask_x_out, ~mask_y_out)
+    binnumber = binnumber.astype(_binnumber_dtype(binnumber_dtype, max(num_x, num_y, num_angle)),
+                                 copy=False)
     stats = asdict(BinnedStatisticResult(statistic, x_grid, y_grid,
                                          cx, cy, binnumber=binnumber,
                                          inside=inside, angle_grid=angle_grid,
@@ -588,6 +862,7 @@ def zone_statistic_from_binnumber(binnumber, values=None, statistic='count',
     if values.size != binnumber.size:
         raise ValueError('binnumber and values must be the same size')
     inside = binnumber >= 0
+    from scipy.stats import binned_statistic
     stat, _, _ = binned_statistic(binnumber[inside], values[inside], statistic=statistic,
                                   bins=num_zones, range=(-0.5, num_zones - 0.5))
     count = np.bincount(binnumber[inside], minlength=num_zones)
@@ -611,7 +886,8 @@ def zone_statistic_from_binnumber(binnumber, values=None, statistic='count',
 
 
 def bin_statistic_zones(x, y, zones, dim=None, values=None, statistic='count',
-                        normalize=False, standardized=False, names=None, edge_tol=None):
+                        normalize=False, standardized=False, names=None, edge_tol=None,
+                        standardizer=None, binnumber_dtype=None):
     """ Calculates statistics for zones: any tiling of the pitch by rectangles.
 
     Unlike bin_statistic, the zones do not have to form a regular grid:
@@ -653,6 +929,15 @@ def bin_statistic_zones(x, y, zones, dim=None, values=None, statistic='count',
         The absolute tolerance for merging zone edges that differ only by
         floating point noise into one shared edge. The default None uses
         a scale-aware tolerance of max(abs(pitch extent)) * 1e-9.
+    standardizer : mplsoccer.Standardizer, default None
+        If given, the raw x, y values (in the standardizer's pitch_from coordinates)
+        are binned as if they were standardized first with ``standardizer.transform``.
+        The zones are in the pitch_to coordinates and are converted to the
+        pitch_from coordinates instead of transforming every point. The patches,
+        centres and areas are in the pitch_from coordinates.
+    binnumber_dtype : numpy dtype, default None
+        The signed integer dtype of the binnumber, e.g. numpy.int32 or numpy.int16
+        to reduce the memory for many points. If None, uses numpy.intp (int64).
 
     Returns
     -------
@@ -676,13 +961,19 @@ def bin_statistic_zones(x, y, zones, dim=None, values=None, statistic='count',
     >>> stats = pitch.bin_statistic_zones(x, y, zones)
     >>> pc = pitch.heatmap_zones(stats, edgecolors='black', cmap='hot', ax=ax)
     """
-    x = np.ravel(x).astype(float)
-    y = np.ravel(y).astype(float)
+    x = _ravel_float(x)
+    y = _ravel_float(y)
     if x.size != y.size:
         raise ValueError('x and y must be the same size')
     statistic = _nan_safe(statistic)
     if (values is None) & (statistic != 'count'):
         raise ValueError('values on which to calculate the statistic are missing')
+    if standardizer is not None:
+        if standardized:
+            raise ValueError('standardized and standardizer can not be used together')
+        dim = _standardizer_dim(dim, standardizer)
+        zones = _standardizer_zones(zones, standardizer, edge_tol)
+        x, y = _clip_to_pitch(x, y, dim)
     if standardized:
         extent = np.asarray(dim.standardized_extent, dtype=float)
     else:
@@ -699,6 +990,7 @@ def bin_statistic_zones(x, y, zones, dim=None, values=None, statistic='count',
     else:
         y_bin_edges = y_edges
         cell_zone_binning = cell_zone
+    from scipy.stats import binned_statistic_2d
     # values are ignored by 'count' (second x is a placeholder to satisfy scipy)
     _, _, _, fine_binnumber = binned_statistic_2d(x, y, x, statistic='count',
                                                   bins=[x_edges, y_bin_edges],
@@ -707,7 +999,7 @@ def bin_statistic_zones(x, y, zones, dim=None, values=None, statistic='count',
     num_y = len(y_bin_edges) - 1
     inside = ((fine_binnumber[0] >= 1) & (fine_binnumber[0] <= num_x) &
               (fine_binnumber[1] >= 1) & (fine_binnumber[1] <= num_y))
-    binnumber = np.full(x.size, -1, dtype=int)
+    binnumber = np.full(x.size, -1, dtype=_binnumber_dtype(binnumber_dtype, len(snapped)))
     binnumber[inside] = cell_zone_binning[fine_binnumber[1][inside] - 1,
                                           fine_binnumber[0][inside] - 1]
     patches = [Rectangle((x0, y0), x1 - x0, y1 - y0) for x0, x1, y0, y1 in snapped]
@@ -852,6 +1144,7 @@ def zone_sonar_from_binnumber(binnumber, angle, values=None, statistic='count',
         raise ValueError('binnumber and values must be the same size')
     angle, first_width = _center_angles(angle, angle_bins, center)
     inside = result['inside']
+    from scipy.stats import binned_statistic_2d
     stat, _, angle_edge, _ = binned_statistic_2d(binnumber[inside], angle[inside],
                                                  values[inside], statistic=statistic,
                                                  bins=[num_zones, angle_bins],
@@ -871,7 +1164,7 @@ def zone_sonar_from_binnumber(binnumber, angle, values=None, statistic='count',
 def bin_statistic_sonar_zones(x, y, angle, zones, dim=None, values=None,
                               statistic='count', angle_bins=10, normalize=False,
                               standardized=False, names=None, edge_tol=None,
-                              center=True):
+                              center=True, binnumber_dtype=None):
     """ Calculates sonar statistics (angle segments per zone) for zones.
 
     Each point is assigned to a zone and the angles are binned within each zone.
@@ -914,6 +1207,9 @@ def bin_statistic_sonar_zones(x, y, angle, zones, dim=None, values=None,
         Whether to center the sonars so the first segment is centered around zero (True)
         or starts at zero (False). Centering shifts the angles by half the
         width of the first segment.
+    binnumber_dtype : numpy dtype, default None
+        The signed integer dtype of the binnumber, e.g. numpy.int32 or numpy.int16
+        to reduce the memory for many points. If None, uses numpy.intp (int64).
 
     Returns
     -------
@@ -947,7 +1243,8 @@ def bin_statistic_sonar_zones(x, y, angle, zones, dim=None, values=None,
     if x.size != angle.size:
         raise ValueError('x and angle must be the same size')
     zone_stats = bin_statistic_zones(x, y, zones, dim=dim, standardized=standardized,
-                                     names=names, edge_tol=edge_tol)
+                                     names=names, edge_tol=edge_tol,
+                                     binnumber_dtype=binnumber_dtype)
     return zone_sonar_from_binnumber(zone_stats['binnumber'], angle, values=values,
                                      statistic=statistic, angle_bins=angle_bins,
                                      patches=zone_stats['patches'],
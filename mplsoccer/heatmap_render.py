@@ -0,0 +1,266 @@
+""" A module for rendering heatmaps directly to RGBA arrays or PNG bytes
+without creating a matplotlib figure, e.g. for serving heatmap thumbnails from a web API."""
+
+import copy
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
+from PIL import Image
+
+__all__ = ['heatmap_image', 'heatmap_png']
+
+# pre-rendered pitch layers and zone lookups keyed by the pitch and image size
+_CACHE = OrderedDict()
+_CACHE_SIZE = 64
+# heatmaps can be rendered from several threads, e.g. in a web server
+_CACHE_LOCK = threading.Lock()
+
+
+def _cached(key, func):
+    """ Get the value from the cache, calculating it with func() if missing.
+    The value is calculated outside the lock, so two threads may both calculate it."""
+    with _CACHE_LOCK:
+        if key in _CACHE:
+            _CACHE.move_to_end(key)
+            return _CACHE[key]
+    value = func()
+    with _CACHE_LOCK:
+        _CACHE[key] = value
+        if len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return value
+
+
+def _image_size(pitch, width, height):
+    if width is None and height is None:
+        raise TypeError('Invalid argument: width and height cannot both be None.')
+    if height is None:
+        height = width / pitch.ax_aspect
+    elif width is None:
+        width = height * pitch.ax_aspect
+    return max(int(round(width)), 1), max(int(round(height)), 1)
+
+
+def _render_pitch(pitch, width, height):
+    """ Render the pitch with matplotlib to an RGBA array of exactly width x height pixels."""
+    dpi = 100
+    # the small offset stops the figure size rounding down to one pixel less
+    fig = Figure(figsize=((width + 0.01) / dpi, (height + 0.01) / dpi), dpi=dpi,
+                 facecolor='none')
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    pitch.draw(ax=ax)
+    # fill the image even if the width and height do not match the pitch aspect
+    ax.set_aspect('auto')
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())[:height, :width].copy()
+
+
+def _pitch_layers(pitch, width, height):
+    """ The cached pitch background and a transparent markings-only overlay."""
+    def render():
+        background = _render_pitch(pitch, width, height)
+        markings_pitch = copy.copy(pitch)
+        markings_pitch.pitch_color = 'none'
+        markings_pitch.stripe = False
+        markings_pitch.shade_middle = False
+        markings = _render_pitch(markings_pitch, width, height)
+        return background, markings
+    return _cached(('pitch', repr(pitch), width, height), render)
+
+
+def _pixel_coordinates(pitch, width, height):
+    """ The pitch coordinates of the pixel centers for the columns and rows of the image."""
+    xmin, xmax, ymin, ymax = np.asarray(pitch.extent, dtype=float)
+    # the first row is the top of the axes (ylim[1])
+    columns = xmin + (np.arange(width) + 0.5) / width * (xmax - xmin)
+    rows = ymax + (np.arange(height) + 0.5) / height * (ymin - ymax)
+    return columns, rows
+
+
+def _bin_index(coords, edges):
+    """ The bin index of each coordinate and whether it is inside the edges."""
+    n_bins = edges.size - 1
+    descending = edges[0] > edges[-1]
+    if descending:
+        edges = edges[::-1]
+    index = np.searchsorted(edges, coords, side='right') - 1
+    # include the last edge in the last bin
+    index[coords == edges[-1]] = n_bins - 1
+    inside = (index >= 0) & (index < n_bins)
+    if descending:
+        index = n_bins - 1 - index
+    return np.where(inside, index, 0), inside
+
+
+def _grid_values(stats, pitch, width, height):
+    statistic = np.asarray(stats['statistic'], dtype=float)
+    if statistic.ndim != 2:
+        raise ValueError('stats must be the result of bin_statistic or bin_statistic_zones.')
+    columns, rows = _pixel_coordinates(pitch, width, height)
+    x, y = (rows[:, None], columns[None, :]) if pitch.vertical else (columns[None, :],
+                                                                     rows[:, None])
+    xindex, xinside = _bin_index(x, np.asarray(stats['x_grid'], dtype=float)[0, :])
+    yindex, yinside = _bin_index(y, np.asarray(stats['y_grid'], dtype=float)[:, 0])
+    return np.where(xinside & yinside, statistic[yindex, xindex], np.nan)
+
+
+def _zone_index(stats, pitch, width, height):
+    """ The zone of each pixel (-1 outside the zones), cached for each zone layout."""
+    if stats['patches'] is None:
+        raise ValueError('stats must contain the zone patches to render the zones.')
+    paths = [patch.get_path().transformed(patch.get_patch_transform())
+             for patch in stats['patches']]
+
+    def zone_index():
+        columns, rows = _pixel_coordinates(pitch, width, height)
+        x, y = np.meshgrid(columns, rows)
+        if pitch.vertical:
+            x, y = y, x
+        points = np.column_stack([x.ravel(), y.ravel()])
+        index = np.full(points.shape[0], -1)
+        for zone, path in enumerate(paths):
+            index[path.contains_points(points)] = zone
+        return index.reshape(height, width)
+    key = ('zones', repr(pitch), width, height,
+           tuple(path.vertices.tobytes() for path in paths))
+    return _cached(key, zone_index)
+
+
+def _zone_values(stats, pitch, width, height):
+    index = _zone_index(stats, pitch, width, height)
+    statistic = np.append(np.asarray(stats['statistic'], dtype=float), np.nan)
+    # -1 selects the appended NaN
+    return statistic[index]
+
+
+def heatmap_image(stats, pitch, width=200, height=None, cmap=None, vmin=None, vmax=None,
+                  norm=None, alpha=1, background=True, markings=True):
+    """ Render a heatmap to an RGBA array without creating a matplotlib figure.
+
+    The heatmap is colored with numpy and composited with Pillow over a cached
+    pitch background and under a cached transparent pitch markings overlay.
+    The pitch layers are rendered with matplotlib once per pitch and image size,
+    so subsequent heatmaps of the same size skip matplotlib entirely.
+
+    Parameters
+    ----------
+    stats : dict or list of dict
+        The result of bin_statistic, bin_statistic_zones or bin_statistic_positional.
+        A list of results is drawn in order.
+    pitch : mplsoccer pitch, e.g. mplsoccer.Pitch or mplsoccer.VerticalPitch
+        The pitch used to calculate the stats.
+    width, height : int, default 200 and None
+        The image size in pixels. If one is None, it is calculated from the pitch aspect ratio.
+    cmap : str or matplotlib.colors.Colormap, default None
+        The colormap. If None, uses rcParams['image.cmap'].
+    vmin, vmax : float, default None
+        The data range of the colormap. If None, the range of the statistic is used.
+    norm : matplotlib.colors.Normalize, default None
+        The normalization of the statistic. If given, vmin and vmax are ignored.
+    alpha : float, default 1
+        The transparency of the heatmap.
+    background : bool, default True
+        Whether to draw the pitch background (pitch color, stripes etc.) under the heatmap.
+        If False, the image is transparent outside the heatmap.
+    markings : bool, default True
+        Whether to draw the pitch markings over the heatmap.
+
+    Returns
+    -------
+    image : numpy.ndarray
+        An array of shape (height, width, 4) with dtype uint8.
+
+    Examples
+    --------
+    >>> from mplsoccer import Pitch, heatmap_image
+    >>> import numpy as np
+    >>> pitch = Pitch()
+    >>> x = np.random.uniform(low=0, high=120, size=100)
+    >>> y = np.random.uniform(low=0, high=80, size=100)
+    >>> stats = pitch.bin_statistic(x, y)
+    >>> image = heatmap_image(stats, pitch, width=200, cmap='hot')
+    """
+    width, height = _image_size(pitch, width, height)
+    stats = stats if isinstance(stats, list) else [stats]
+    cmap = colormaps.get_cmap(cmap)
+    values = [_zone_values(bin_stat, pitch, width, height) if 'patches' in bin_stat
+              else _grid_values(bin_stat, pitch, width, height) for bin_stat in stats]
+    values = np.ma.masked_invalid(np.stack(values))
+    if norm is None:
+        norm = Normalize(vmin, vmax)
+    # scale to all the bins like heatmap, including bins hidden by the pitch extent
+    norm.autoscale_None(np.ma.masked_invalid(np.concatenate(
+        [np.ravel(bin_stat['statistic']).astype(float) for bin_stat in stats])))
+
+    background_layer, markings_layer = _pitch_layers(pitch, width, height)
+    if background:
+        image = Image.fromarray(background_layer, 'RGBA')
+    else:
+        image = Image.new('RGBA', (width, height))
+    for layer in values:
+        rgba = cmap(norm(layer), alpha=alpha, bytes=True)
+        rgba[np.ma.getmaskarray(layer)] = 0
+        image = Image.alpha_composite(image, Image.fromarray(rgba, 'RGBA'))
+    if markings:
+        image = Image.alpha_composite(image, Image.fromarray(markings_layer, 'RGBA'))
+    return np.asarray(image)
+
+
+def heatmap_png(stats, pitch, width=200, height=None, cmap=None, vmin=None, vmax=None,
+                norm=None, alpha=1, background=True, markings=True, compress_level=6):
+    """ Render a heatmap to PNG bytes without creating a matplotlib figure.
+
+    See heatmap_image for the rendering. The PNG is encoded with Pillow.
+
+    Parameters
+    ----------
+    stats : dict or list of dict
+        The result of bin_statistic, bin_statistic_zones or bin_statistic_positional.
+        A list of results is drawn in order.
+    pitch : mplsoccer pitch, e.g. mplsoccer.Pitch or mplsoccer.VerticalPitch
+        The pitch used to calculate the stats.
+    width, height : int, default 200 and None
+        The image size in pixels. If one is None, it is calculated from the pitch aspect ratio.
+    cmap : str or matplotlib.colors.Colormap, default None
+        The colormap. If None, uses rcParams['image.cmap'].
+    vmin, vmax : float, default None
+        The data range of the colormap. If None, the range of the statistic is used.
+    norm : matplotlib.colors.Normalize, default None
+        The normalization of the statistic. If given, vmin and vmax are ignored.
+    alpha : float, default 1
+        The transparency of the heatmap.
+    background : bool, default True
+        Whether to draw the pitch background (pitch color, stripes etc.) under the heatmap.
+        If False, the image is transparent outside the heatmap.
+    markings : bool, default True
+        Whether to draw the pitch markings over the heatmap.
+    compress_level : int, default 6
+        The zlib compression level from 0 (fastest) to 9 (smallest).
+
+    Returns
+    -------
+    png : bytes
+
+    Examples
+    --------
+    >>> from mplsoccer import Pitch, heatmap_png
+    >>> import numpy as np
+    >>> pitch = Pitch()
+    >>> x = np.random.uniform(low=0, high=120, size=100)
+    >>> y = np.random.uniform(low=0, high=80, size=100)
+    >>> stats = pitch.bin_statistic(x, y)
+    >>> png = heatmap_png(stats, pitch, width=200, cmap='hot')
+    """
+    image = heatmap_image(stats, pitch, width=width, height=height, cmap=cmap, vmin=vmin,
+                          vmax=vmax, norm=norm, alpha=alpha, background=background,
+                          markings=markings)
+    buffer = io.BytesIO()
+    Image.fromarray(image, 'RGBA').save(buffer, format='png', compress_level=compress_level)
+    return buffer.getvalue()
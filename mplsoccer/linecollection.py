@@ -15,6 +15,11 @@ from .utils import validate_ax
 
 __all__ = ['lines']
 
+# the on-screen length (in points) of each segment for n_segments='auto'
+_AUTO_SEGMENT_LENGTH = 3
+_MIN_AUTO_SEGMENTS = 5
+_MAX_AUTO_SEGMENTS = 100
+
 
 def lines(xstart, ystart, xend, yend, color=None, n_segments=100, comet=False, transparent=False,
           alpha_start=0.01, alpha_end=1, cmap=None, ax=None, vertical=False,
@@ -33,9 +38,12 @@ def lines(xstart, ystart, xend, yend, color=None, n_segments=100, comet=False, t
     color : A matplotlib color or sequence of colors, defaults to None.
         Defaults to None. In that case the marker color is determined
         by the value rcParams['lines.color']
-    n_segments : int, default 100
+    n_segments : int or 'auto', default 100
         If comet=True or transparent=True this is used to split the line
         into n_segments of increasing width/opacity.
+        If 'auto', the number of segments is adapted to the on-screen length of each line
+        (about one segment per 3 points, with between 5 and 100 segments).
+        This uses far fewer segments for maps with many short lines, e.g. pass maps.
     comet : bool default False
         Whether to plot the lines increasing in width.
     transparent : bool, default False
@@ -95,6 +103,8 @@ def lines(xstart, ystart, xend, yend, color=None, n_segments=100, comet=False, t
         warnings.warn("lines method takes 'color' as an argument, 'colors' in ignored")
     if color is not None and cmap is not None:
         raise ValueError("Only use one of color or cmap arguments not both.")
+    if not (n_segments == 'auto' or isinstance(n_segments, (int, np.integer))):
+        raise TypeError("Invalid argument: n_segments should be an int or 'auto'.")
     if 'lw' in kwargs and 'linewidth' in kwargs:
         raise TypeError("lines got multiple values for 'linewidth' argument (linewidth and lw).")
 
@@ -131,21 +141,29 @@ def lines(xstart, ystart, xend, yend, color=None, n_segments=100, comet=False, t
     if vertical:
         ystart, xstart = xstart, ystart
         yend, xend = xend, yend
+    multi_segment = transparent is not False or comet is not False or cmap is not None
+    if n_segments == 'auto':
+        n_segments = (_auto_segment_counts(xstart, ystart, xend, yend, ax) if multi_segment
+                      else _MAX_AUTO_SEGMENTS)
+    # the position of each segment along its line from zero to one
+    segment_position = (_segment_position(n_segments) if np.ndim(n_segments)
+                        else np.linspace(0, 1, n_segments))
     if comet:
-        lw = np.linspace(1, lw, n_segments)
+        lw = 1 + (lw - 1) * segment_position
         handler_first_lw = False
     else:
         handler_first_lw = True
-    multi_segment = transparent is not False or comet is not False or cmap is not None
     if transparent:
-        cmap = create_transparent_cmap(color, cmap, n_segments, alpha_start, alpha_end)
+        cmap = create_transparent_cmap(color, cmap, int(np.max(n_segments)),
+                                       alpha_start, alpha_end)
     if isinstance(cmap, str):
         cmap = colormaps.get_cmap(cmap)
     if cmap is not None:
         handler_cmap = True
         line_collection = _lines_cmap(xstart, ystart, xend, yend, lw=lw, cmap=cmap, ax=ax,
                                       n_segments=n_segments, multi_segment=multi_segment,
-                                      reverse_cmap=reverse_cmap, **kwargs)
+                                      reverse_cmap=reverse_cmap,
+                                      segment_position=segment_position, **kwargs)
 
     else:
         handler_cmap = False
@@ -153,15 +171,48 @@ def lines(xstart, ystart, xend, yend, color=None, n_segments=100, comet=False, t
                                          ax=ax, n_segments=n_segments,
                                          multi_segment=multi_segment, **kwargs)
 
-    line_collection_handler = HandlerLines(numpoints=n_segments, invert_y=reverse_cmap,
+    line_collection_handler = HandlerLines(numpoints=int(np.max(n_segments)), invert_y=reverse_cmap,
                                            first_lw=handler_first_lw, use_cmap=handler_cmap)
 
     Legend.update_default_handler_map({LineCollection: line_collection_handler})
     return line_collection
 
 
+def _auto_segment_counts(xstart, ystart, xend, yend, ax):
+    """ The number of segments for each line based on its length on-screen in points."""
+    start = ax.transData.transform(np.column_stack([xstart, ystart]))
+    end = ax.transData.transform(np.column_stack([xend, yend]))
+    length = np.hypot(*(end - start).T) * 72 / ax.figure.dpi
+    length = np.nan_to_num(length, nan=0, posinf=0)
+    return np.clip(np.ceil(length / _AUTO_SEGMENT_LENGTH), _MIN_AUTO_SEGMENTS,
+                   _MAX_AUTO_SEGMENTS).astype(int)
+
+
+def _segment_index(n_segments):
+    """ The index of each segment within its line
+    for lines split into differing numbers of segments."""
+    first_segment = np.repeat(np.cumsum(n_segments) - n_segments, n_segments)
+    return np.arange(first_segment.size) - first_segment
+
+
+def _segment_position(n_segments):
+    """ The position (zero to one) of each segment along its line."""
+    return _segment_index(n_segments) / np.repeat(n_segments - 1, n_segments)
+
+
 def _create_segments(xstart, ystart, xend, yend, n_segments=100, multi_segment=False):
-    if multi_segment:
+    if multi_segment and np.ndim(n_segments):
+        # a different number of segments for each line
+        line = np.repeat(np.arange(xstart.size), n_segments)
+        line_segments = n_segments[line]
+        index = _segment_index(n_segments)
+        # each segment is three points long so the segments overlap and join smoothly
+        fraction = np.column_stack([index, index + 1,
+                                    np.minimum(index + 2, line_segments)]) / line_segments[:, None]
+        x = xstart[line, None] + fraction * (xend - xstart)[line, None]
+        y = ystart[line, None] + fraction * (yend - ystart)[line, None]
+        segments = np.stack([x, y], axis=-1)
+    elif multi_segment:
         x = np.linspace(xstart, xend, n_segments + 1)
         y = np.linspace(ystart, yend, n_segments + 1)
         points = np.array([x, y]).T
@@ -189,7 +240,8 @@ def _lines_no_cmap(xstart, ystart, xend, yend, lw=None, color=None, ax=None,
 
 
 def _lines_cmap(xstart, ystart, xend, yend, lw=None, cmap=None, ax=None,
-                n_segments=100, multi_segment=False, reverse_cmap=False, **kwargs):
+                n_segments=100, multi_segment=False, reverse_cmap=False,
+                segment_position=None, **kwargs):
     segments = _create_segments(xstart, ystart, xend, yend,
                                 n_segments=n_segments, multi_segment=multi_segment)
     if reverse_cmap:
@@ -197,7 +249,9 @@ def _lines_cmap(xstart, ystart, xend, yend, lw=None, cmap=None, ax=None,
     line_collection = LineCollection(segments, cmap=cmap, linewidth=lw, snap=False, **kwargs)
     line_collection = ax.add_collection(line_collection)
     extent = ax.get_ylim()
-    pitch_array = np.linspace(extent[0], extent[1], n_segments)
+    if segment_position is None:
+        segment_position = np.linspace(0, 1, n_segments)
+    pitch_array = extent[0] + (extent[1] - extent[0]) * segment_position
     line_collection.set_array(pitch_array)
     return line_collection
 
@@ -224,6 +278,9 @@ class HandlerLines(HandlerLineCollection):
         lw = artist.get_linewidth()
         if self.first_lw:
             lw = lw[0]
+        else:
+            # comet lines increase in width
+            lw = np.linspace(np.min(lw), np.max(lw), self.get_numpoints(legend))
         if self.use_cmap:
             cmap = artist.cmap
             if self.invert_y:
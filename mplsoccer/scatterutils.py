@@ -4,37 +4,45 @@ generic markers and a function to rotate markers."""
 # Authors: Andrew Rowlinson, https://twitter.com/numberstorm
 # License: MIT
 
+import weakref
+
 import matplotlib.markers as mmarkers
 import matplotlib.path as mpath
 import numpy as np
+from matplotlib import rcParams
 
-__all__ = ['scatter_rotation', 'arrowhead_marker']
+__all__ = ['scatter_rotation', 'rotate_markers', 'arrowhead_marker']
 
 arrowhead_marker = mpath.Path(np.array([[0., 1.], [-1., -1.], [0., -0.4], [1., -1.], [0., 1.]]),
                               np.array([1, 2, 2, 2, 79], dtype=np.uint8))
 
+# the marker path and orientation of each scatter plotted with scatter_rotation,
+# which are used by rotate_markers. The entries are removed with the scatter.
+_ROTATED_MARKERS = weakref.WeakKeyDictionary()
 
-def _mscatter(x, y, markers=None, ax=None, **kwargs):
-    """ Helper function to allow rotation of scatter points."""
-    # based on:
-    # https://stackoverflow.com/questions/52303660/iterating-markers-in-plots/52303895#52303895
-    scatter_plot = ax.scatter(x, y, **kwargs)
-    if markers is not None:
-        paths = []
-        for marker in markers:
-            if isinstance(marker, mmarkers.MarkerStyle):
-                marker_obj = marker
-            else:
-                marker_obj = mmarkers.MarkerStyle(marker)
-            path = marker_obj.get_path().transformed(marker_obj.get_transform())
-            paths.append(path)
-        scatter_plot.set_paths(paths)
-    return scatter_plot
+
+def _rotated_vertices(path, rotation_degrees, vertical=False):
+    """ Rotate the path vertices by each of rotation_degrees clockwise in a single batch.
+
+    Returns an array of shape (len(rotation_degrees), number of vertices, 2).
+    """
+    rotation_degrees = np.ma.filled(np.ma.ravel(rotation_degrees).astype(float), np.nan)
+    # rotated counterclockwise - this makes it clockwise with zero facing the direction of play
+    # if horizontal rotate by 90 degrees so 0 degrees is this way →
+    radians = np.radians(- rotation_degrees if vertical else - rotation_degrees - 90)
+    cos = np.cos(radians)
+    sin = np.sin(radians)
+    # rotation matrices for row vectors with shape (N, 2, 2)
+    rotation = np.stack([np.stack([cos, sin], axis=-1), np.stack([-sin, cos], axis=-1)], axis=-2)
+    return np.matmul(path.vertices, rotation)
 
 
 def scatter_rotation(x, y, rotation_degrees, marker=None, ax=None, vertical=False, **kwargs):
     """ Scatter plot with points rotated by rotation_degrees clockwise.
 
+    The marker path is created once and rotated for all points in a single batch.
+    The rotations can be updated in place with rotate_markers, e.g. for animations.
+
     Parameters
     ----------
     x, y : array-like or scalar.
@@ -60,15 +68,55 @@ def scatter_rotation(x, y, rotation_degrees, marker=None, ax=None, vertical=Fals
     rotation_degrees = np.ma.ravel(rotation_degrees)
     if x.size != rotation_degrees.size:
         raise ValueError("x and rotation_degrees must be the same size")
-    # rotated counterclockwise - this makes it clockwise with zero facing the direction of play
-    rotation_degrees = - rotation_degrees
-    # if horizontal rotate by 90 degrees so 0 degrees is this way →
-    if vertical is False:
-        rotation_degrees = rotation_degrees - 90
-    markers = []
-    for degrees in rotation_degrees:
-        marker_style = mmarkers.MarkerStyle(marker=marker)
-        marker_style._transform = marker_style.get_transform().rotate_deg(degrees)
-        markers.append(marker_style)
-
-    return _mscatter(x, y, markers=markers, ax=ax, **kwargs)
+    scatter_plot = ax.scatter(x, y, **kwargs)
+    if marker is None:
+        marker = rcParams['scatter.marker']
+    marker_style = (marker if isinstance(marker, mmarkers.MarkerStyle)
+                    else mmarkers.MarkerStyle(marker))
+    path = marker_style.get_path().transformed(marker_style.get_transform())
+    _ROTATED_MARKERS[scatter_plot] = (path, vertical)
+    _set_rotated_paths(scatter_plot, path, _rotated_vertices(path, rotation_degrees,
+                                                             vertical=vertical))
+    return scatter_plot
+
+
+def _set_rotated_paths(scatter_plot, path, vertices):
+    scatter_plot.set_paths([mpath.Path(marker_vertices, path.codes)
+                            for marker_vertices in vertices])
+
+
+def rotate_markers(paths, rotation_degrees):
+    """ Update the rotation of markers plotted with scatter_rotation in place.
+
+    This is faster than plotting a new scatter for each frame of an animation, as the
+    marker path is rotated for all the markers in a single batch.
+    Combine with set_offsets to move the markers.
+
+    Parameters
+    ----------
+    paths : matplotlib.collections.PathCollection
+        A scatter plotted with scatter_rotation (or Pitch.scatter with rotation_degrees).
+    rotation_degrees: array-like or scalar.
+        Rotates the marker in degrees, clockwise. 0 degrees is facing the direction of play.
+        The orientation (vertical or horizontal) is the same as when the markers were plotted.
+
+    Returns
+    -------
+    paths : matplotlib.collections.PathCollection
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mplsoccer import Pitch, rotate_markers
+    >>> pitch = Pitch()
+    >>> fig, ax = pitch.draw()
+    >>> x = np.random.uniform(0, 120, 22)
+    >>> y = np.random.uniform(0, 80, 22)
+    >>> sc = pitch.scatter(x, y, rotation_degrees=np.zeros(22), marker='^', s=200, ax=ax)
+    >>> sc = rotate_markers(sc, np.random.uniform(0, 360, 22))
+    """
+    if paths not in _ROTATED_MARKERS:
+        raise TypeError('Invalid argument: paths should be created by scatter_rotation.')
+    path, vertical = _ROTATED_MARKERS[paths]
+    _set_rotated_paths(paths, path, _rotated_vertices(path, rotation_degrees, vertical=vertical))
+    return paths
@@ -1,20 +1,37 @@
 """ Base class for drawing the soccer/ football pitch."""
 
+import copy
 import warnings
 from abc import abstractmethod
 from typing import List
 
 import numpy as np
-import pandas as pd
 from matplotlib import rcParams
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.path import Path
+from matplotlib.spines import Spine
 
 from .dimensions import Standardizer, create_pitch_dims, BaseSoccerDims, valid, size_varies
 from .markers import scatter_football
 from .heatmap import bin_statistic_positional, heatmap_positional, positional_zones
 from .._pitch_base import BasePitch
 from ..cm import grass_cmap
-from ..utils import validate_ax, copy_doc
+from ..utils import validate_ax, copy_doc, get_aspect
 from ..scatterutils import scatter_rotation
+from ..text import text_collection
+
+# the coordinates of a position, ordered so that [:, 2 * half + flip] selects the variant
+_COORDINATES = ['x', 'y', 'x_flip', 'y_flip', 'x_half', 'y_half', 'x_half_flip', 'y_half_flip']
+
+
+def _position_coordinates(formation_positions):
+    """ The coordinates of the positions as an array of shape (n_positions, 4, 2)."""
+    return np.array([[getattr(position, attr) for attr in _COORDINATES]
+                     for position in formation_positions], dtype=float).reshape(-1, 4, 2)
 
 
 class BasePitchSoccer(BasePitch):
@@ -111,6 +128,12 @@ class BasePitchSoccer(BasePitch):
         Whether to include the axis ticks.
     corner_arcs : bool, default False
         Whether to include corner arcs.
+    rasterize_threshold : int, default None
+        If not None, the data layers plotted with scatter, lines, arrows, kdeplot, hexbin and
+        heatmap are rasterized (rasterized=True) when they have more than rasterize_threshold
+        elements, so vector exports (PDF/ SVG) of large datasets stay small and fast.
+        The pitch markings and text stay as vectors. The rasterized layers are recorded
+        in the rasterized_layers attribute.
     """
     def __init__(self, pitch_type='statsbomb', half=False,
                  pitch_color=None, line_color=None, line_alpha=1, linewidth=2,
@@ -122,7 +145,8 @@ class BasePitchSoccer(BasePitch):
                  shade_middle=False, shade_color='#f2f2f2', shade_alpha=1, shade_zorder=0.7,
                  pitch_length=None, pitch_width=None,
                  goal_type='line', goal_alpha=1, goal_linestyle=None,
-                 axis=False, label=False, tick=False, corner_arcs=False):
+                 axis=False, label=False, tick=False, corner_arcs=False,
+                 rasterize_threshold=None):
 
         # set pitch dimensions
         if issubclass(type(pitch_type), BaseSoccerDims):
@@ -140,6 +164,7 @@ class BasePitchSoccer(BasePitch):
                          shade_alpha=shade_alpha, shade_zorder=shade_zorder,
                          pitch_length=pitch_length, pitch_width=pitch_width,
                          axis=axis, label=label, tick=tick,
+                         rasterize_threshold=rasterize_threshold,
                          )
         self.spot_scale = spot_scale
         self.spot_type = spot_type
@@ -168,6 +193,8 @@ class BasePitchSoccer(BasePitch):
                                          pitch_to='custom',
                                          width_to=68 if pitch_width is None else pitch_width,
                                          length_to=105 if pitch_length is None else pitch_length)
+        # the formation and position lookup table, created on first use
+        self._formation_table = None
 
         # set the positions of the goal posts
         self.goal_left = np.array([[self.dim.left, self.dim.goal_bottom],
@@ -266,11 +293,13 @@ class BasePitchSoccer(BasePitch):
             raise NotImplementedError("rotated football markers are not implemented.")
 
         if marker == 'football':
-            return scatter_football(x, y, ax=ax, **kwargs)
-        if rotation_degrees is not None:
-            return scatter_rotation(x, y, rotation_degrees, marker=marker,
-                                    vertical=self.vertical, ax=ax, **kwargs)
-        return ax.scatter(x, y, marker=marker, **kwargs)
+            scatter = scatter_football(x, y, ax=ax, **kwargs)
+        elif rotation_degrees is not None:
+            scatter = scatter_rotation(x, y, rotation_degrees, marker=marker,
+                                       vertical=self.vertical, ax=ax, **kwargs)
+        else:
+            scatter = ax.scatter(x, y, marker=marker, **kwargs)
+        return self._rasterize_layer('scatter', scatter, x.size, kwargs)
 
     def _validation_checks(self):
         # pitch validation
@@ -516,15 +545,16 @@ class BasePitchSoccer(BasePitch):
         return list(self.dim.formations.keys())
 
     @property
-    def formations_dataframe(self) -> pd.DataFrame:
+    def formations_dataframe(self) -> 'pd.DataFrame':
         """ Return a dataframe of mplsoccer formations, positions and coordinates."""
+        import pandas as pd
         return pd.concat(
             [pd.DataFrame([formation.__dict__ for formation in self.dim.formations[key]])
                  .assign(formation=key)
                  .drop('location', axis='columns')
              for key in self.dim.formations])
 
-    def get_positions(self, line=5, second_striker=True) -> pd.DataFrame:
+    def get_positions(self, line=5, second_striker=True) -> 'pd.DataFrame':
         """ Get the player positions.
 
            Parameters
@@ -544,6 +574,7 @@ class BasePitchSoccer(BasePitch):
             raise ValueError('line must be either 4 or 5')
         if not isinstance(second_striker, bool):
             raise TypeError('second_striker must be boolean')
+        import pandas as pd
         if line == 5 and second_striker:
             return pd.DataFrame({key: value.__dict__ for key, value in
                                  self.dim.position_line5_with_ss.__dict__.items()}).T
@@ -584,6 +615,112 @@ class BasePitchSoccer(BasePitch):
                 f' Currently supported formations are: {self.formations}')
         return self.dim.formations[formation]
 
+    def _position_identifiers(self, position):
+        """ The identifiers of a position for the pitch_type, e.g. the StatsBomb ids."""
+        if self.pitch_type == 'statsbomb':
+            return position.statsbomb or []
+        if self.pitch_type in ('wyscout', 'opta') and getattr(position,
+                                                              self.pitch_type) is not None:
+            return [getattr(position, self.pitch_type)]
+        return [position.name]
+
+    def _formation_lookup(self):
+        """ A lookup table from (formation, position identifier) to the coordinates.
+
+        Returns
+        -------
+        index : pandas.MultiIndex
+            The formations and position identifiers. StatsBomb positions have a row
+            for each of their position identifiers.
+        coordinates : numpy.ndarray
+            The coordinates for each row of the index with shape (n_rows, 4, 2).
+            The second dimension is the variant (normal, flip, half, half and flip).
+        """
+        if self._formation_table is None:
+            formations = []
+            identifiers = []
+            coordinates = []
+            for formation, formation_positions in self.dim.formations.items():
+                position_coordinates = _position_coordinates(formation_positions)
+                for position, position_coordinate in zip(formation_positions,
+                                                         position_coordinates):
+                    for identifier in self._position_identifiers(position):
+                        formations.append(formation)
+                        identifiers.append(identifier)
+                        coordinates.append(position_coordinate)
+            import pandas as pd
+            index = pd.MultiIndex.from_arrays([formations, identifiers])
+            self._formation_table = (index, np.stack(coordinates))
+        return self._formation_table
+
+    def formation_coordinates(self, formation, positions, flip=False, half=False):
+        """ Get the coordinates of many players from their formations and positions at once,
+        e.g. for the lineups of many matches.
+
+        The coordinates are found with a single lookup in a table of all the formations
+        and position identifiers for the pitch_type, which is created once per pitch.
+
+        Parameters
+        ----------
+        formation : str or array-like of str
+            The formation of each player, e.g. the formation column of a lineup dataframe,
+            or a single formation for all the players. The formations are normalized like
+            get_formation, so '4-4-2' and '442' are equivalent.
+        positions : array-like
+            The position identifier of each player, e.g. the position id column of a lineup
+            dataframe. See the positions argument of the formation method for the
+            identifiers of each pitch_type.
+        flip : bool or array-like of bool, default False
+            Whether to flip the positions horizontally so the direction of attack is right
+            to left. Either a single value or a value for each player.
+        half : bool or array-like of bool, default False
+            Whether to fit the positions in one half of the pitch rather than the full pitch.
+            Either a single value or a value for each player.
+
+        Returns
+        -------
+        x, y : numpy.ndarray
+            The coordinates of each player.
+
+        Examples
+        --------
+        >>> from mplsoccer import Pitch
+        >>> import pandas as pd
+        >>> pitch = Pitch()
+        >>> lineups = pd.DataFrame({'formation': ['442', '442', '4-3-3', '4-3-3'],
+        ...                         'position_id': [1, 2, 1, 23],
+        ...                         'away': [False, False, True, True]})
+        >>> x, y = pitch.formation_coordinates(lineups.formation, lineups.position_id,
+        ...                                    flip=lineups.away)
+        """
+        positions = np.ravel(np.asarray(positions, dtype=object))
+        formation = np.ravel(np.asarray(formation, dtype=str))
+        if formation.size == 1:
+            formation = np.broadcast_to(formation, positions.shape)
+        if formation.size != positions.size:
+            raise ValueError("formation and positions must be the same size")
+        flip = np.broadcast_to(np.ravel(np.asarray(flip, dtype=bool)), positions.shape)
+        half = np.broadcast_to(np.ravel(np.asarray(half, dtype=bool)), positions.shape)
+
+        # normalize each unique formation once
+        unique_formations, inverse = np.unique(formation, return_inverse=True)
+        unique_formations = np.array([value.replace('-', '').replace('0', '')
+                                      for value in unique_formations], dtype=object)
+        index, coordinates = self._formation_lookup()
+        row = index.get_indexer(type(index).from_arrays([unique_formations[inverse],
+                                                         positions]))
+        invalid = row == -1
+        if invalid.any():
+            invalid_pairs = list(dict.fromkeys(zip(formation[invalid].tolist(),
+                                                   positions[invalid].tolist())))
+            raise ValueError(
+                f'{invalid.sum()} players have a formation and position that is not supported '
+                f'for pitch_type={self.pitch_type!r}, e.g. (formation, position): '
+                f'{invalid_pairs[:5]}. For valid formations and positions see the '
+                f'formations_dataframe attribute.')
+        coordinates = coordinates[row, 2 * half + flip]
+        return coordinates[:, 0], coordinates[:, 1]
+
     def formation(self,
                   formation,
                   positions=None,
@@ -599,6 +736,7 @@ class BasePitchSoccer(BasePitch):
                   xoffset=None,
                   yoffset=None,
                   ax=None,
+                  collection=False,
                   **kwargs):
 
         """ A method to plot formations
@@ -647,6 +785,15 @@ class BasePitchSoccer(BasePitch):
             Offsets for the positions for plotting the positions off-center.
         ax : matplotlib.axes.Axes, default None
             The axis to plot on.
+        collection : bool, default False
+            Whether to draw all the players as a single collection rather than an artist
+            (or inset axes) per player. For kind='text', the text is drawn with
+            mplsoccer.text.text_collection (falling back to matplotlib.text.Text for
+            unsupported arguments like path_effects or math text). For kind='pitch', the
+            pitch markings are drawn once and copied to each position as a single
+            matplotlib.collections.PathCollection (images, e.g. pitch_color='grass',
+            are not drawn). kind='scatter' is always a single collection.
+            Not supported for kind='image' or kind='axes'.
         **kwargs : All other keyword arguments are passed on to:
 
             - Axes.scatter for kind='scatter'
@@ -669,6 +816,8 @@ class BasePitchSoccer(BasePitch):
             axes are not clipped by their parent axes.
             - matplotlib.PathCollection for kind='scatter'.
             - A list of matplotlib.Text for kind='text'.
+            - matplotlib.PathCollection for kind='pitch' or kind='text' if collection=True
+              (unless the text falls back to a list of matplotlib.Text).
 
 
         Examples
@@ -801,32 +950,27 @@ class BasePitchSoccer(BasePitch):
         if yoffset.size == 1:
             yoffset = np.tile(yoffset, len(formation_positions))
 
-        x = []
-        y = []
+        if collection and kind not in ('scatter', 'text', 'pitch'):
+            raise TypeError("Invalid argument: collection=True is only supported for "
+                            "kind='scatter', kind='text' or kind='pitch'.")
+
+        x, y = _position_coordinates(formation_positions)[:, 2 * half + flip].T
+        # map each position identifier to its index in the positions argument once
+        # rather than scanning the positions for every player
+        if positions is not None:
+            position_index = {}
+            for idx, pos in enumerate(positions):
+                position_index.setdefault(pos, []).append(idx)
         position_names = []
+        sorted_index = []
         sorted_image = []
         sorted_text = []
-        sorted_xoffset = []
-        sorted_yoffset = []
-
         for position in formation_positions:
-            if half and flip:
-                x.append(position.x_half_flip)
-                y.append(position.y_half_flip)
-            elif half:
-                x.append(position.x_half)
-                y.append(position.y_half)
-            elif flip:
-                x.append(position.x_flip)
-                y.append(position.y_flip)
-            else:
-                x.append(position.x)
-                y.append(position.y)
-
             if self.pitch_type == 'statsbomb':
-                possible_positions = set(position.statsbomb).intersection(set(positions))
+                possible_positions = [pos for pos in (position.statsbomb or [])
+                                      if pos in position_index]
                 if len(possible_positions) == 1:
-                    pos = possible_positions.pop()
+                    pos = possible_positions[0]
                 else:
                     raise ValueError(
                         f'Cannot standardize to the {formation} formation. '
@@ -835,31 +979,29 @@ class BasePitchSoccer(BasePitch):
                         f'These are either contained multiple times or no times in the list '
                         f'supplied to the positions keyword argument: {positions}.'
                     )
-            elif self.pitch_type in ('wyscout', 'opta') and getattr(position,
-                                                                    self.pitch_type) is not None:
-                pos = getattr(position, self.pitch_type)
             else:
-                pos = position.name
+                pos = self._position_identifiers(position)[0]
             position_names.append(pos)
             # find the index of the position in the original list supplied to the positions argument
             if requires_positions:
-                if (np.array(positions) == pos).sum() == 0:
+                if pos not in position_index:
                     raise ValueError(
                         f"The position identifier {pos} returned by mplsoccer is not contained in "
                         f"the positions argument: {positions}. "
                         f"For example try a list of positions from:'{possible_position_list}'"
                     )
-                position_idx = np.arange(len(positions))[np.array(positions) == pos].item()
-                if text is not None:
-                    sorted_text.append(text[position_idx])
-                if image is not None:
-                    sorted_image.append(image[position_idx])
-                sorted_xoffset.append(xoffset[position_idx])
-                sorted_yoffset.append(yoffset[position_idx])
+                if len(position_index[pos]) > 1:
+                    raise ValueError(
+                        f"The position identifier {pos} is contained multiple times in "
+                        f"the positions argument: {positions}."
+                    )
+                sorted_index.append(position_index[pos][0])
 
         if requires_positions:
-            x = np.asarray(x) + sorted_xoffset
-            y = np.asarray(y) + sorted_yoffset
+            x = x + xoffset[sorted_index]
+            y = y + yoffset[sorted_index]
+            sorted_text = [] if text is None else [text[idx] for idx in sorted_index]
+            sorted_image = [] if image is None else [image[idx] for idx in sorted_index]
 
         if requires_positions and set(position_names) != set(positions):
             raise ValueError(
@@ -883,6 +1025,9 @@ class BasePitchSoccer(BasePitch):
                 axes[position_names[i]] = self.inset_image(x[i], y[i], sorted_image[i], width=width,
                                                            height=height, ax=ax, **kwargs)
             return axes
+        if kind == 'pitch' and collection:
+            return self._formation_pitches(x[visible], y[visible], height=height, width=width,
+                                           ax=ax, **kwargs)
         if kind == 'pitch':
             axes = {}
             old_attr = {key: getattr(self, key) for key, value in kwargs.items() if
@@ -910,6 +1055,14 @@ class BasePitchSoccer(BasePitch):
                                                           aspect=aspect, polar=polar, ax=ax,
                                                           **kwargs)
             return axes
+        if kind == 'text' and collection:
+            ha = kwargs.pop('ha', kwargs.pop('horizontalalignment', 'left'))
+            va = kwargs.pop('va', kwargs.pop('verticalalignment', 'baseline'))
+            labels = list(zip(x, y, sorted_text))
+            if self._label_collection_supported(labels, ha, va, kwargs):
+                return text_collection(x, y, [str(text_str) for text_str in sorted_text],
+                                       ax=ax, vertical=self.vertical, ha=ha, va=va, **kwargs)
+            kwargs.update(ha=ha, va=va)
         if kind == 'text':
             text = []
             for i in range(len(formation_positions)):
@@ -920,12 +1073,96 @@ class BasePitchSoccer(BasePitch):
                                   "'pitch', or 'text'."
                                   )
 
+    def _formation_pitches(self, x, y, height=None, width=None, ax=None, **kwargs):
+        """ Draw mini-pitches at the x/y coordinates as a single PathCollection.
+
+        The pitch markings are drawn once on an off-screen figure and their paths are
+        scaled and translated to the same boxes as the inset axes of kind='pitch'.
+        """
+        if (height is None) == (width is None):
+            raise TypeError('Invalid argument: you must supply one of height or width')
+        # the pitch with the attributes amended by the keyword arguments
+        template = copy.copy(self)
+        template._set_multiple_attributes(kwargs)
+        paths, styles = template._pitch_marking_paths()
+
+        # the size of the pitch boxes in data coordinates like inset_axes
+        # with aspect=1 / self.ax_aspect
+        ax_aspect = ax.get_aspect()
+        if ax_aspect == 'auto':
+            ax_aspect = get_aspect(ax)
+        x, y = self._reverse_if_vertical(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        aspect = 1 / self.ax_aspect
+        if self.vertical:
+            width, height = height, width
+            aspect = 1 / aspect
+        if width is None:
+            width = height / aspect * ax_aspect
+        else:
+            height = width * aspect / ax_aspect
+        # the pitch is shrunk to fit the box keeping its aspect ratio like the inset axes
+        if width / (height * ax_aspect) > self.ax_aspect:
+            width = self.ax_aspect * height * ax_aspect
+        else:
+            height = width / (self.ax_aspect * ax_aspect)
+        # the paths are in axes fractions with the origin at the bottom-left of the screen
+        xlim, ylim = ax.get_xlim(), ax.get_ylim()
+        scale = np.array([width * np.sign(xlim[1] - xlim[0]),
+                          height * np.sign(ylim[1] - ylim[0])])
+
+        collection_paths = [Path(center + (path.vertices - 0.5) * scale, path.codes)
+                            for center in np.column_stack([x, y]) for path in paths]
+        n_pitches = x.size
+        pitches = PathCollection(collection_paths,
+                                 facecolors=np.tile(styles['facecolor'], (n_pitches, 1)),
+                                 edgecolors=np.tile(styles['edgecolor'], (n_pitches, 1)),
+                                 linewidths=np.tile(styles['linewidth'], n_pitches),
+                                 linestyles=styles['linestyle'] * n_pitches,
+                                 transform=ax.transData, zorder=5)
+        ax.add_collection(pitches, autolim=False)
+        return pitches
+
+    def _pitch_marking_paths(self):
+        """ The paths of the pitch background and markings in axes fractions and their styles,
+        in drawing order. Images (e.g. pitch_color='grass') are not included."""
+        fig = Figure()
+        ax = fig.add_subplot()
+        self.draw(ax=ax)
+        to_axes = ax.transAxes.inverted()
+        artists = [artist for artist in ax.get_children()
+                   if isinstance(artist, (Line2D, Patch)) and artist.get_visible()
+                   and artist is not ax.patch and not isinstance(artist, Spine)]
+        # a stable sort keeps the drawing order of artists with the same zorder
+        artists.sort(key=lambda artist: artist.get_zorder())
+
+        paths = [Path.unit_rectangle()]
+        styles = {'facecolor': [ax.patch.get_facecolor()], 'edgecolor': [(0, 0, 0, 0)],
+                  'linewidth': [0], 'linestyle': ['solid']}
+        for artist in artists:
+            if isinstance(artist, Line2D):
+                if artist.get_linestyle() in ['None', ' ', '']:
+                    continue
+                facecolor = (0, 0, 0, 0)
+                edgecolor = to_rgba(artist.get_color(), artist.get_alpha())
+            else:
+                facecolor = artist.get_facecolor()
+                edgecolor = artist.get_edgecolor()
+            paths.append(artist.get_path().transformed(artist.get_transform() + to_axes))
+            styles['facecolor'].append(facecolor)
+            styles['edgecolor'].append(edgecolor)
+            styles['linewidth'].append(artist.get_linewidth())
+            styles['linestyle'].append(artist.get_linestyle())
+        return paths, styles
+
     @copy_doc(bin_statistic_positional)
     def bin_statistic_positional(self, x, y, values=None, positional='full',
-                                 statistic='count', normalize=False):
+                                 statistic='count', normalize=False, standardizer=None,
+                                 binnumber_dtype=None):
         return bin_statistic_positional(x, y, values=values,
                                         dim=self.dim, positional=positional,
-                                        statistic=statistic, normalize=normalize)
+                                        statistic=statistic, normalize=normalize,
+                                        standardizer=standardizer,
+                                        binnumber_dtype=binnumber_dtype)
 
     @copy_doc(heatmap_positional)
     def heatmap_positional(self, stats, ax=None, **kwargs):
@@ -54,13 +54,15 @@ origin_center = If true, the origin starts at (center length, center width)
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict
+from functools import cached_property, lru_cache, partial
+from typing import Optional
 
 import numpy as np
 
 from .formations import Formation, PositionLine4, PositionLine5, \
     PositionLine5WithSecondStriker, Coordinate
 from .._dimensions_base import BaseDims
+from .._lattice import lattice_map, lattice_scale
 
 
 __all__ = ['Standardizer']
@@ -113,31 +115,47 @@ class BaseSoccerDims(BaseDims):
     positional_y: Optional[np.array] = None
     # defined in stripes
     stripe_locations: Optional[np.array] = None
+
+    def setup_dims(self):
+        """ Run methods for the extra pitch dimensions.
+        The player positions and formations are created when they are first used."""
+        self.pitch_markings()
+        self.juego_de_posicion()
+        self.stripes()
+        self.diameter_angle()
+
     # These positions do not include an extra line for the second striker line, at the moment
     # the only provider to use this position is StatsBomb for a few formations
     # we use these positions if there is no second striker so there is more
     # space for the visualization
-    position_line4: PositionLine4 = None
-    position_line5: PositionLine5 = None
+    @cached_property
+    def position_line4(self):
+        """ Player positions with four positions per line."""
+        return self.create_positions_four_per_line()
+
+    @cached_property
+    def position_line5(self):
+        """ Player positions with five positions per line."""
+        return self.create_positions_five_per_line()
+
     # these are additional positions including space for a second striker line.
     # The attacking midfielders are placed slightly backwards for these positions,
     # and for the five positions variation a second striker (SS) is placed between the
     # atttacking midfielder line and the forwards
-    position_line4_with_ss: PositionLine4 = None
-    position_line5_with_ss: PositionLine5WithSecondStriker = None
-    formations: Dict[str, Dict[str, Coordinate]] = None
+    @cached_property
+    def position_line4_with_ss(self):
+        """ Player positions with four positions per line and a second striker line."""
+        return self.create_positions_four_per_line_ss()
 
-    def setup_dims(self):
-        """ Run methods for the extra pitch dimensions."""
-        self.pitch_markings()
-        self.juego_de_posicion()
-        self.stripes()
-        self.create_positions_five_per_line()
-        self.create_positions_four_per_line()
-        self.create_positions_five_per_line_ss()
-        self.create_positions_four_per_line_ss()
-        self.create_formations()
-        self.diameter_angle()
+    @cached_property
+    def position_line5_with_ss(self):
+        """ Player positions with five positions per line and a second striker line."""
+        return self.create_positions_five_per_line_ss()
+
+    @cached_property
+    def formations(self):
+        """ A dictionary of the formation names and their list of positions."""
+        return self.create_formations()
 
     def pitch_markings(self):
         """ Create sorted pitch dimensions to enable standardization of coordinates.
@@ -215,7 +233,7 @@ class BaseSoccerDims(BaseDims):
 
         idx = [12, 1, 7, 13, 19, 25, 2, 8, 14, 20, 26, 3, 9, 15, 21, 27, 4, 10, 16, 22, 28, 11, 17,
                23]
-        self.position_line5 = PositionLine5(
+        return PositionLine5(
             *[Coordinate(*c) for c in list(zip(x.ravel()[idx].tolist(),
                                                y.ravel()[idx].tolist(),
                                                x_flip.ravel()[idx].tolist(),
@@ -245,7 +263,7 @@ class BaseSoccerDims(BaseDims):
         y_flip = np.where(self.origin_center, self.center_width - y, max(self.top, self.bottom) - y)
 
         idx = [18, 1, 13, 25, 37, 2, 14, 26, 38, 3, 15, 27, 39, 4, 16, 28, 40, 17, 29]
-        self.position_line4 = PositionLine4(
+        return PositionLine4(
             *[Coordinate(*c) for c in list(zip(x.ravel()[idx].tolist(),
                                                y.ravel()[idx].tolist(),
                                                x_flip.ravel()[idx].tolist(),
@@ -276,7 +294,7 @@ class BaseSoccerDims(BaseDims):
 
         idx = [14, 1, 8, 15, 22, 29, 2, 9, 16, 23, 30, 3, 10, 17, 24, 31, 4, 11, 18, 25, 32, 13, 20,
                27, 19]
-        self.position_line5_with_ss = PositionLine5WithSecondStriker(
+        return PositionLine5WithSecondStriker(
             *[Coordinate(*c) for c in list(zip(x.ravel()[idx].tolist(),
                                                y.ravel()[idx].tolist(),
                                                x_flip.ravel()[idx].tolist(),
@@ -306,7 +324,7 @@ class BaseSoccerDims(BaseDims):
         y_flip = np.where(self.origin_center, self.center_width - y, max(self.top, self.bottom) - y)
 
         idx = [21, 1, 15, 29, 43, 2, 16, 30, 44, 3, 17, 31, 45, 4, 18, 32, 46, 20, 34]
-        self.position_line4_with_ss = PositionLine4(
+        return PositionLine4(
             *[Coordinate(*c) for c in list(zip(x.ravel()[idx].tolist(),
                                                y.ravel()[idx].tolist(),
                                                x_flip.ravel()[idx].tolist(),
@@ -323,7 +341,7 @@ class BaseSoccerDims(BaseDims):
         formations = Formation(self.position_line4, self.position_line5,
                                self.position_line4_with_ss,
                                self.position_line5_with_ss)
-        self.formations = formations.formations
+        return formations.formations
 
     def diameter_angle(self):
         """ Calculate diameters and angles of circles and arcs."""
@@ -600,6 +618,10 @@ def center_scale_dims(pitch_width, pitch_length, width=2, length=2, invert_y=Fal
 def create_pitch_dims(pitch_type, pitch_width=None, pitch_length=None):
     """ Create pitch dimensions.
 
+    The dimensions are cached for each pitch type and size, so they are shared by
+    all the pitches and Standardizers with the same pitch type. They are read-only
+    (see BaseDims.freeze).
+
     Parameters
     ----------
     pitch_type : str
@@ -618,6 +640,21 @@ def create_pitch_dims(pitch_type, pitch_width=None, pitch_length=None):
     dataclass
         A dataclass holding the pitch dimensions.
     """
+    if pitch_type not in size_varies:
+        # the size is not used so do not cache the dimensions for each size
+        pitch_width = pitch_length = None
+    return _create_pitch_dims(pitch_type, pitch_width, pitch_length)
+
+
+@lru_cache(maxsize=128)
+def _create_pitch_dims(pitch_type, pitch_width, pitch_length):
+    """ Create the read-only pitch dimensions (cached by create_pitch_dims)."""
+    dim = _new_pitch_dims(pitch_type, pitch_width, pitch_length)
+    dim.freeze()
+    return dim
+
+
+def _new_pitch_dims(pitch_type, pitch_width, pitch_length):
     if pitch_type == 'opta':
         return opta_dims()
     if pitch_type == 'wyscout':
@@ -639,6 +676,17 @@ def create_pitch_dims(pitch_type, pitch_width=None, pitch_length=None):
     return custom_dims(pitch_width, pitch_length)
 
 
+# the coordinate columns transformed by Standardizer.transform_frame by default
+_FRAME_PAIRS = [('x', 'y'), ('end_x', 'end_y')]
+
+
+def _float_array(series):
+    """ The values of a series as a float array (without a copy for float columns)."""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind == 'f':
+        return series.to_numpy()
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
 class Standardizer:
     """ Convert from one set of coordinates to another.
 
@@ -708,7 +756,10 @@ class Standardizer:
                                             pitch_length=length_to,
                                             pitch_width=width_to)
 
-    def transform(self, x, y, reverse=False):
+        # the fused transforms used by transform_frame, created when first needed
+        self._transforms = {}
+
+    def transform(self, x, y, reverse=False, dtype=None, lattice=None):
         """ Transform the coordinates.
 
         Parameters
@@ -718,15 +769,33 @@ class Standardizer:
         reverse : bool, default False
             If reverse=True then reverse the transform. Therefore, the coordinates
             are converted from pitch_to to pitch_from.
+        dtype : numpy dtype, default None
+            The dtype of the standardized coordinates, e.g. numpy.float32 to halve the memory.
+            The coordinates are transformed in this dtype without float64 temporary arrays.
+            If None, the standardized coordinates are float64.
+        lattice : float or 'auto', default None
+            The spacing of the coordinates if they are on a fixed lattice, e.g. lattice=1 for
+            integer or lattice=0.1 for one decimal place 'opta' coordinates. Each lattice
+            point is standardized once and looked up, rather than standardizing every
+            coordinate. If 'auto', the spacing (1, 0.1 or 0.01) is detected from a sample
+            of the coordinates. The results are the same: coordinates that are not on the
+            lattice are standardized as usual.
 
         Returns
         ----------
         x_standardized, y_standardized : np.array 1d
             The coordinates standardized in pitch_to coordinates (or pitch_from if reverse=True).
         """
+        if lattice is not None:
+            return self._lattice_transform(x, y, reverse, lattice, dtype)
+        if dtype is not None:
+            return self._coordinate_transform(reverse).transform(x, y, dtype=dtype)
+        return self._transform_axis(x, 0, reverse), self._transform_axis(y, 1, reverse)
+
+    def _transform_axis(self, coordinate, axis, reverse):
+        """ Transform the x (axis=0) or y (axis=1) coordinates."""
         # to numpy arrays
-        x = np.asarray(x)
-        y = np.asarray(y)
+        coordinate = np.asarray(coordinate)
 
         if reverse:
             dim_from, dim_to = self.dim_to, self.dim_from
@@ -734,23 +803,164 @@ class Standardizer:
             dim_from, dim_to = self.dim_from, self.dim_to
 
         # clip outside to pitch extents
-        x = x.clip(min=dim_from.left, max=dim_from.right)
-        y = y.clip(min=dim_from.pitch_extent[2], max=dim_from.pitch_extent[3])
+        if axis == 0:
+            coordinate = coordinate.clip(min=dim_from.left, max=dim_from.right)
+            return self._standardize(dim_from.x_markings_sorted,
+                                     dim_to.x_markings_sorted, coordinate)
+        coordinate = coordinate.clip(min=dim_from.pitch_extent[2], max=dim_from.pitch_extent[3])
 
         # for inverted axis flip the coordinates
         if dim_from.invert_y:
-            y = dim_from.bottom - y
+            coordinate = dim_from.bottom - coordinate
 
-        x_standardized = self._standardize(dim_from.x_markings_sorted,
-                                           dim_to.x_markings_sorted, x)
-        y_standardized = self._standardize(dim_from.y_markings_sorted,
-                                           dim_to.y_markings_sorted, y)
+        standardized = self._standardize(dim_from.y_markings_sorted,
+                                         dim_to.y_markings_sorted, coordinate)
 
         # for inverted axis flip the coordinates
         if dim_to.invert_y:
-            y_standardized = dim_to.bottom - y_standardized
+            standardized = dim_to.bottom - standardized
+
+        return standardized
+
+    def _lattice_transform(self, x, y, reverse, lattice, dtype):
+        """ Transform the coordinates by looking up the standardized lattice points."""
+        dim_from = self.dim_to if reverse else self.dim_from
+        extents = ((dim_from.left, dim_from.right), dim_from.pitch_extent[2:])
+        result = []
+        for axis, coordinate in enumerate((x, y)):
+            scale = lattice_scale(coordinate, lattice)
+            function = partial(self._transform_axis, axis=axis, reverse=reverse)
+            if scale is None:
+                standardized = function(coordinate)
+            else:
+                standardized = lattice_map(coordinate, function, *extents[axis], scale)
+            if dtype is not None:
+                standardized = standardized.astype(dtype, copy=False)
+            result.append(standardized)
+        return tuple(result)
+
+    def transform_frame(self, df, pairs=None, reverse=False, inplace=True):
+        """ Transform the coordinates in several pairs of dataframe columns.
+
+        The marking lookup is calculated once and shared by all the columns, and each column
+        is converted from its NumPy array without copying the dataframe.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            A dataframe with the coordinates, e.g. the events or freeze frames from Sbopen.
+        pairs : sequence of tuples of str, default None
+            The (x, y) column names to transform, e.g. [('x', 'y'), ('end_x', 'end_y')].
+            If None, transforms the columns ('x', 'y') and ('end_x', 'end_y')
+            that are in the dataframe.
+        reverse : bool, default False
+            If reverse=True then reverse the transform. Therefore, the coordinates
+            are converted from pitch_to to pitch_from.
+        inplace : bool, default True
+            Whether to replace the columns in df. If False, a new dataframe is returned.
+
+        Returns
+        -------
+        df : pandas.DataFrame or None
+            The dataframe with the standardized coordinates or None if inplace=True.
+            Each float column keeps its own dtype (e.g. a float32 x column stays float32 even
+            if the y column is float64), other columns are converted to float64.
+
+        Examples
+        --------
+        >>> from mplsoccer import Sbopen, Standardizer
+        >>> parser = Sbopen()
+        >>> events, related, freeze, tactics = parser.event(7478)
+        >>> standard = Standardizer(pitch_from='statsbomb', pitch_to='uefa')
+        >>> standard.transform_frame(events, pairs=[('x', 'y'), ('end_x', 'end_y')])
+        >>> standard.transform_frame(freeze)
+        """
+        if pairs is None:
+            pairs = [pair for pair in _FRAME_PAIRS if set(pair).issubset(df.columns)]
+        missing = [column for pair in pairs for column in pair if column not in df.columns]
+        if missing:
+            raise ValueError(f'The columns {missing} are not in the dataframe.')
+        if not inplace:
+            # a shallow copy as the transformed columns are replaced rather than modified
+            df = df.copy(deep=False)
+        transform = self._coordinate_transform(reverse)
+        for x_column, y_column in pairs:
+            x = _float_array(df[x_column])
+            y = _float_array(df[y_column])
+            out = (np.empty(x.shape, dtype=x.dtype), np.empty(y.shape, dtype=y.dtype))
+            df[x_column], df[y_column] = transform.transform(x, y, out=out)
+        return None if inplace else df
+
+    def transform_array(self, coordinates, reverse=False, out=None, chunk_size=1_000_000):
+        """ Transform an array of coordinates with the x and y coordinates in the last axis,
+        e.g. tracking data with the shape (n_frames, n_players, 2).
+
+        Unlike transform, this does not create full-size temporary arrays. The coordinates
+        are transformed in chunks along the first axis, so it also works with large
+        memory-mapped arrays (numpy.memmap). Missing coordinates (NaN) stay NaN.
 
-        return x_standardized, y_standardized
+        Parameters
+        ----------
+        coordinates : numpy.ndarray
+            An array with the shape (..., 2).
+        reverse : bool, default False
+            If reverse=True then reverse the transform. Therefore, the coordinates
+            are converted from pitch_to to pitch_from.
+        out : numpy.ndarray, default None
+            A float array with the same shape as coordinates to write the result into.
+            Use out=coordinates to transform the coordinates in place.
+            If None, a new array is created with the same dtype as coordinates
+            (float64 for integer coordinates).
+        chunk_size : int, default 1_000_000
+            The approximate number of coordinates transformed at once, which bounds the
+            memory used for temporary arrays.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            The coordinates standardized in pitch_to coordinates (or pitch_from if reverse=True).
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from mplsoccer import Standardizer
+        >>> standard = Standardizer(pitch_from='tracab', pitch_to='uefa',
+        ...                         length_from=105, width_from=68)
+        >>> frames = np.zeros((1000, 23, 2))
+        >>> frames = standard.transform_array(frames, out=frames)
+        """
+        coordinates = np.asanyarray(coordinates)
+        if coordinates.ndim == 0 or coordinates.shape[-1] != 2:
+            raise ValueError('coordinates must have the shape (..., 2).')
+        if out is None:
+            dtype = coordinates.dtype if coordinates.dtype.kind == 'f' else np.float64
+            out = np.empty(coordinates.shape, dtype=dtype)
+        elif out.shape != coordinates.shape:
+            raise ValueError('out must be the same shape as coordinates.')
+        elif out.dtype.kind != 'f':
+            raise TypeError('Invalid argument: out must be a float array.')
+        transform = self._coordinate_transform(reverse)
+        # views with at least two dimensions so a single point can be chunked
+        coordinates_2d = coordinates.reshape(1, 2) if coordinates.ndim == 1 else coordinates
+        out_2d = out[np.newaxis] if out.ndim == 1 else out
+        # the number of rows of the first axis in each chunk
+        row_size = max(coordinates_2d[:1].size // 2, 1)
+        step = max(chunk_size // row_size, 1)
+        for start in range(0, coordinates_2d.shape[0], step):
+            chunk = coordinates_2d[start:start + step]
+            chunk_out = out_2d[start:start + step]
+            transform.transform(chunk[..., 0], chunk[..., 1],
+                                out=(chunk_out[..., 0], chunk_out[..., 1]))
+        return out
+
+    def _coordinate_transform(self, reverse):
+        """ The fused CoordinateTransform for this Standardizer (cached)."""
+        if reverse not in self._transforms:
+            # imported here as the transforms module imports this module
+            from .transforms import CoordinateTransform
+            self._transforms[reverse] = CoordinateTransform.from_standardizer(self,
+                                                                              reverse=reverse)
+        return self._transforms[reverse]
 
     @staticmethod
     def _standardize(markings_from, markings_to, coordinate):
@@ -0,0 +1,293 @@
+""" A module for normalizing the attacking direction of event and tracking data,
+so every team attacks from left to right (towards the right of the pitch)."""
+
+import numpy as np
+
+from .dimensions import (BaseDims, create_pitch_dims, valid, size_varies, _FRAME_PAIRS,
+                         _float_array)
+
+__all__ = ['DirectionNormalizer']
+
+_DIRECTIONS = ('right', 'left')
+
+
+class DirectionNormalizer:
+    """ Flip coordinates so each team attacks from left to right.
+
+    The direction each team attacks in each period is given by a direction table or inferred
+    from the goalkeeper positions in tracking data (from_goalkeepers). Coordinates of teams
+    attacking to the left are flipped to the other side of the pitch, like flip_side, using
+    the center of the pitch so both 'origin_center' pitches (e.g. 'tracab') and pitches with
+    an inverted y-axis (e.g. 'statsbomb') are flipped correctly.
+
+    Parameters
+    ----------
+    directions : dict
+        The direction table. A dictionary of (team, period) keys and the direction the team
+        attacks in that period: 'right' (towards the right of the pitch) or 'left'.
+    pitch_type : str or subclass of dimensions.BaseDims, default 'statsbomb'
+        The pitch type of the coordinates. The supported pitch types are: 'opta', 'statsbomb',
+        'tracab', 'wyscout', 'uefa', 'metricasports', 'custom', 'skillcorner',
+        'secondspectrum' and 'impect'. Alternatively, you can pass a custom dimension
+        object by creating a subclass of dimensions.BaseDims.
+    pitch_length, pitch_width : float, default None
+        The pitch length and width in meters. Only used for the 'tracab' and 'metricasports',
+        'skillcorner', 'secondspectrum' and 'custom' pitch_type.
+
+    Examples
+    --------
+    >>> from mplsoccer import DirectionNormalizer
+    >>> normalizer = DirectionNormalizer({('home', 1): 'right', ('home', 2): 'left',
+    ...                                   ('away', 1): 'left', ('away', 2): 'right'},
+    ...                                  pitch_type='opta')
+    >>> x, y = normalizer.transform([10, 10], [30, 30], teams=['home', 'away'], periods=2)
+    """
+
+    def __init__(self, directions, pitch_type='statsbomb', pitch_length=None,
+                 pitch_width=None):
+        if pitch_type not in valid and not issubclass(type(pitch_type), BaseDims):
+            raise TypeError(f'Invalid argument: pitch_type should be in {valid}')
+        if (pitch_length is None or pitch_width is None) and pitch_type in size_varies:
+            raise TypeError("Invalid argument: pitch_width and pitch_length must be specified.")
+        invalid = {key: value for key, value in directions.items() if value not in _DIRECTIONS}
+        if invalid:
+            raise ValueError(f"The directions should be 'right' or 'left', invalid: {invalid}")
+
+        self.directions = dict(directions)
+        self.pitch_type = pitch_type
+        self.pitch_length = pitch_length
+        self.pitch_width = pitch_width
+        if issubclass(type(pitch_type), BaseDims):
+            self.dim = pitch_type
+        else:
+            self.dim = create_pitch_dims(pitch_type, pitch_width=pitch_width,
+                                         pitch_length=pitch_length)
+        # coordinates are flipped with x = x_sum - x and y = y_sum - y
+        self._x_sum = self.dim.left + self.dim.right
+        self._y_sum = self.dim.bottom + self.dim.top
+
+    @classmethod
+    def from_goalkeepers(cls, coordinates, teams, periods, goalkeepers, pitch_type='statsbomb',
+                         pitch_length=None, pitch_width=None):
+        """ Create a DirectionNormalizer by inferring the direction table from tracking data.
+
+        Each team attacks away from the side of the pitch where its goalkeeper's average
+        position is in that period. If a team's goalkeeper has no coordinates in a period,
+        the team attacks in the opposite direction to the other team.
+
+        Parameters
+        ----------
+        coordinates : numpy.ndarray
+            The tracking data with the shape (n_frames, n_players, 2).
+            Missing players are NaN.
+        teams : array-like
+            The team of each player with the shape (n_players,).
+        periods : array-like
+            The period of each frame with the shape (n_frames,).
+        goalkeepers : array-like of boolean
+            Whether each player is a goalkeeper with the shape (n_players,).
+        pitch_type, pitch_length, pitch_width
+            The pitch of the coordinates. See DirectionNormalizer.
+
+        Returns
+        -------
+        DirectionNormalizer
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from mplsoccer import DirectionNormalizer
+        >>> frames = np.random.uniform(-5000, 5000, size=(100, 4, 2))
+        >>> frames[:, 0, 0] = -5000
+        >>> frames[:, 2, 0] = 5000
+        >>> normalizer = DirectionNormalizer.from_goalkeepers(
+        ...     frames, teams=['home', 'home', 'away', 'away'], periods=np.repeat([1, 2], 50),
+        ...     goalkeepers=[True, False, True, False], pitch_type='tracab',
+        ...     pitch_length=100, pitch_width=70)
+        >>> frames = normalizer.transform_array(frames, periods=np.repeat([1, 2], 50)[:, None],
+        ...                                     teams=['home', 'home', 'away', 'away'],
+        ...                                     out=frames)
+        """
+        coordinates = np.asanyarray(coordinates)
+        if coordinates.ndim != 3 or coordinates.shape[-1] != 2:
+            raise ValueError('coordinates must have the shape (n_frames, n_players, 2).')
+        teams = np.asarray(teams)
+        periods = np.asarray(periods)
+        goalkeepers = np.asarray(goalkeepers, dtype=bool)
+        if teams.shape != (coordinates.shape[1],) or goalkeepers.shape != teams.shape:
+            raise ValueError('teams and goalkeepers must have the shape (n_players,)')
+        if periods.shape != (coordinates.shape[0],):
+            raise ValueError('periods must have the shape (n_frames,)')
+        normalizer = cls({}, pitch_type=pitch_type, pitch_length=pitch_length,
+                         pitch_width=pitch_width)
+
+        unique_teams, team_index = np.unique(teams, return_inverse=True)
+        unique_periods, period_index = np.unique(periods, return_inverse=True)
+        shape = (unique_teams.size, unique_periods.size)
+        # the sum and count of the goalkeepers' x-coordinates for each team and period
+        total = np.zeros(shape)
+        count = np.zeros(shape)
+        for player in np.flatnonzero(goalkeepers):
+            x = coordinates[:, player, 0]
+            observed = ~np.isnan(x)
+            total[team_index[player]] += np.bincount(period_index[observed],
+                                                     weights=x[observed],
+                                                     minlength=unique_periods.size)
+            count[team_index[player]] += np.bincount(period_index[observed],
+                                                     minlength=unique_periods.size)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # positive if the goalkeeper defends the right of the pitch
+            side = np.sign(total / count - normalizer._x_sum / 2)
+        if unique_teams.size == 2:
+            # the teams attack in opposite directions
+            side = np.where(np.isnan(side) | (side == 0), -side[::-1], side)
+        unknown = np.isnan(side) | (side == 0)
+        if unknown.any():
+            team, period = np.nonzero(unknown)
+            unknown = list(zip(unique_teams[team].tolist(), unique_periods[period].tolist()))
+            raise ValueError(f'The direction can not be inferred for (team, period): {unknown}')
+        for (team, period), team_side in np.ndenumerate(side):
+            key = (unique_teams[team].item(), unique_periods[period].item())
+            normalizer.directions[key] = 'left' if team_side > 0 else 'right'
+        return normalizer
+
+    def flip_mask(self, teams, periods):
+        """ Whether to flip each coordinate, i.e. the team attacks to the left.
+
+        Parameters
+        ----------
+        teams, periods : array-like or scalar
+            The team and period of each coordinate. These are broadcast together,
+            e.g. a single period for a list of teams.
+
+        Returns
+        -------
+        flip : numpy.ndarray of boolean
+        """
+        teams = np.asarray(teams)
+        periods = np.asarray(periods)
+        # find the unique values before broadcasting, e.g. one team per player
+        unique_teams, team_index = np.unique(teams, return_inverse=True)
+        unique_periods, period_index = np.unique(periods, return_inverse=True)
+        # a table of the flips for each team and period (-1 if missing)
+        table = np.full((unique_teams.size, unique_periods.size), -1, dtype=np.int8)
+        rows = {team: row for row, team in enumerate(unique_teams.tolist())}
+        columns = {period: column for column, period in enumerate(unique_periods.tolist())}
+        for (team, period), direction in self.directions.items():
+            if team in rows and period in columns:
+                table[rows[team], columns[period]] = direction == 'left'
+        team_index, period_index = np.broadcast_arrays(team_index.reshape(teams.shape),
+                                                       period_index.reshape(periods.shape))
+        flip = table[team_index, period_index]
+        missing = flip == -1
+        if missing.any():
+            missing = sorted(set(zip(unique_teams[team_index[missing]].tolist(),
+                                     unique_periods[period_index[missing]].tolist())))
+            raise ValueError(f'The (team, period) pairs {missing} are not in the directions.')
+        return flip.astype(bool)
+
+    def transform(self, x, y, teams, periods, dtype=None):
+        """ Flip the coordinates so each team attacks from left to right.
+
+        Parameters
+        ----------
+        x, y : array-like or scalar.
+            Commonly, these parameters are 1D arrays.
+        teams, periods : array-like or scalar
+            The team and period of each coordinate.
+        dtype : numpy dtype, default None
+            The dtype of the result, e.g. numpy.float32 to halve the memory.
+            If None, the result is float64.
+
+        Returns
+        -------
+        x_normalized, y_normalized : numpy.ndarray
+        """
+        dtype = float if dtype is None else dtype
+        x = np.array(x, dtype=dtype)
+        y = np.array(y, dtype=dtype)
+        if x.shape != y.shape:
+            raise ValueError("x and y must be the same size")
+        flip = np.broadcast_to(self.flip_mask(teams, periods), x.shape)
+        np.subtract(self._x_sum, x, out=x, where=flip)
+        np.subtract(self._y_sum, y, out=y, where=flip)
+        return x, y
+
+    def transform_array(self, coordinates, teams, periods, out=None):
+        """ Flip an array of coordinates with the x and y coordinates in the last axis,
+        e.g. tracking data with the shape (n_frames, n_players, 2).
+
+        Parameters
+        ----------
+        coordinates : numpy.ndarray
+            An array with the shape (..., 2).
+        teams, periods : array-like
+            The team and period of each coordinate. These must broadcast to
+            coordinates.shape[:-1], e.g. teams with the shape (n_players,) and periods
+            with the shape (n_frames, 1).
+        out : numpy.ndarray, default None
+            A float array with the same shape as coordinates to write the result into.
+            Use out=coordinates to flip the coordinates in place.
+
+        Returns
+        -------
+        out : numpy.ndarray
+        """
+        coordinates = np.asanyarray(coordinates)
+        if coordinates.ndim == 0 or coordinates.shape[-1] != 2:
+            raise ValueError('coordinates must have the shape (..., 2).')
+        if out is None:
+            dtype = coordinates.dtype if coordinates.dtype.kind == 'f' else np.float64
+            out = np.empty(coordinates.shape, dtype=dtype)
+        elif out.shape != coordinates.shape:
+            raise ValueError('out must be the same shape as coordinates.')
+        flip = np.broadcast_to(self.flip_mask(teams, periods), coordinates.shape[:-1])
+        for axis, total in enumerate([self._x_sum, self._y_sum]):
+            np.copyto(out[..., axis], coordinates[..., axis], casting='unsafe')
+            np.subtract(total, out[..., axis], out=out[..., axis], where=flip,
+                        casting='unsafe')
+        return out
+
+    def transform_frame(self, df, team='team_id', period='period', pairs=None, inplace=True):
+        """ Flip the coordinates in several pairs of dataframe columns.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            A dataframe with the coordinates, team and period, e.g. the events from Sbopen.
+        team, period : str, default 'team_id' and 'period'
+            The team and period columns.
+        pairs : sequence of tuples of str, default None
+            The (x, y) column names to flip, e.g. [('x', 'y'), ('end_x', 'end_y')].
+            If None, flips the columns ('x', 'y') and ('end_x', 'end_y')
+            that are in the dataframe.
+        inplace : bool, default True
+            Whether to replace the columns in df. If False, a new dataframe is returned.
+
+        Returns
+        -------
+        df : pandas.DataFrame or None
+            The dataframe with the flipped coordinates or None if inplace=True.
+        """
+        if pairs is None:
+            pairs = [pair for pair in _FRAME_PAIRS if set(pair).issubset(df.columns)]
+        columns = [column for pair in pairs for column in pair] + [team, period]
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise ValueError(f'The columns {missing} are not in the dataframe.')
+        if not inplace:
+            # a shallow copy as the flipped columns are replaced rather than modified
+            df = df.copy(deep=False)
+        # the flips are calculated once and shared by all the columns
+        flip = self.flip_mask(df[team].to_numpy(), df[period].to_numpy())
+        for x_column, y_column in pairs:
+            for column, total in [(x_column, self._x_sum), (y_column, self._y_sum)]:
+                values = _float_array(df[column]).copy()
+                np.subtract(total, values, out=values, where=flip)
+                df[column] = values
+        return None if inplace else df
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'directions={self.directions}, pitch_type={self.pitch_type}, '
+                f'pitch_length={self.pitch_length}, pitch_width={self.pitch_width})')
@@ -69,7 +69,8 @@ def positional_zones(dim, positional='full'):
 
 
 def bin_statistic_positional(x, y, values=None, dim=None, positional='full',
-                             statistic='count', normalize=False):
+                             statistic='count', normalize=False, standardizer=None,
+                             binnumber_dtype=None):
     """ Calculates binned statistics for the Juego de Posición (positional play) zones.
 
     Parameters
@@ -90,6 +91,14 @@ def bin_statistic_positional(x, y, values=None, dim=None, positional='full',
         https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.binned_statistic.html
     normalize : bool, default False
         Whether to normalize the statistic by dividing by the total.
+    standardizer : mplsoccer.Standardizer, default None
+        If given, the raw x, y values (in the standardizer's pitch_from coordinates)
+        are binned in the positional zones of the pitch_to pitch, as if they were
+        standardized first with ``standardizer.transform``. The zones are converted
+        to the pitch_from coordinates instead of transforming every point.
+    binnumber_dtype : numpy dtype, default None
+        The signed integer dtype of the binnumber, e.g. numpy.int32 or numpy.int16
+        to reduce the memory for many points. If None, uses numpy.intp (int64).
 
     Returns
     -------
@@ -113,9 +122,11 @@ def bin_statistic_positional(x, y, values=None, dim=None, positional='full',
     >>> stats = pitch.bin_statistic_positional(x, y)
     >>> pitch.heatmap_positional(stats, edgecolors='black', cmap='hot', ax=ax)
     """
-    zones, names = positional_zones(dim, positional=positional)
+    zone_dim = dim if standardizer is None else standardizer.dim_to
+    zones, names = positional_zones(zone_dim, positional=positional)
     return bin_statistic_zones(x, y, zones, dim=dim, values=values,
-                               statistic=statistic, normalize=normalize, names=names)
+                               statistic=statistic, normalize=normalize, names=names,
+                               standardizer=standardizer, binnumber_dtype=binnumber_dtype)
 
 
 def heatmap_positional(stats, ax=None, vertical=False, **kwargs):
@@ -0,0 +1,286 @@
+""" A module for calculating the speed, acceleration and distance covered from tracking data.
+
+The coordinates are converted to meters with the Standardizer and every calculation
+is vectorized over all the frames and players of an (n_frames, n_players, 2) array.
+Missing coordinates (NaN) and period breaks split the tracking data into separate
+segments, so the smoothing and differences are never calculated across a gap.
+"""
+
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from .dimensions import BaseDims, Standardizer, valid, size_varies
+from .transforms import CoordinateTransform
+
+__all__ = ['Kinematics']
+
+
+@dataclass
+class KinematicsResult:
+    """ A dataclass for the kinematics of each frame and player."""
+    position: np.ndarray
+    velocity: np.ndarray
+    speed: np.ndarray
+    acceleration: np.ndarray
+    heading: np.ndarray
+
+
+@dataclass
+class KinematicsSummary:
+    """ A dataclass for the aggregated kinematics of each player."""
+    distance: np.ndarray
+    high_speed_distance: np.ndarray
+    sprint_distance: np.ndarray
+    sprints: np.ndarray
+    max_speed: np.ndarray
+    time: np.ndarray
+
+
+def _segments(periods, n_frames):
+    """ The (start, stop) frames of each period, which are processed separately."""
+    if periods is None:
+        return [(0, n_frames)]
+    periods = np.ravel(periods)
+    if periods.size != n_frames:
+        raise ValueError('periods must have one value per frame.')
+    breaks = np.flatnonzero(periods[1:] != periods[:-1]) + 1
+    bounds = np.concatenate([[0], breaks, [n_frames]])
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _moving_average(values, window):
+    """ The centered moving average along the first axis ignoring missing values (NaN).
+    Missing values stay missing. The window is shrunk at the start and end.
+    An even window has one more value before the center than after it."""
+    if window <= 1 or values.shape[0] == 0:
+        return values.copy()
+    missing = np.isnan(values)
+    padding = [(window // 2 + 1, window - window // 2 - 1)] + [(0, 0)] * (values.ndim - 1)
+    # the cumulative sums are float64 so long float32 tracking data does not lose precision
+    total = np.pad(np.where(missing, 0, values), padding).cumsum(axis=0, dtype=np.float64)
+    count = np.pad(~missing, padding).cumsum(axis=0)
+    total = total[window:] - total[:-window]
+    count = count[window:] - count[:-window]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = (total / count).astype(values.dtype, copy=False)
+    result[missing] = np.nan
+    return result
+
+
+def _derivative(values, frame_rate):
+    """ The central difference along the first axis, using the forward or backward
+    difference at the start and end and next to missing values (NaN)."""
+    result = np.full(values.shape, np.nan, dtype=values.dtype)
+    if values.shape[0] < 2:
+        return result
+    difference = np.diff(values, axis=0) * values.dtype.type(frame_rate)
+    forward = result.copy()
+    forward[:-1] = difference
+    result[1:] = difference  # backward difference
+    central = 0.5 * (forward[1:-1] + result[1:-1])
+    result[1:-1] = np.where(np.isnan(central), result[1:-1], central)
+    return np.where(np.isnan(result), forward, result)
+
+
+class Kinematics:
+    """ Calculate the velocity, speed, acceleration and heading from tracking data
+    and aggregate them into the distance covered, high-speed running and sprints per player.
+
+    The coordinates are converted to meters with a Standardizer and differentiated with
+    central differences. The velocities are smoothed with a centered moving average.
+    Missing coordinates (NaN) and period breaks are never smoothed or differentiated across.
+
+    Parameters
+    ----------
+    frame_rate : float, default 25
+        The number of frames per second.
+    pitch_type : str or subclass of dimensions.BaseDims, default 'statsbomb'
+        The pitch type of the coordinates. The supported pitch types are: 'opta', 'statsbomb',
+        'tracab', 'wyscout', 'uefa', 'metricasports', 'custom', 'skillcorner',
+        'secondspectrum' and 'impect'. Alternatively, you can pass a custom dimension
+        object by creating a subclass of dimensions.BaseDims.
+    pitch_length, pitch_width : float, default None
+        The pitch length and width in meters. Required for the 'tracab' and 'metricasports',
+        'skillcorner', 'secondspectrum' and 'custom' pitch_type. For the other pitch types
+        the coordinates are converted to meters for a pitch of this size (default 105m x 68m).
+    window : int, default 5
+        The number of frames in the moving average used to smooth the velocities.
+        Use window=1 for no smoothing. An even window is centered with one more frame
+        before the frame than after it.
+    max_speed : float, default 12
+        The maximum speed in meters per second. Faster speeds are tracking errors and
+        are set to missing (NaN).
+    high_speed : float, default 5.5
+        The minimum speed for high-speed running in meters per second (19.8 km/h).
+    sprint_speed : float, default 7
+        The minimum speed for sprinting in meters per second (25.2 km/h).
+    sprint_duration : float, default 1
+        The minimum number of seconds above the sprint_speed to count as a sprint.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mplsoccer import Kinematics
+    >>> kinematics = Kinematics(frame_rate=25, pitch_type='tracab',
+    ...                         pitch_length=105, pitch_width=68)
+    >>> frames = np.zeros((1000, 22, 2))
+    >>> periods = np.repeat([1, 2], 500)
+    >>> result = kinematics.transform(frames, periods=periods)
+    >>> summary = kinematics.summary(frames, periods=periods)
+    """
+
+    def __init__(self, frame_rate=25, pitch_type='statsbomb', pitch_length=None,
+                 pitch_width=None, window=5, max_speed=12, high_speed=5.5, sprint_speed=7,
+                 sprint_duration=1):
+        if pitch_type not in valid and not issubclass(type(pitch_type), BaseDims):
+            raise TypeError(f'Invalid argument: pitch_type should be in {valid}')
+        if (pitch_length is None or pitch_width is None) and pitch_type in size_varies:
+            raise TypeError("Invalid argument: pitch_width and pitch_length must be specified.")
+        if frame_rate <= 0:
+            raise ValueError('frame_rate must be positive.')
+        if int(window) < 1:
+            raise ValueError('window must be a positive number of frames.')
+
+        self.frame_rate = frame_rate
+        self.pitch_type = pitch_type
+        self.pitch_length = pitch_length
+        self.pitch_width = pitch_width
+        self.window = int(window)
+        self.max_speed = max_speed
+        self.high_speed = high_speed
+        self.sprint_speed = sprint_speed
+        self.sprint_duration = sprint_duration
+        self.standardizer = Standardizer(pitch_from=pitch_type, pitch_to='custom',
+                                         length_from=pitch_length, width_from=pitch_width,
+                                         length_to=105 if pitch_length is None else pitch_length,
+                                         width_to=68 if pitch_width is None else pitch_width)
+        # the players can be off the pitch, so unlike the standardizer the coordinates are
+        # not clipped to the pitch
+        to_meters = CoordinateTransform.from_standardizer(self.standardizer)
+        self._to_meters = CoordinateTransform(to_meters.knots[0], to_meters.values[0],
+                                              to_meters.knots[1], to_meters.values[1])
+
+    def transform(self, coordinates, periods=None):
+        """ Calculate the kinematics of each frame and player.
+
+        Parameters
+        ----------
+        coordinates : numpy.ndarray
+            The tracking data with the shape (n_frames, n_players, 2) or (n_frames, 2)
+            in the pitch_type coordinates. Missing coordinates are NaN.
+        periods : array-like, default None
+            The period of each frame with the shape (n_frames,). The kinematics are not
+            calculated across a change of period. If None, the frames are one period.
+
+        Returns
+        -------
+        kinematics : dict
+            The keys are 'position' (the coordinates in meters, with the origin in
+            the bottom left of the pitch), 'velocity' (meters per second in the x and y
+            direction with the same shape as coordinates), 'speed' (meters per second),
+            'acceleration' (the change in speed in meters per second squared) and
+            'heading' (the direction of travel in radians counter-clockwise from the
+            direction of the x-axis in the range [0, 2pi]). The speed, acceleration and
+            heading have the shape (n_frames, n_players). Float32 coordinates stay float32.
+        """
+        coordinates = np.asanyarray(coordinates)
+        if coordinates.ndim not in (2, 3) or coordinates.shape[-1] != 2:
+            raise ValueError('coordinates must have the shape (n_frames, n_players, 2) or '
+                             '(n_frames, 2).')
+        dtype = coordinates.dtype if coordinates.dtype.kind == 'f' else np.float64
+        meters = np.empty(coordinates.shape, dtype=dtype)
+        self._to_meters.transform(coordinates[..., 0], coordinates[..., 1],
+                                  out=(meters[..., 0], meters[..., 1]))
+        velocity = np.empty_like(meters)
+        speed = np.empty(meters.shape[:-1], dtype=meters.dtype)
+        acceleration = np.empty_like(speed)
+        for start, stop in _segments(periods, meters.shape[0]):
+            segment_velocity = _derivative(meters[start:stop], self.frame_rate)
+            # speeds faster than a player can run are tracking errors
+            error = np.hypot(segment_velocity[..., 0], segment_velocity[..., 1]) > self.max_speed
+            segment_velocity[error] = np.nan
+            # the velocities are smoothed rather than the positions, as a moving average of
+            # the positions is biased at the start and end of each segment
+            velocity[start:stop] = _moving_average(segment_velocity, self.window)
+            speed[start:stop] = np.hypot(velocity[start:stop, ..., 0],
+                                         velocity[start:stop, ..., 1])
+            acceleration[start:stop] = _derivative(speed[start:stop], self.frame_rate)
+        heading = np.mod(np.arctan2(velocity[..., 1], velocity[..., 0]), 2 * np.pi)
+        return asdict(KinematicsResult(meters, velocity, speed, acceleration, heading))
+
+    def summary(self, coordinates, periods=None, kinematics=None):
+        """ Calculate the distance covered, high-speed running and sprints of each player.
+
+        Parameters
+        ----------
+        coordinates : numpy.ndarray
+            The tracking data with the shape (n_frames, n_players, 2) or (n_frames, 2)
+            in the pitch_type coordinates. Missing coordinates are NaN.
+        periods : array-like, default None
+            The period of each frame with the shape (n_frames,). A sprint does not continue
+            across a change of period. If None, the frames are one period.
+        kinematics : dict, default None
+            The result of transform for the same coordinates and periods. If None,
+            it is calculated.
+
+        Returns
+        -------
+        summary : dict
+            The keys are 'distance' (the distance covered in meters), 'high_speed_distance'
+            (the distance covered above the high_speed), 'sprint_distance' (the distance
+            covered above the sprint_speed), 'sprints' (the number of times a player was
+            above the sprint_speed for at least the sprint_duration), 'max_speed'
+            (meters per second) and 'time' (the number of seconds the player was tracked).
+            Each value is an array with one value per player. The distances and time are
+            summed over the intervals between consecutive tracked frames in the same period,
+            e.g. 250 frames at 25 frames per second are 9.96 seconds.
+        """
+        if kinematics is None:
+            kinematics = self.transform(coordinates, periods=periods)
+        speed = kinematics['speed']
+        if speed.ndim == 1:
+            speed = speed[:, np.newaxis]
+        n_frames = speed.shape[0]
+        tracked = ~np.isnan(speed)
+        period_start = np.zeros(n_frames, dtype=bool)
+        period_end = np.zeros(n_frames, dtype=bool)
+        for start, stop in _segments(periods, n_frames):
+            period_start[start:stop][:1] = True
+            period_end[start:stop][-1:] = True
+        # the distance is covered in the intervals between consecutive tracked frames
+        # in the same period, at the mean speed of the two frames
+        interval = tracked[:-1] & tracked[1:] & ~period_end[:-1, np.newaxis]
+        interval_speed = np.where(interval, 0.5 * (speed[:-1] + speed[1:]), 0)
+        interval_distance = interval_speed / self.frame_rate
+        distance = interval_distance.sum(axis=0)
+        high_speed_distance = np.where(interval_speed >= self.high_speed, interval_distance,
+                                       0).sum(axis=0)
+        sprint_distance = np.where(interval_speed >= self.sprint_speed, interval_distance,
+                                   0).sum(axis=0)
+
+        # the runs of sprinting frames end at a change of period
+        sprinting = speed >= self.sprint_speed
+        previous = np.zeros_like(sprinting)
+        previous[1:] = sprinting[:-1]
+        previous[period_start] = False
+        following = np.zeros_like(sprinting)
+        following[:-1] = sprinting[1:]
+        following[period_end] = False
+        # np.nonzero on the transpose orders the starts and ends by player and then frame
+        player, run_start = np.nonzero((sprinting & ~previous).T)
+        run_end = np.nonzero((sprinting & ~following).T)[1]
+        long_run = (run_end - run_start + 1) >= self.sprint_duration * self.frame_rate
+        sprints = np.bincount(player[long_run], minlength=speed.shape[1])
+
+        max_speed = np.where(tracked, speed, -np.inf).max(axis=0, initial=-np.inf)
+        max_speed[np.isinf(max_speed)] = np.nan
+        time = interval.sum(axis=0) / self.frame_rate
+        return asdict(KinematicsSummary(distance, high_speed_distance, sprint_distance,
+                                        sprints, max_speed, time))
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'frame_rate={self.frame_rate}, pitch_type={self.pitch_type}, '
+                f'pitch_length={self.pitch_length}, pitch_width={self.pitch_width}, '
+                f'window={self.window})')
@@ -0,0 +1,357 @@
+""" A module with a composable transform for converting x/y coordinates.
+
+A chain of coordinate conversions, e.g. standardizing from one provider's pitch to another,
+flipping the direction of attack and swapping the coordinates for a vertical pitch,
+is fused into a single piecewise-linear mapping for each axis. The mapping is applied
+in a single pass per axis: clip to the pitch, find the segment and scale and shift.
+"""
+
+import numpy as np
+
+from .dimensions import BaseDims
+
+__all__ = ['CoordinateTransform']
+
+_MAX_COMPARISONS = 32
+
+
+def _evaluate(x, knots, values):
+    """ Evaluate a piecewise-linear function, extrapolating with the end segments."""
+    x = np.asarray(x, dtype=float)
+    segment = np.clip(np.searchsorted(knots, x, side='right') - 1, 0, knots.size - 2)
+    slope = np.diff(values)[segment] / np.diff(knots)[segment]
+    return values[segment] + slope * (x - knots[segment])
+
+
+def _invert(knots, values):
+    """ The knots and values of the inverse of a monotonic piecewise-linear function."""
+    order = np.argsort(values)
+    return values[order], knots[order]
+
+
+def _map_bounds(bounds, knots, values):
+    """ The bounds mapped through the piecewise-linear function (in ascending order)."""
+    if bounds is None:
+        return None
+    return tuple(np.sort(_evaluate(bounds, knots, values)))
+
+
+def _simplify(knots, values):
+    """ Remove the knots between two segments with the same slope."""
+    slopes = np.diff(values) / np.diff(knots)
+    keep = np.ones(knots.size, dtype=bool)
+    keep[1:-1] = ~np.isclose(slopes[:-1], slopes[1:])
+    return knots[keep], values[keep]
+
+
+def _to_bounds(bounds):
+    if bounds is None:
+        return None
+    return tuple(float(bound) for bound in np.sort(bounds))
+
+
+def _intersect_bounds(bounds1, bounds2):
+    if bounds1 is None:
+        return bounds2
+    if bounds2 is None:
+        return bounds1
+    return max(bounds1[0], bounds2[0]), min(bounds1[1], bounds2[1])
+
+
+class CoordinateTransform:
+    """ A transform of x/y coordinates made of a piecewise-linear mapping for each axis.
+
+    Transforms are created with the class methods (e.g. from_standardizer, flip and vertical),
+    chained with ``then``, and reversed with ``inverse``. The chain is fused when it is
+    created, so applying it costs the same as applying a single step.
+
+    Parameters
+    ----------
+    x_knots, x_values : array-like, default (0, 1)
+        The input coordinates (knots) and output coordinates (values) of the mapping for the
+        output x-axis. Between the knots the mapping is linear, and outside the knots it
+        continues the first/ last segment. The knots must be ascending and the mapping must be
+        monotonic.
+    y_knots, y_values : array-like, default (0, 1)
+        The mapping for the output y-axis.
+    x_bounds, y_bounds : tuple of float, default None
+        The input coordinates are clipped to these (min, max) bounds before the mapping,
+        e.g. to the pitch limits. If None, the coordinates are not clipped.
+    swap : bool, default False
+        Whether the output x-axis is calculated from the input y-axis and vice versa,
+        e.g. for vertical pitches.
+    centers : tuple of float, default None
+        The center of the input x and y axes, used to flip individual coordinates with the
+        ``flip`` argument of ``transform``.
+
+    Examples
+    --------
+    >>> from mplsoccer import CoordinateTransform, Standardizer
+    >>> standardizer = Standardizer(pitch_from='opta', pitch_to='uefa')
+    >>> to_uefa = CoordinateTransform.from_standardizer(standardizer)
+    >>> to_display = to_uefa.then(CoordinateTransform.vertical())
+    >>> x_display, y_display = to_display.transform([10, 20], [30, 40], flip=[True, False])
+    >>> x, y = to_display.inverse().transform(x_display, y_display)
+    """
+
+    def __init__(self, x_knots=(0, 1), x_values=(0, 1), y_knots=(0, 1), y_values=(0, 1),
+                 x_bounds=None, y_bounds=None, swap=False, centers=None):
+        axis_knots = (np.asarray(x_knots, dtype=float), np.asarray(y_knots, dtype=float))
+        axis_values = (np.asarray(x_values, dtype=float), np.asarray(y_values, dtype=float))
+        for knots, values in zip(axis_knots, axis_values):
+            if knots.ndim != 1 or knots.size < 2 or knots.size != values.size:
+                raise ValueError('the knots and values must be 1d arrays of the same size '
+                                 'with at least two values')
+            if np.any(np.diff(knots) <= 0):
+                raise ValueError('the knots must be strictly ascending')
+            value_steps = np.diff(values)
+            if not (np.all(value_steps > 0) or np.all(value_steps < 0)):
+                raise ValueError('the mapping must be strictly increasing or decreasing')
+        simplified = [_simplify(knots, values) for knots, values in zip(axis_knots, axis_values)]
+        self.knots = tuple(knots for knots, _ in simplified)
+        self.values = tuple(values for _, values in simplified)
+        self.bounds = (_to_bounds(x_bounds), _to_bounds(y_bounds))
+        self.swap = swap
+        # the input axis used for each output axis
+        self.source = (1, 0) if swap else (0, 1)
+        self.centers = None if centers is None else tuple(centers)
+        # the segments as out = intercept + slope * x
+        self._inner_knots = tuple(knots[1:-1] for knots in self.knots)
+        self._slopes = tuple(np.diff(values) / np.diff(knots)
+                             for knots, values in zip(self.knots, self.values))
+        self._intercepts = tuple(values[:-1] - slopes * knots[:-1] for knots, values, slopes
+                                 in zip(self.knots, self.values, self._slopes))
+
+    @classmethod
+    def from_standardizer(cls, standardizer, reverse=False):
+        """ Create the transform for a Standardizer.
+
+        The result is the same as Standardizer.transform, including clipping
+        the coordinates to the pitch.
+
+        Parameters
+        ----------
+        standardizer : mplsoccer.Standardizer
+        reverse : bool, default False
+            If reverse=True then convert from pitch_to to pitch_from.
+
+        Returns
+        -------
+        CoordinateTransform
+        """
+        dim_from, dim_to = standardizer.dim_from, standardizer.dim_to
+        if reverse:
+            dim_from, dim_to = dim_to, dim_from
+        y_knots = dim_from.y_markings_sorted
+        y_values = dim_to.y_markings_sorted
+        # for inverted axis flip the coordinates
+        if dim_from.invert_y:
+            y_knots = dim_from.bottom - y_knots
+        if dim_to.invert_y:
+            y_values = dim_to.bottom - y_values
+        order = np.argsort(y_knots)
+        return cls(dim_from.x_markings_sorted, dim_to.x_markings_sorted,
+                   y_knots[order], y_values[order],
+                   x_bounds=(dim_from.left, dim_from.right),
+                   y_bounds=tuple(dim_from.pitch_extent[2:]),
+                   centers=cls._dim_centers(dim_from))
+
+    @staticmethod
+    def _dim_centers(dim):
+        if not issubclass(type(dim), BaseDims):
+            raise TypeError('Invalid argument: dim should be a subclass of BaseDims, '
+                            'e.g. the dim attribute of a pitch.')
+        return (dim.left + dim.right) / 2, (dim.bottom + dim.top) / 2
+
+    @classmethod
+    def flip(cls, dim):
+        """ Create the transform that flips all the coordinates to the other side of the pitch,
+        like flip_side with flip=True.
+
+        Parameters
+        ----------
+        dim : mplsoccer pitch dimensions
+            The dimensions of the pitch, e.g. the dim attribute of a pitch.
+
+        Returns
+        -------
+        CoordinateTransform
+        """
+        x_center, y_center = cls._dim_centers(dim)
+        return cls((0, 1), (2 * x_center, 2 * x_center - 1),
+                   (0, 1), (2 * y_center, 2 * y_center - 1), centers=(x_center, y_center))
+
+    @classmethod
+    def invert_y(cls, dim):
+        """ Create the transform that reflects the y coordinates about the center of the pitch,
+        e.g. to convert from a pitch with an inverted y-axis to one without.
+
+        Parameters
+        ----------
+        dim : mplsoccer pitch dimensions
+            The dimensions of the pitch, e.g. the dim attribute of a pitch.
+
+        Returns
+        -------
+        CoordinateTransform
+        """
+        x_center, y_center = cls._dim_centers(dim)
+        return cls(y_knots=(0, 1), y_values=(2 * y_center, 2 * y_center - 1),
+                   centers=(x_center, y_center))
+
+    @classmethod
+    def vertical(cls):
+        """ Create the transform that swaps the x and y coordinates, like a vertical pitch.
+
+        Returns
+        -------
+        CoordinateTransform
+        """
+        return cls(swap=True)
+
+    def then(self, other):
+        """ Chain another transform after this one.
+
+        Parameters
+        ----------
+        other : CoordinateTransform
+            The transform to apply to the result of this transform.
+
+        Returns
+        -------
+        CoordinateTransform
+            A single transform equivalent to this transform followed by the other transform.
+        """
+        knots = [None, None]
+        values = [None, None]
+        bounds = [None, None]
+        for axis in range(2):
+            # the other transform's output axis uses this transform's output axis
+            first = other.source[axis]
+            knots1, values1 = self.knots[first], self.values[first]
+            inverse_knots, inverse_values = _invert(knots1, values1)
+            # the knots of both mappings in this transform's input coordinates
+            axis_knots = np.unique(np.concatenate([
+                knots1, _evaluate(other.knots[axis], inverse_knots, inverse_values)]))
+            knots[axis] = axis_knots
+            values[axis] = _evaluate(_evaluate(axis_knots, knots1, values1),
+                                     other.knots[axis], other.values[axis])
+            bounds[axis] = _intersect_bounds(
+                self.bounds[first], _map_bounds(other.bounds[axis], inverse_knots,
+                                                inverse_values))
+        swap = self.source[other.source[0]] == 1
+        # with swap=True the knots for the output x-axis are for the input y-axis
+        centers = self.centers
+        if centers is None and other.centers is not None:
+            centers = [None, None]
+            for axis in range(2):
+                inverse_knots, inverse_values = _invert(self.knots[axis], self.values[axis])
+                centers[self.source[axis]] = float(_evaluate(other.centers[axis], inverse_knots,
+                                                             inverse_values))
+        return CoordinateTransform(knots[0], values[0], knots[1], values[1],
+                                   x_bounds=bounds[0], y_bounds=bounds[1], swap=swap,
+                                   centers=centers)
+
+    def inverse(self):
+        """ The inverse transform.
+
+        If this transform clips the coordinates (e.g. from_standardizer), the inverse clips
+        the coordinates to the range of this transform.
+
+        Returns
+        -------
+        CoordinateTransform
+        """
+        knots = [None, None]
+        values = [None, None]
+        bounds = [None, None]
+        for axis in range(2):
+            # the inverse calculates this transform's input axis from its output axis
+            source = self.source[axis]
+            knots[source], values[source] = _invert(self.knots[axis], self.values[axis])
+            bounds[source] = _map_bounds(self.bounds[axis], self.knots[axis], self.values[axis])
+        centers = None
+        if self.centers is not None:
+            centers = tuple(float(_evaluate(self.centers[self.source[axis]], self.knots[axis],
+                                            self.values[axis])) for axis in range(2))
+        return CoordinateTransform(knots[0], values[0], knots[1], values[1],
+                                   x_bounds=bounds[0], y_bounds=bounds[1], swap=self.swap,
+                                   centers=centers)
+
+    def transform(self, x, y, flip=None, out=None, dtype=None):
+        """ Transform the coordinates.
+
+        Parameters
+        ----------
+        x, y : array-like or scalar.
+            Commonly, these parameters are 1D arrays.
+            Missing coordinates (NaN) stay NaN.
+        flip : array-like of boolean or boolean, default None
+            Whether to flip each coordinate to the other side of the pitch before
+            transforming it, like flip_side, e.g. for the second period.
+            Requires the transform to have centers, e.g. from_standardizer and flip.
+        out : tuple of numpy.ndarray, default None
+            The arrays to write the transformed x and y coordinates into.
+            They can be the x and y arrays to transform the coordinates in place.
+        dtype : numpy dtype, default None
+            The dtype of the result, e.g. numpy.float32 to halve the memory.
+            If None, uses float64. Ignored if out is given, as each coordinate
+            is transformed in the dtype of its out array.
+
+        Returns
+        -------
+        x_transformed, y_transformed : numpy.ndarray
+        """
+        inputs = [np.asarray(x), np.asarray(y)]
+        if inputs[0].shape != inputs[1].shape:
+            raise ValueError("x and y must be the same size")
+        if flip is not None:
+            if self.centers is None:
+                raise ValueError('flip requires a transform with centers, '
+                                 'e.g. created with from_standardizer.')
+            flip = np.broadcast_to(np.asarray(flip, dtype=bool), inputs[0].shape)
+        if out is None:
+            dtype = np.float64 if dtype is None else dtype
+            out = (np.empty(inputs[0].shape, dtype=dtype), np.empty(inputs[0].shape, dtype=dtype))
+        else:
+            if len(out) != 2 or any(array.shape != inputs[0].shape for array in out):
+                raise ValueError('out must be a tuple of two arrays the same shape as x and y')
+            if self.swap and np.shares_memory(out[0], inputs[0]):
+                # keep the input x-coordinates for the output y-axis
+                inputs[0] = inputs[0].copy()
+        for axis in range(2):
+            source = self.source[axis]
+            result = out[axis]
+            np.copyto(result, inputs[source], casting='unsafe')
+            if flip is not None:
+                np.subtract(2 * self.centers[source], result, out=result, where=flip,
+                            casting='unsafe')
+            if self.bounds[axis] is not None:
+                np.clip(result, *self.bounds[axis], out=result, casting='unsafe')
+            slopes = self._slopes[axis].astype(result.dtype, copy=False)
+            intercepts = self._intercepts[axis].astype(result.dtype, copy=False)
+            if slopes.size == 1:
+                result *= slopes[0]
+                result += intercepts[0]
+            elif slopes.size <= _MAX_COMPARISONS:
+                # counting the knots below each coordinate is faster than a binary search
+                # for the handful of knots in a pitch's markings
+                segment = np.zeros(result.shape, dtype=np.uint8)
+                below = np.empty(result.shape, dtype=bool)
+                for knot in self._inner_knots[axis]:
+                    np.greater_equal(result, knot, out=below)
+                    segment += below
+                result *= slopes[segment]
+                result += intercepts[segment]
+            else:
+                segment = np.searchsorted(self._inner_knots[axis], result, side='right')
+                result *= slopes[segment]
+                result += intercepts[segment]
+        return out[0], out[1]
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'x_knots={self.knots[0].tolist()}, x_values={self.values[0].tolist()}, '
+                f'y_knots={self.knots[1].tolist()}, y_values={self.values[1].tolist()}, '
+                f'x_bounds={self.bounds[0]}, y_bounds={self.bounds[1]}, swap={self.swap}, '
+                f'centers={self.centers})')
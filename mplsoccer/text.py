@@ -1,18 +1,24 @@
 """mplsoccer's text artists.
 
 The module contains ``CurvedText``, which draws text along a circular arc
-and is used by the radar and pizza charts to render curved parameter labels.
+and is used by the radar and pizza charts to render curved parameter labels,
+and ``text_collection``, which draws many short labels (e.g. heatmap labels)
+as a single collection of glyph paths.
 
 CurvedText author: PGupta-Git (https://github.com/PGupta-Git)
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 import warnings
 
 import numpy as np
 from matplotlib import cbook
+from matplotlib import rcParams
 from matplotlib.artist import Artist
+from matplotlib.collections import PathCollection
+from matplotlib.font_manager import FontProperties
 from matplotlib.patches import PathPatch
 from matplotlib.text import Text
 from matplotlib.textpath import TextPath, text_to_path
@@ -20,7 +26,7 @@ from matplotlib.transforms import Affine2D, Bbox
 
 from .utils import validate_ax
 
-__all__ = ['CurvedText']
+__all__ = ['CurvedText', 'text_collection']
 
 
 _Align = Literal["center", "start", "end"]
@@ -622,3 +628,109 @@ class CurvedText(Artist):
         inside = any(artist.contains(mouseevent)[0]
                      for artist in self.get_children())
         return inside, {}
+
+
+# keyword arguments for the font properties of text_collection
+_FONT_KWARGS = {'family': 'family', 'fontfamily': 'family', 'fontname': 'family',
+                'style': 'style', 'fontstyle': 'style',
+                'variant': 'variant', 'fontvariant': 'variant',
+                'weight': 'weight', 'fontweight': 'weight', 'stretch': 'stretch',
+                'fontstretch': 'stretch', 'size': 'size', 'fontsize': 'size'}
+
+
+@lru_cache(maxsize=4096)
+def _aligned_text_path(text, prop, ha, va):
+    """ The glyph path for a string in points, aligned to the origin like matplotlib.text.Text.
+
+    The paths are cached per string, font and alignment so repeated labels are only laid out once.
+    """
+    width, height, descent = text_to_path.get_text_width_height_descent(text, prop, ismath=False)
+    # matplotlib.text.Text uses the height and descent of 'lp' as the minimum line height
+    _, lp_height, lp_descent = text_to_path.get_text_width_height_descent('lp', prop,
+                                                                          ismath=False)
+    height = max(height, lp_height)
+    descent = max(descent, lp_descent)
+    xshift = {'left': 0, 'center': - width / 2, 'right': - width}[ha]
+    yshift = {'baseline': 0, 'bottom': descent, 'center': descent - height / 2,
+              'top': descent - height}[va]
+    path = TextPath((0, 0), text, prop=prop, usetex=False)
+    return path.transformed(Affine2D().translate(xshift, yshift))
+
+
+def text_collection(x, y, s, ax=None, vertical=False, ha='center', va='center', **kwargs):
+    """ Plot many text labels as a single matplotlib.collections.PathCollection.
+
+    The glyph paths are computed once for each unique string and font, and all the labels
+    are drawn in one collection with the label positions as offsets. This is much faster than
+    a matplotlib.text.Text per label for many labels, e.g. heatmap labels.
+    The labels are sized in points like Text, so they do not scale with the axes.
+    Math text, rotation, bounding boxes (bbox) and path effects are not supported,
+    use matplotlib.axes.Axes.text for those.
+
+    Parameters
+    ----------
+    x, y : array-like or scalar.
+        Commonly, these parameters are 1D arrays. These should be the label positions.
+    s : sequence of str
+        The labels.
+    ax : matplotlib.axes.Axes, default None
+        The axis to plot on.
+    vertical : bool, default False
+        If the orientation is vertical (True), then the code switches the x and y coordinates.
+    ha : str, default 'center'
+        The horizontal alignment: 'center', 'left' or 'right'.
+    va : str, default 'center'
+        The vertical alignment: 'center', 'top', 'bottom' or 'baseline'.
+    **kwargs : The font keyword arguments (fontproperties, family, style, variant, weight,
+        stretch and size and their font-prefixed versions, e.g. fontsize),
+        the color (color or c, which can be a color per label)
+        and all other keyword arguments are passed on to
+        matplotlib.collections.PathCollection, e.g. alpha, zorder or clip_on.
+
+    Returns
+    -------
+    collection : matplotlib.collections.PathCollection
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> from mplsoccer import text_collection
+    >>> fig, ax = plt.subplots()
+    >>> collection = text_collection([0.2, 0.5, 0.8], [0.5, 0.5, 0.5], ['1', '22', '333'],
+    ...                              fontsize=20, color='red', ax=ax)
+    """
+    validate_ax(ax)
+    valid_ha = ['center', 'left', 'right']
+    valid_va = ['center', 'top', 'bottom', 'baseline']
+    if ha not in valid_ha:
+        raise TypeError(f'Invalid argument: ha should be in {valid_ha}')
+    if va not in valid_va:
+        raise TypeError(f'Invalid argument: va should be in {valid_va}')
+    x = np.ravel(x)
+    y = np.ravel(y)
+    s = [str(text) for text in np.ravel(s)]
+    if x.size != y.size:
+        raise ValueError("x and y must be the same size")
+    if x.size != len(s):
+        raise ValueError("x and s must be the same size")
+    if any(cbook.is_math_text(text) for text in s):
+        raise ValueError("Math text is not supported, use matplotlib.axes.Axes.text instead.")
+    if vertical:
+        x, y = y, x
+
+    prop = kwargs.pop('fontproperties', kwargs.pop('font_properties', kwargs.pop('font', None)))
+    prop = FontProperties() if prop is None else FontProperties._from_any(prop).copy()
+    for key in list(kwargs):
+        if key in _FONT_KWARGS:
+            getattr(prop, f'set_{_FONT_KWARGS[key]}')(kwargs.pop(key))
+    color = kwargs.pop('color', kwargs.pop('c', rcParams['text.color']))
+    kwargs.setdefault('zorder', Text.zorder)
+
+    paths = [_aligned_text_path(text, prop, ha, va) for text in s]
+    collection = PathCollection(paths, offsets=np.column_stack([x, y]),
+                                offset_transform=ax.transData, facecolors=color,
+                                edgecolors='none', linewidths=0, **kwargs)
+    # the glyph paths are in points
+    collection.set_transform(Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans)
+    ax.add_collection(collection, autolim=False)
+    return collection
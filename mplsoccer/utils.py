@@ -3,18 +3,21 @@
 # The FontManager is taken from the ridge_map package by Colin Carroll (@colindcarroll)
 # ridge_map is available here: https://github.com/ColCarroll/ridge_map
 
+import threading
 import warnings
+from collections import OrderedDict
+from pathlib import Path
 from tempfile import NamedTemporaryFile
-from urllib.request import urlopen
 
 import matplotlib.font_manager as fm
 import numpy as np
+from matplotlib.image import AxesImage
 from PIL import Image
 
 
 __all__ = ['add_image', 'validate_ax', 'inset_axes',
            'set_visible', 'FontManager', 'set_labels', 'get_aspect',
-           'copy_doc', 'inset_image']
+           'copy_doc', 'inset_image', 'inset_images', 'ImageCache']
 
 
 def add_image(image, fig, left, bottom, width=None, height=None, **kwargs):
@@ -147,6 +150,239 @@ def inset_image(x, y, image, width=None, height=None, vertical=False, ax=None, *
     return ax_inset
 
 
+class ImageCache:
+    """ A cache of images that are decoded once and downsampled to their on-screen size.
+
+    Images given as a file path or URL are opened and decoded once. Each image is then
+    resized to the number of pixels it covers on screen (it is never enlarged), and the
+    resized array is reused while the image is drawn at the same size. This keeps the
+    render time and file size of graphics with the same badges many times (e.g. lineups
+    or league tables) independent of the source resolution.
+
+    Parameters
+    ----------
+    maxsize : int, default 256
+        The maximum number of decoded and resized images to keep.
+        The least recently used images are removed first.
+    resample : int, default PIL.Image.Resampling.LANCZOS
+        The Pillow resampling filter for downsampling.
+    cache_arrays : bool, default False
+        Whether to also cache in-memory images (arrays and PIL images). These are cached by
+        their identity, so an image modified in place returns the stale cached data and the
+        cache keeps the original images alive. If False, only file paths and URLs are cached.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mplsoccer import ImageCache
+    >>> cache = ImageCache(cache_arrays=True)
+    >>> badge = np.random.randint(0, 255, size=(1024, 1024, 4), dtype=np.uint8)
+    >>> small = cache.get(badge, size=(50, 50))
+    """
+
+    def __init__(self, maxsize=256, resample=Image.Resampling.LANCZOS, cache_arrays=False):
+        self.maxsize = maxsize
+        self.resample = resample
+        self.cache_arrays = cache_arrays
+        self._cache = OrderedDict()
+        # the cache can be shared by several render threads. The lock is held while an image
+        # is decoded or resized, so each image is only calculated once
+        self._lock = threading.RLock()
+
+    def _cached(self, key, func):
+        if key[1] is None:
+            return func()[1]
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key][1]
+            value = func()
+            self._cache[key] = value
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+            return value[1]
+
+    def _key(self, image):
+        """ The cache key of the image or None if the image is not cached."""
+        if isinstance(image, (str, Path)):
+            return str(image)
+        if not self.cache_arrays:
+            return None
+        # the image is stored in the cache with the value so the id is not reused
+        return id(image)
+
+    def decode(self, image):
+        """ Decode an image to a PIL image.
+
+        Parameters
+        ----------
+        image : str, pathlib.Path, array-like or PIL image
+            A file path or URL, or the image data.
+
+        Returns
+        -------
+        PIL.Image.Image
+        """
+        def decode():
+            if isinstance(image, (str, Path)):
+                if str(image).startswith(('http://', 'https://')):
+                    from urllib.request import urlopen
+                    with urlopen(str(image)) as response:
+                        decoded = Image.open(response)
+                        decoded.load()
+                else:
+                    decoded = Image.open(image)
+                    decoded.load()
+            elif isinstance(image, Image.Image):
+                decoded = image
+            else:
+                array = np.asarray(image)
+                # float images are in the range 0-1 like imshow
+                if array.dtype.kind == 'f':
+                    array = (np.clip(array, 0, 1) * 255).round().astype(np.uint8)
+                decoded = Image.fromarray(array)
+            # palette images are only resized with nearest neighbour resampling
+            if decoded.mode not in ['L', 'RGB', 'RGBA']:
+                decoded = decoded.convert('RGBA')
+            return image, decoded
+        return self._cached(('decoded', self._key(image)), decode)
+
+    def get(self, image, size=None):
+        """ Get the image as an array downsampled to fit the size in pixels.
+
+        Parameters
+        ----------
+        image : str, pathlib.Path, array-like or PIL image
+            A file path or URL, or the image data.
+        size : tuple of int, default None
+            The (width, height) in pixels to downsample to. The image is never enlarged.
+            If None, the image is returned at its full resolution.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape (height, width, n_channels).
+        """
+        decoded = self.decode(image)
+        if size is not None:
+            size = (max(int(round(size[0])), 1), max(int(round(size[1])), 1))
+            if size[0] >= decoded.width or size[1] >= decoded.height:
+                size = None
+
+        def resize():
+            resized = decoded if size is None else decoded.resize(size, resample=self.resample)
+            return image, np.asarray(resized)
+        return self._cached(('resized', self._key(image), size), resize)
+
+    def clear(self):
+        """ Remove all the images from the cache."""
+        with self._lock:
+            self._cache.clear()
+
+
+# the cache used by inset_images if a cache is not given
+_IMAGE_CACHE = ImageCache()
+
+
+def inset_images(x, y, images, width=None, height=None, vertical=False, dpi=None, cache=None,
+                 ax=None, **kwargs):
+    """ Adds many images centered on the x/y coordinates without creating an axes per image.
+
+    Each image is drawn as a matplotlib.image.AxesImage on the axes with an extent
+    in data coordinates, and is downsampled to its on-screen size with an ImageCache.
+    This is much faster than inset_image for many images, e.g. club badges.
+
+    Parameters
+    ----------
+    x, y: array-like or float
+        The x/y coordinates of the centers of the images.
+    images : sequence of images or an image
+        The images as file paths, URLs, arrays or PIL images. Either an image for each
+        coordinate or a single image used for all the coordinates.
+    width, height: float, default None
+        The width or height of the images in the data coordinates. Give only one of these
+        and the other is calculated from the aspect ratio of each image.
+    vertical : bool, default False
+        If the orientation is vertical (True), then the code switches the x and y coordinates.
+    dpi : float, default None
+        The resolution to downsample the images for. If None, uses the figure dpi.
+        Set this to the dpi used in savefig if it is higher than the figure dpi.
+    cache : mplsoccer.ImageCache, default None
+        The cache for the decoded and resized images. If None, a module-level cache is used.
+        Unless the cache has cache_arrays=True, in-memory images are only cached for this call.
+    ax : matplotlib.axes.Axes, default None
+        The axis to plot on.
+    **kwargs : All other keyword arguments are passed on to matplotlib.image.AxesImage,
+        e.g. alpha, zorder and interpolation.
+
+    Returns
+    -------
+    list of matplotlib.image.AxesImage
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> import numpy as np
+    >>> from mplsoccer import inset_images
+    >>> fig, ax = plt.subplots()
+    >>> badge = np.random.randint(0, 255, size=(1024, 1024, 4), dtype=np.uint8)
+    >>> images = inset_images([0.2, 0.5, 0.8], [0.5, 0.5, 0.5], badge, width=0.1, ax=ax)
+    """
+    validate_ax(ax)
+    if height is not None and width is not None:
+        raise TypeError('Invalid argument: you must only give one of height or width not both')
+    if height is None and width is None:
+        raise TypeError('Invalid argument: you must supply one of height or width')
+    x = np.ravel(x)
+    y = np.ravel(y)
+    if x.size != y.size:
+        raise ValueError("x and y must be the same size")
+    if (isinstance(images, (str, Path, Image.Image)) or
+            (isinstance(images, np.ndarray) and images.ndim > 1)):
+        images = [images] * x.size
+    if len(images) != x.size:
+        raise ValueError("images must be a single image or an image for each coordinate")
+    if vertical:
+        x, y = y, x
+    cache = _IMAGE_CACHE if cache is None else cache
+    # in-memory images are only cached for this call, so the same image is resized once
+    array_cache = cache if cache.cache_arrays else ImageCache(resample=cache.resample,
+                                                              cache_arrays=True)
+    dpi = ax.figure.dpi if dpi is None else dpi
+
+    ax_aspect = ax.get_aspect()
+    if ax_aspect == 'auto':
+        ax_aspect = get_aspect(ax)
+    # the axes position is adjusted for the aspect when drawn, so adjust it now
+    ax.apply_aspect()
+    pixels_per_unit = np.abs(np.diff(ax.transData.transform([[0, 0], [1, 1]]), axis=0)[0])
+    pixels_per_unit = pixels_per_unit * dpi / ax.figure.dpi
+    # the images are placed upright on screen even if the axes are inverted
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    xsign, ysign = np.sign(xlim[1] - xlim[0]), np.sign(ylim[1] - ylim[0])
+    kwargs.setdefault('zorder', 3)
+
+    artists = []
+    for x_center, y_center, image in zip(x, y, images):
+        image_cache = cache if isinstance(image, (str, Path)) else array_cache
+        image_width, image_height = image_cache.decode(image).size
+        image_aspect = image_height / image_width
+        image_box_width, image_box_height = width, height
+        if image_box_width is None:
+            image_box_width = height / image_aspect * ax_aspect
+        else:
+            image_box_height = width * image_aspect / ax_aspect
+        data = image_cache.get(image, size=(image_box_width * pixels_per_unit[0],
+                                            image_box_height * pixels_per_unit[1]))
+        extent = (x_center - xsign * image_box_width / 2, x_center + xsign * image_box_width / 2,
+                  y_center - ysign * image_box_height / 2, y_center + ysign * image_box_height / 2)
+        artist = AxesImage(ax, extent=extent, origin='upper', **kwargs)
+        artist.set_data(data)
+        ax.add_image(artist)
+        artists.append(artist)
+    return artists
+
+
 def validate_ax(ax):
     """ Error message when ax is missing."""
     if ax is None:
@@ -334,6 +570,7 @@ class FontManager:
                  url=('https://raw.githubusercontent.com/googlefonts/roboto/main/'
                       'src/hinted/Roboto-Regular.ttf')):
         self.url = url
+        from urllib.request import urlopen
         with NamedTemporaryFile(delete=False, suffix=".ttf") as temp_file:
             temp_file.write(urlopen(self.url).read())
             self._prop = fm.FontProperties(fname=temp_file.name)
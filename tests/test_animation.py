@@ -0,0 +1,101 @@
+""" Test animating tracking data with the pitch animate method."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from matplotlib.animation import FuncAnimation
+
+from mplsoccer import Pitch, VerticalPitch
+
+
+def tracking_data(num_frames=20, num_players=22):
+    rng = np.random.default_rng(0)
+    frames_xy = rng.uniform(low=(1, 1), high=(119, 79), size=(num_frames, num_players, 2))
+    frames_xy[5, 3] = np.nan
+    teams = np.repeat(['home', 'away'], num_players // 2)
+    ball_xy = rng.uniform(low=(1, 1), high=(119, 79), size=(num_frames, 2))
+    return frames_xy, teams, ball_xy
+
+
+def test_update_artists():
+    """ The scatter offsets should be updated in place (flipped for vertical pitches)."""
+    frames_xy, teams, ball_xy = tracking_data()
+    for pitch, columns in [(Pitch(), [0, 1]), (VerticalPitch(), [1, 0])]:
+        for overlay in [None, 'voronoi', 'hull']:
+            fig, ax = pitch.draw()
+            num_collections = len(ax.collections)
+            anim = pitch.animate(frames_xy, teams, ball_xy, ax=ax, start=2, step=3,
+                                 trail_length=5, overlay=overlay)
+            assert isinstance(anim, FuncAnimation)
+            for frame in [5, 8]:
+                anim._func(frame)
+                away, home, ball = ax.collections[num_collections: num_collections + 3]
+                assert np.allclose(away.get_offsets(), frames_xy[frame, 11:][:, columns])
+                assert np.allclose(home.get_offsets(), frames_xy[frame, :11][:, columns],
+                                   equal_nan=True)
+                assert np.allclose(ball.get_offsets(), ball_xy[frame: frame + 1, columns])
+
+
+def test_writer(tmp_path):
+    """ The frames can be written directly to a writer."""
+    frames_xy, teams, ball_xy = tracking_data(num_frames=6)
+    pitch = Pitch()
+    fig, ax = pitch.draw(figsize=(4, 3))
+    filename = tmp_path / 'animation.gif'
+    result = pitch.animate(frames_xy, teams, ball_xy, ax=ax, step=2, filename=filename,
+                           writer='pillow', dpi=20)
+    assert result is None
+    assert filename.exists()
+
+
+def test_invalid_arguments():
+    frames_xy, teams, ball_xy = tracking_data()
+    pitch = Pitch()
+    fig, ax = pitch.draw()
+    with pytest.raises(ValueError):
+        pitch.animate(frames_xy, teams, ball_xy, ax=ax, start=30)
+    with pytest.raises(ValueError):
+        pitch.animate(frames_xy[..., 0], teams, ball_xy, ax=ax)
+    with pytest.raises(ValueError):
+        pitch.animate(frames_xy, teams[:5], ball_xy, ax=ax)
+    with pytest.raises(TypeError):
+        pitch.animate(frames_xy, teams, ball_xy, ax=ax, overlay='delaunay')
+
+
+def test_save_animation(tmp_path):
+    """ The frames are rendered in chunks and written as image sequences."""
+    frames_xy, teams, ball_xy = tracking_data(num_frames=12)
+    pitch = Pitch()
+    directory = pitch.save_animation(frames_xy, teams, ball_xy, filename=tmp_path / 'match.mp4',
+                                     frame_format='png', figsize=(4, 3), dpi=50, n_jobs=2,
+                                     chunk_size=4, step=2, trail_length=3, overlay='hull')
+    assert directory == str(tmp_path / 'match')
+    assert sorted(path.name for path in (tmp_path / 'match').iterdir()) == [
+        f'frame_{position:06d}.png' for position in range(6)]
+    directory = pitch.save_animation(frames_xy, teams, ball_xy, filename=tmp_path / 'raw',
+                                     frame_format='rgba', figsize=(4, 3), dpi=50, n_jobs=1,
+                                     chunk_size=5)
+    chunks = sorted((tmp_path / 'raw').iterdir())
+    assert len(chunks) == 3
+    frames = np.fromfile(chunks[0], dtype=np.uint8).reshape(-1, 150, 200, 4)
+    assert frames.shape[0] == 5
+    assert not np.array_equal(frames[0], frames[1])
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='uses a shell script as a fake ffmpeg')
+def test_save_animation_failure_cleans_up(tmp_path, monkeypatch):
+    """ The temporary segments are removed and ffmpeg is stopped if encoding fails."""
+    bin_directory = tmp_path / 'bin'
+    bin_directory.mkdir()
+    ffmpeg = bin_directory / 'ffmpeg'
+    ffmpeg.write_text('#!/bin/sh\ncat > /dev/null\nexit 1\n')
+    ffmpeg.chmod(0o755)
+    monkeypatch.setenv('PATH', f'{bin_directory}{os.pathsep}{os.environ["PATH"]}')
+    frames_xy, teams, ball_xy = tracking_data(num_frames=6)
+    output = tmp_path / 'video'
+    with pytest.raises(RuntimeError):
+        Pitch().save_animation(frames_xy, teams, ball_xy, filename=output / 'match.mp4',
+                               figsize=(4, 3), dpi=50, n_jobs=1)
+    assert list(output.iterdir()) == []
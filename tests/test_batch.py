@@ -0,0 +1,77 @@
+""" Test rendering charts in a batch across a process pool."""
+
+import io
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from mplsoccer import Pitch, render_batch
+
+
+def make_figure():
+    """ A callable chart spec."""
+    pitch = Pitch()
+    fig, ax = pitch.draw(figsize=(4, 3))
+    pitch.scatter([60], [40], ax=ax)
+    return fig
+
+
+def make_specs(num_specs):
+    rng = np.random.default_rng(42)
+    specs = [{'pitch': {'pitch_type': 'opta'}, 'draw': {'figsize': (4, 3)},
+              'layers': [('scatter', (rng.uniform(0, 100, 20), rng.uniform(0, 100, 20)), {'s': 10}),
+                         ('ax.set_title', ('chart',))]}
+             for _ in range(num_specs)]
+    specs.append(make_figure)
+    return specs
+
+
+def decode(result):
+    return np.asarray(Image.open(io.BytesIO(result.output)))
+
+
+def test_reused_figure_matches_fresh_figure():
+    """ Charts drawn on a reused figure should be identical to a fresh figure."""
+    specs = make_specs(6)
+    serial = list(render_batch(specs, max_workers=1))
+    parallel = list(render_batch(specs, max_workers=2, chunksize=1))
+    assert [result.index for result in parallel] == list(range(len(specs)))
+    for result_serial, result_parallel in zip(serial, parallel):
+        assert result_parallel.seconds > 0
+        assert np.array_equal(decode(result_serial), decode(result_parallel))
+    fresh = list(render_batch(specs[3:5], max_workers=2, chunksize=1))
+    assert np.array_equal(decode(fresh[0]), decode(serial[3]))
+
+
+def test_filename(tmp_path):
+    """ Specs with a filename return the path."""
+    specs = make_specs(2)[:2]
+    for i, spec in enumerate(specs):
+        spec['filename'] = tmp_path / f'chart_{i}.png'
+    results = list(render_batch(specs, max_workers=1))
+    assert [result.output for result in results] == [str(spec['filename']) for spec in specs]
+    assert Image.open(results[1].output).size == (400, 300)
+
+
+def test_serial_batch_closes_figures():
+    """ The figures reused in the current process are closed when the batch finishes."""
+    figures = plt.get_fignums()
+    list(render_batch(make_specs(3), max_workers=1))
+    assert plt.get_fignums() == figures
+
+
+def test_invalid_spec():
+    """ Invalid specs raise an error when render_batch is called."""
+    with pytest.raises(TypeError):
+        render_batch([1])
+
+
+def test_stop_early():
+    """ Stopping early cancels the charts that have not started."""
+    results = render_batch(make_specs(40), max_workers=2, chunksize=1)
+    assert next(results).index == 0
+    results.close()
+    with pytest.raises(StopIteration):
+        next(results)
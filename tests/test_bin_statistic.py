@@ -2,8 +2,9 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 
-from mplsoccer import Pitch
+from mplsoccer import Pitch, Standardizer
 from mplsoccer.soccer.dimensions import valid, size_varies
 
 
@@ -142,3 +143,89 @@ def test_bin_statistic_positional_xedge():
                               size=x.size)
         stats = pitch.bin_statistic_positional(x, y)
         assert stats['statistic'].sum() == 9000000
+
+
+@pytest.mark.parametrize('pitch_type', ['opta', 'statsbomb', 'wyscout'])
+def test_bin_statistic_standardizer(pitch_type):
+    """ Test binning the raw points with converted bin edges matches binning the
+    standardized points."""
+    pitch = Pitch(pitch_type=pitch_type)
+    uefa = Pitch(pitch_type='uefa')
+    standardizer = Standardizer(pitch_from=pitch_type, pitch_to='uefa')
+    rng = np.random.default_rng(42)
+    extent = pitch.dim.pitch_extent
+    # include points outside the pitch, which are clipped like Standardizer.transform
+    x = rng.uniform(extent[0] - 5, extent[1] + 5, 100000)
+    y = rng.uniform(extent[2] - 5, extent[3] + 5, 100000)
+    x_std, y_std = standardizer.transform(x, y)
+    for bins in [(6, 5), 10, ([0, 16.5, 52.5, 88.5, 105], [0, 13.84, 54.16, 68])]:
+        expected = uefa.bin_statistic(x_std, y_std, values=y_std, statistic='mean', bins=bins)
+        result = pitch.bin_statistic(x, y, values=y_std, statistic='mean', bins=bins,
+                                     standardizer=standardizer)
+        assert np.array_equal(result['statistic'], expected['statistic'], equal_nan=True)
+        assert np.array_equal(result['binnumber'], expected['binnumber'])
+        # the grids are in the raw pitch coordinates
+        x_grid, y_grid = standardizer.transform(result['x_grid'], result['y_grid'])
+        assert np.allclose(x_grid, expected['x_grid'])
+        assert np.allclose(y_grid, expected['y_grid'])
+    for positional in ['full', 'horizontal', 'vertical']:
+        expected = uefa.bin_statistic_positional(x_std, y_std, positional=positional)
+        result = pitch.bin_statistic_positional(x, y, positional=positional,
+                                                standardizer=standardizer)
+        assert np.array_equal(result['statistic'], expected['statistic'])
+        assert np.array_equal(result['binnumber'], expected['binnumber'])
+        assert result['names'] == expected['names']
+
+
+def test_bin_statistic_standardizer_invalid():
+    """ Test the standardizer must convert from the pitch coordinates."""
+    standardizer = Standardizer(pitch_from='opta', pitch_to='uefa')
+    with pytest.raises(ValueError):
+        Pitch(pitch_type='statsbomb').bin_statistic([10], [10], standardizer=standardizer)
+    with pytest.raises(ValueError):
+        Pitch(pitch_type='opta').bin_statistic([10], [10], standardized=True,
+                                               standardizer=standardizer)
+    with pytest.raises(ValueError):
+        Pitch(pitch_type='opta').bin_statistic([10], [10], bins=[[110, 200], [0, 68]],
+                                               standardizer=standardizer)
+
+
+def test_bin_statistic_binnumber_dtype():
+    """ Test the binnumber dtype option and float32 coordinates."""
+    pitch = Pitch(pitch_type='opta')
+    rng = np.random.default_rng(42)
+    x = rng.uniform(-5, 105, 1000).astype(np.float32)
+    y = rng.uniform(-5, 105, 1000).astype(np.float32)
+    expected = pitch.bin_statistic(x, y)
+    result = pitch.bin_statistic(x, y, binnumber_dtype=np.int16)
+    assert result['binnumber'].dtype == np.int16
+    assert np.array_equal(result['binnumber'], expected['binnumber'])
+    expected = pitch.bin_statistic_positional(x, y)
+    result = pitch.bin_statistic_positional(x, y, binnumber_dtype=np.int8)
+    assert result['binnumber'].dtype == np.int8
+    assert np.array_equal(result['binnumber'], expected['binnumber'])
+    assert np.array_equal(result['statistic'], expected['statistic'])
+    with pytest.raises(TypeError):
+        pitch.bin_statistic(x, y, binnumber_dtype=np.uint16)
+    with pytest.raises(ValueError):
+        pitch.bin_statistic(x, y, bins=200, binnumber_dtype=np.int8)
+
+
+@pytest.mark.parametrize('pitch_type', ['opta', 'wyscout', 'statsbomb'])
+def test_bin_statistic_lattice(pitch_type):
+    """ Test looking up the bins of the lattice points gives the same statistics."""
+    pitch = Pitch(pitch_type=pitch_type)
+    extent = pitch.dim.pitch_extent
+    rng = np.random.default_rng(42)
+    x = np.round(rng.uniform(extent[0] - 2, extent[1] + 2, 10000), 1)
+    y = np.round(rng.uniform(extent[2] - 2, extent[3] + 2, 10000), 1)
+    x[::99] = 50.123  # off the lattice
+    for bins in [(6, 5), 12, ([extent[0], 20.3, 50, extent[1]], 5)]:
+        for statistic in ['count', 'mean']:
+            expected = pitch.bin_statistic(x, y, values=y, statistic=statistic, bins=bins)
+            for lattice in [0.1, 'auto']:
+                result = pitch.bin_statistic(x, y, values=y, statistic=statistic, bins=bins,
+                                             lattice=lattice)
+                for key, value in expected.items():
+                    if value is not None:
+                        assert np.array_equal(result[key], value, equal_nan=True), key
@@ -2,16 +2,24 @@
 
 from dataclasses import asdict
 
+import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 from matplotlib.collections import PatchCollection
 from matplotlib.patches import Wedge
 
-from mplsoccer import Pitch, VerticalPitch
+from mplsoccer import Pitch, Standardizer, VerticalPitch
 from mplsoccer.heatmap import BinnedStatisticResult, bin_statistic
 from mplsoccer.soccer.dimensions import valid, size_varies
 
 
+@pytest.fixture(autouse=True)
+def close_figures():
+    """ Close the figures drawn by each test."""
+    yield
+    plt.close('all')
+
+
 def pitch_kwargs(pitch_type):
     """ Extra keyword arguments needed to create a pitch of the given type."""
     if pitch_type in size_varies:
@@ -624,3 +632,21 @@ def test_sonar_grid_unchanged():
         for xindex in range(3):
             heights = [patch.get_height() for patch in axs[yindex, xindex].patches]
             assert np.allclose(heights, np.nan_to_num(stats['statistic'][yindex, xindex]))
+
+
+def test_standardizer_zones():
+    """ Test zones in the standardized coordinates bin the raw points the same as
+    binning the standardized points."""
+    pitch = Pitch(pitch_type='statsbomb')
+    uefa = Pitch(pitch_type='uefa')
+    standardizer = Standardizer(pitch_from='statsbomb', pitch_to='uefa')
+    x, y = random_points(pitch, 10000, pad=0.1)
+    x_std, y_std = standardizer.transform(x, y)
+    zones = [(0, 52.5, 0, 68), (52.5, 105, 0, 13.84), (52.5, 105, 13.84, 68)]
+    expected = uefa.bin_statistic_zones(x_std, y_std, zones)
+    result = pitch.bin_statistic_zones(x, y, zones, standardizer=standardizer)
+    assert np.array_equal(result['statistic'], expected['statistic'])
+    assert np.array_equal(result['binnumber'], expected['binnumber'])
+    # the zones are converted to the statsbomb coordinates
+    assert np.allclose(result['cx'], [30, 90, 90])
+    assert np.allclose(result['area'], [60 * 80, 60 * 18, 60 * 62])
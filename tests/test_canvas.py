@@ -0,0 +1,59 @@
+""" Test the PitchCanvas, which reuses a figure for many charts."""
+
+import io
+
+import numpy as np
+
+from mplsoccer import Pitch, VerticalPitch, PitchCanvas
+
+
+def render(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='rgba')
+    return buffer.getvalue()
+
+
+def plot_data(pitch, ax):
+    x = np.random.uniform(0, 120, 100)
+    y = np.random.uniform(0, 80, 100)
+    pitch.scatter(x, y, ax=ax, label='shots')
+    pitch.lines(x[:10], y[:10], x[10:20], y[10:20], comet=True, ax=ax)
+    pitch.arrows(x[:10], y[:10], x[10:20], y[10:20], ax=ax)
+    stats = pitch.bin_statistic(x, y, bins=(6, 5))
+    mesh = pitch.heatmap(stats, ax=ax)
+    pitch.label_heatmap(stats, ax=ax)
+    pitch.inset_axes(60, 40, width=10, height=10, ax=ax)
+    ax.figure.colorbar(mesh, ax=ax)
+    ax.legend()
+    ax.set_title('chart')
+    ax.set_title('team', loc='left')
+    ax.set_title('date', loc='right')
+
+
+def test_clear_data_restores_figure():
+    """ Clearing the data should give the same image as the freshly drawn pitch."""
+    for pitch in [Pitch(), VerticalPitch(pitch_type='opta', half=True)]:
+        canvas = PitchCanvas(pitch, figsize=(6, 4))
+        empty = render(canvas.fig)
+        num_pitch_artists = len(canvas.ax.get_children())
+        plot_data(pitch, canvas.ax)
+        assert len(canvas.data_artists()) > 0
+        render(canvas.fig)
+        canvas.clear_data()
+        assert canvas.data_artists() == []
+        assert [canvas.ax.get_title(loc=loc) for loc in ['left', 'center', 'right']] == [''] * 3
+        assert len(canvas.ax.get_children()) == num_pitch_artists
+        assert all(canvas.is_pitch_artist(artist) for artist in canvas.ax.get_children())
+        assert render(canvas.fig) == empty
+
+
+def test_existing_axes():
+    """ The canvas can use an existing axes."""
+    fig, axs = Pitch().draw(nrows=2, ncols=2)
+    pitch = Pitch(pitch_color='grass')
+    canvas = PitchCanvas(pitch, ax=axs[0, 0])
+    assert canvas.fig is fig
+    num_children = len(axs[0, 0].get_children())
+    pitch.scatter([60], [40], ax=axs[0, 0])
+    canvas.clear_data()
+    assert len(axs[0, 0].get_children()) == num_children
@@ -0,0 +1,51 @@
+""" Test the cached, read-only pitch dimensions."""
+
+import dataclasses
+import pickle
+
+import numpy as np
+import pytest
+
+from mplsoccer import Pitch, Standardizer, VerticalPitch
+from mplsoccer.soccer.dimensions import create_pitch_dims, uefa_dims
+
+
+def test_dims_are_shared():
+    """ Test pitches and standardizers with the same pitch type share the dimensions."""
+    dim = create_pitch_dims('opta')
+    assert create_pitch_dims('opta', pitch_width=68, pitch_length=105) is dim
+    assert Pitch(pitch_type='opta').dim is dim
+    assert VerticalPitch(pitch_type='opta').dim is dim
+    assert Standardizer(pitch_from='opta', pitch_to='uefa').dim_from is dim
+    tracab = create_pitch_dims('tracab', pitch_width=68, pitch_length=105)
+    assert create_pitch_dims('tracab', pitch_width=68, pitch_length=105) is tracab
+    assert create_pitch_dims('tracab', pitch_width=70, pitch_length=105) is not tracab
+
+
+def test_dims_are_read_only():
+    """ Test the cached dimensions and their arrays can not be modified."""
+    dim = create_pitch_dims('statsbomb')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        dim.left = 10
+    with pytest.raises(ValueError):
+        dim.pitch_extent[0] = 10
+    modified = dataclasses.replace(dim, pitch_width=70)
+    assert modified.pitch_width == 70
+    modified.left = 10
+    # dimensions created directly are not read-only
+    uefa = uefa_dims()
+    uefa.pad_default = 10
+
+
+def test_lazy_formations():
+    """ Test the formations are created when they are first used and match the positions."""
+    dim = uefa_dims()
+    assert 'formations' not in vars(dim)
+    formations = dim.formations
+    assert dim.formations is formations
+    goalkeeper = formations['442'][0]
+    assert goalkeeper.x == dim.position_line5.GK.x
+    assert np.isclose(goalkeeper.y, dim.center_width)
+    # the lazily created attributes survive pickling, e.g. for multiprocessing
+    restored = pickle.loads(pickle.dumps(create_pitch_dims('wyscout')))
+    assert list(restored.formations) == list(create_pitch_dims('wyscout').formations)
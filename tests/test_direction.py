@@ -0,0 +1,84 @@
+""" Test normalizing the attacking direction of event and tracking data."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mplsoccer import DirectionNormalizer, Pitch
+
+DIRECTIONS = {('home', 1): 'right', ('home', 2): 'left',
+              ('away', 1): 'left', ('away', 2): 'right'}
+
+
+@pytest.mark.parametrize('pitch_type', ['statsbomb', 'opta', 'tracab', 'metricasports'])
+def test_transform_matches_flip_side(pitch_type):
+    """ Test the direction table flips the same coordinates as flip_side."""
+    kwargs = {'pitch_length': 105, 'pitch_width': 68} if pitch_type in ['tracab',
+                                                                        'metricasports'] else {}
+    pitch = Pitch(pitch_type=pitch_type, **kwargs)
+    normalizer = DirectionNormalizer(DIRECTIONS, pitch_type=pitch_type, **kwargs)
+    rng = np.random.default_rng(42)
+    x = rng.uniform(pitch.dim.left, pitch.dim.right, 1000)
+    y = rng.uniform(min(pitch.dim.bottom, pitch.dim.top), max(pitch.dim.bottom, pitch.dim.top),
+                    1000)
+    teams = rng.choice(['home', 'away'], 1000)
+    periods = rng.choice([1, 2], 1000)
+    flip = normalizer.flip_mask(teams, periods)
+    assert np.array_equal(flip, (teams == 'home') == (periods == 2))
+    x_expected, y_expected = pitch.flip_side(x, y, flip)
+    x_result, y_result = normalizer.transform(x, y, teams, periods)
+    assert np.allclose(x_result, x_expected)
+    assert np.allclose(y_result, y_expected)
+
+
+def test_transform_frame():
+    """ Test flipping several dataframe column pairs."""
+    df = pd.DataFrame({'x': [10., 10., 10.], 'y': [20., 20., 20.],
+                       'end_x': [30., np.nan, 30.], 'end_y': [40., np.nan, 40.],
+                       'team_id': ['home', 'away', 'home'], 'period': [1, 1, 2]})
+    normalizer = DirectionNormalizer(DIRECTIONS, pitch_type='opta')
+    result = normalizer.transform_frame(df, inplace=False)
+    assert np.allclose(result['x'], [10, 90, 90])
+    assert np.allclose(result['end_y'], [40, np.nan, 60], equal_nan=True)
+    assert np.allclose(df['x'], 10)
+    assert normalizer.transform_frame(df, pairs=[('x', 'y')]) is None
+    assert np.allclose(df['y'], [20, 80, 80])
+    assert np.allclose(df['end_x'], [30, np.nan, 30], equal_nan=True)
+
+
+def test_from_goalkeepers():
+    """ Test inferring the direction table from the goalkeepers in tracking data."""
+    rng = np.random.default_rng(42)
+    frames = rng.uniform(-5000, 5000, size=(100, 4, 2))
+    periods = np.repeat([1, 2], 50)
+    teams = ['home', 'home', 'away', 'away']
+    frames[:50, 0, 0] = -4800
+    frames[50:, 0, 0] = 4800
+    frames[:50, 2, 0] = 4800
+    # the away goalkeeper is missing in the second period
+    frames[50:, 2] = np.nan
+    normalizer = DirectionNormalizer.from_goalkeepers(
+        frames, teams, periods, goalkeepers=[True, False, True, False], pitch_type='tracab',
+        pitch_length=100, pitch_width=70)
+    assert normalizer.directions == DIRECTIONS
+
+    expected = frames.copy()
+    flip = normalizer.flip_mask(teams, periods[:, np.newaxis])
+    expected[flip] *= -1
+    result = normalizer.transform_array(frames, teams, periods[:, np.newaxis], out=frames)
+    assert result is frames
+    assert np.allclose(frames, expected, equal_nan=True)
+    assert (frames[:, 0, 0] < 0).all()
+
+
+def test_invalid_directions():
+    """ Test invalid and missing directions raise a ValueError."""
+    with pytest.raises(ValueError):
+        DirectionNormalizer({('home', 1): 'up'})
+    normalizer = DirectionNormalizer(DIRECTIONS)
+    with pytest.raises(ValueError):
+        normalizer.flip_mask(['home', 'other'], 1)
+    frames = np.full((10, 2, 2), np.nan)
+    with pytest.raises(ValueError):
+        DirectionNormalizer.from_goalkeepers(frames, ['home', 'away'], np.ones(10),
+                                             goalkeepers=[True, True])
@@ -0,0 +1,63 @@
+""" Test the flow map statistics and arrows."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from scipy.stats import circmean
+
+from mplsoccer import Pitch, VerticalPitch
+
+
+def _movements(pitch, size=2000, seed=42):
+    rng = np.random.default_rng(seed)
+    xmin, xmax = sorted([pitch.dim.left, pitch.dim.right])
+    ymin, ymax = sorted([pitch.dim.bottom, pitch.dim.top])
+    return (rng.uniform(xmin, xmax, size), rng.uniform(ymin, ymax, size),
+            rng.uniform(xmin, xmax, size), rng.uniform(ymin, ymax, size))
+
+
+@pytest.mark.parametrize('pitch_type', ['statsbomb', 'opta', 'wyscout', 'uefa'])
+def test_flow_statistic_matches_bin_statistic(pitch_type):
+    """ Test the fused statistics match separate bin_statistic calls with scipy's circmean."""
+    pitch = Pitch(pitch_type=pitch_type)
+    xstart, ystart, xend, yend = _movements(pitch)
+    stats = pitch.flow_statistic(xstart, ystart, xend, yend, bins=(6, 4))
+
+    angle, distance = pitch.calculate_angle_and_distance(xstart, ystart, xend, yend)
+    standardized = not pitch.dim.aspect_equal
+    if standardized:
+        xstart, ystart = pitch.standardizer.transform(xstart, ystart)
+    bs_distance = pitch.bin_statistic(xstart, ystart, values=distance, statistic='mean',
+                                      bins=(6, 4), standardized=standardized)
+    bs_angle = pitch.bin_statistic(xstart, ystart, values=angle, statistic=circmean,
+                                   bins=(6, 4), standardized=standardized)
+    bs_count = pitch.bin_statistic(xstart, ystart, bins=(6, 4), standardized=standardized)
+    assert np.allclose(stats['distance'], bs_distance['statistic'])
+    assert np.allclose(stats['angle'], bs_angle['statistic'])
+    assert np.allclose(stats['statistic'], bs_count['statistic'])
+
+
+def test_flow_statistic_empty_and_nan():
+    """ Test empty bins are NaN and missing end locations are excluded from the means."""
+    pitch = Pitch()
+    stats = pitch.flow_statistic([10, 10, 10], [10, 10, 10], [20, 10, np.nan], [10, 20, 20],
+                                 bins=(2, 2))
+    assert np.nansum(stats['statistic']) == 3
+    assert np.isnan(stats['angle']).sum() == 3
+    assert np.isclose(np.nanmax(stats['distance']), 10)
+    # the mean of 0 and 270 degrees (statsbomb's y-axis is inverted)
+    assert np.isclose(np.nanmax(stats['angle']), 7 * np.pi / 4)
+
+
+def test_flow_arrows_from_statistic():
+    """ Test flow is the same as drawing the flow_statistic with flow_arrows."""
+    pitch = VerticalPitch(pitch_type='opta')
+    xstart, ystart, xend, yend = _movements(pitch)
+    fig, ax = pitch.draw()
+    quiver = pitch.flow(xstart, ystart, xend, yend, bins=(6, 4), arrow_type='scale', ax=ax)
+    stats = pitch.flow_statistic(xstart, ystart, xend, yend, bins=(6, 4))
+    quiver_stats = pitch.flow_arrows(stats, arrow_type='scale', ax=ax)
+    assert np.allclose(quiver.U, quiver_stats.U)
+    assert np.allclose(quiver.V, quiver_stats.V)
+    assert np.allclose(quiver.get_array(), stats['statistic'].ravel())
+    plt.close(fig)
@@ -0,0 +1,115 @@
+""" Test the formation plotting and the vectorized formation coordinates."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.collections import PathCollection
+
+from mplsoccer import Pitch, VerticalPitch
+
+POSITIONS_442 = [1, 2, 3, 5, 6, 9, 11, 12, 16, 22, 24]
+
+
+@pytest.mark.parametrize('pitch_type', ['statsbomb', 'opta', 'wyscout', 'uefa'])
+def test_formation_coordinates_match_formation(pitch_type):
+    """ Test formation_coordinates returns the same coordinates as the formations."""
+    pitch = Pitch(pitch_type=pitch_type)
+    formations = []
+    positions = []
+    expected = []
+    for formation in pitch.formations:
+        for position in pitch.get_formation(formation):
+            # some StatsBomb positions do not have an identifier
+            for identifier in pitch._position_identifiers(position):
+                formations.append(formation)
+                positions.append(identifier)
+                expected.append([position.x_half_flip, position.y_half_flip])
+    x, y = pitch.formation_coordinates(formations, positions, flip=True, half=True)
+    assert np.allclose(np.column_stack([x, y]), expected)
+
+
+def test_formation_coordinates_per_player_flip():
+    """ Test a flip and half for each player and normalizing the formation names."""
+    pitch = Pitch()
+    formation = pitch.get_formation('442')
+    x, y = pitch.formation_coordinates(['4-4-2', '442', '442'], [1, 24.0, 24],
+                                       flip=[False, True, False], half=[False, False, True])
+    gk, lcf = formation[0], formation[-1]
+    assert np.allclose(x, [gk.x, lcf.x_flip, lcf.x_half])
+    assert np.allclose(y, [gk.y, lcf.y_flip, lcf.y_half])
+
+
+def test_formation_coordinates_invalid():
+    """ Test invalid formations and positions raise a ValueError."""
+    pitch = Pitch()
+    with pytest.raises(ValueError):
+        pitch.formation_coordinates('442', [1, 99])
+    with pytest.raises(ValueError):
+        pitch.formation_coordinates('999', [1])
+    with pytest.raises(ValueError):
+        pitch.formation_coordinates(['442', '442'], [1, 2, 3])
+
+
+def test_formation_duplicate_positions():
+    """ Test a position contained multiple times raises a ValueError."""
+    pitch = Pitch(pitch_type='opta')
+    fig, ax = pitch.draw()
+    with pytest.raises(ValueError):
+        pitch.formation('442', positions=[1] + list(range(1, 11)), kind='text',
+                        text=list('abcdefghijk'), ax=ax)
+    plt.close(fig)
+
+
+def test_formation_text_collection():
+    """ Test kind='text' with collection=True draws a single collection at the same positions."""
+    pitch = VerticalPitch()
+    fig, ax = pitch.draw()
+    text = pitch.formation('442', positions=POSITIONS_442, kind='text', text=list('abcdefghijk'),
+                           ha='center', va='center', ax=ax)
+    collection = pitch.formation('442', positions=POSITIONS_442, kind='text',
+                                 text=list('abcdefghijk'), ha='center', va='center',
+                                 collection=True, ax=ax)
+    assert isinstance(collection, PathCollection)
+    assert np.allclose(collection.get_offsets(), [label.get_position() for label in text])
+    plt.close(fig)
+
+
+def test_formation_pitch_collection():
+    """ Test kind='pitch' with collection=True draws the visible mini-pitches as one collection."""
+    pitch = VerticalPitch(half=True)
+    fig, ax = pitch.draw()
+    axes = pitch.formation('442', positions=POSITIONS_442, kind='pitch', height=15, ax=ax)
+    n_children = len(ax.get_children())
+    pitches = pitch.formation('442', positions=POSITIONS_442, kind='pitch', height=15, ax=ax,
+                              collection=True)
+    assert isinstance(pitches, PathCollection)
+    assert len(ax.get_children()) == n_children + 1
+    n_visible = sum(inset is not None for inset in axes.values())
+    assert 0 < n_visible < 11
+    assert len(pitches.get_paths()) % n_visible == 0
+    plt.close(fig)
+
+
+def test_formation_pitch_collection_matches_insets():
+    """ Test the mini-pitch collection is drawn in the same place as the inset pitches."""
+    images = []
+    for collection in [False, True]:
+        pitch = Pitch(pitch_type='opta', line_color='black', pitch_color='white')
+        fig, ax = pitch.draw(figsize=(8, 6))
+        pitch.formation('433', kind='pitch', width=15, linewidth=1, ax=ax,
+                        collection=collection)
+        fig.canvas.draw()
+        images.append(np.asarray(fig.canvas.buffer_rgba()).astype(int))
+        plt.close(fig)
+    difference = np.abs(images[0] - images[1]).max(axis=-1)
+    assert (difference > 100).mean() < 0.005
+
+
+def test_formation_collection_invalid_kind():
+    """ Test collection=True raises a TypeError for kind='axes'."""
+    pitch = Pitch()
+    fig, ax = pitch.draw()
+    with pytest.raises(TypeError):
+        pitch.formation('442', positions=POSITIONS_442, kind='axes', height=10, aspect=1,
+                        collection=True, ax=ax)
+    plt.close(fig)
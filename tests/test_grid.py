@@ -3,7 +3,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-from mplsoccer import grid, grid_dimensions
+from mplsoccer import Pitch, VerticalPitch, grid, grid_dimensions
 
 
 def test_figsize():
@@ -39,3 +39,35 @@ def test_figsize():
         assert np.isclose(check_figwidth - figwidth, 0)
         assert np.isclose(check_figheight - figheight, 0)
         plt.close(fig)
+
+
+def test_shared_markings_match():
+    """ A grid with shared markings should look the same as drawing every pitch."""
+    x = np.random.uniform(0, 120, 100)
+    y = np.random.uniform(0, 80, 100)
+    for pitch in [Pitch(), VerticalPitch(line_zorder=2, stripe=True)]:
+        images = []
+        for shared in [False, True]:
+            fig, axs = pitch.grid(nrows=2, ncols=3, figheight=5, shared_markings=shared)
+            for ax in axs['pitch'].flat:
+                pitch.heatmap(pitch.bin_statistic(x, y), ax=ax, cmap='Reds')
+            fig.canvas.draw()
+            images.append(np.asarray(fig.canvas.buffer_rgba()).copy())
+            plt.close(fig)
+        assert np.array_equal(images[0], images[1])
+
+
+def test_shared_markings_artists():
+    """ Only the first pitch should have the pitch markings and drawing should
+    leave the figure up to date."""
+    pitch = Pitch()
+    fig, axs = pitch.draw(nrows=2, ncols=2, shared_markings=True)
+    first, *others = axs.flat
+    n_markings = len(first.patches) + len(first.lines)
+    assert n_markings > 10
+    for ax in others:
+        assert len(ax.patches) + len(ax.lines) == 0
+        assert ax.get_xlim() == first.get_xlim()
+    fig.canvas.draw()
+    assert not fig.stale
+    plt.close(fig)
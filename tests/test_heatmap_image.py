@@ -0,0 +1,76 @@
+""" Test rendering heatmaps to RGBA arrays and PNG bytes without matplotlib figures."""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.colors import Normalize
+from PIL import Image
+
+from mplsoccer import Pitch, VerticalPitch
+
+
+def _pixel(pitch, x, y, width, height):
+    """ The row and column of pitch coordinates in an image of the pitch extent."""
+    if pitch.vertical:
+        x, y = y, x
+    xmin, xmax, ymin, ymax = pitch.extent
+    column = int((x - xmin) / (xmax - xmin) * width)
+    row = int((y - ymax) / (ymin - ymax) * height)
+    return row, column
+
+
+def test_bin_centers_colored():
+    """ The pixel at each bin center should have the colormap color of the bin."""
+    x = np.random.uniform(0, 120, 1000)
+    y = np.random.uniform(0, 80, 1000)
+    for pitch in [Pitch(), VerticalPitch(), Pitch(half=True)]:
+        stats = pitch.bin_statistic(x, y, bins=(6, 4))
+        image = pitch.heatmap_image(stats, width=300, cmap='viridis',
+                                    background=False, markings=False)
+        height, width, _ = image.shape
+        assert width == 300
+        assert abs(width / height - pitch.ax_aspect) < 0.02
+        norm = Normalize(np.nanmin(stats['statistic']), np.nanmax(stats['statistic']))
+        colors = colormaps['viridis'](norm(stats['statistic']), bytes=True)
+        visible = ((stats['cx'] >= pitch.visible_pitch[0]) &
+                   (stats['cx'] <= pitch.visible_pitch[1]))
+        for cx, cy, color in zip(stats['cx'][visible], stats['cy'][visible], colors[visible]):
+            row, column = _pixel(pitch, cx, cy, width, height)
+            assert np.array_equal(image[row, column], color)
+
+
+def test_zones_and_layers():
+    """ Zones are rendered and the pitch layers are composited around the heatmap."""
+    pitch = Pitch(pitch_color='#22312b', line_color='white')
+    x = np.random.uniform(0, 120, 1000)
+    y = np.random.uniform(0, 80, 1000)
+    stats = pitch.bin_statistic_positional(x, y)
+    image = pitch.heatmap_image(stats, width=240, height=160, background=False, markings=False,
+                                alpha=0.5)
+    assert image.shape == (160, 240, 4)
+    # the padding outside the zones is transparent
+    assert image[0, 0, 3] == 0
+    assert image[80, 120, 3] in (127, 128)
+    png = pitch.heatmap_png(stats, width=240, height=160)
+    full = np.asarray(Image.open(io.BytesIO(png)))
+    assert full.shape == (160, 240, 4)
+    # the pitch background is drawn in the padding
+    assert tuple(full[0, 0]) == (0x22, 0x31, 0x2b, 255)
+
+
+def test_threaded_renders():
+    """ Heatmaps rendered from many threads share the cache without errors."""
+    pitch = Pitch()
+    stats = pitch.bin_statistic(np.random.uniform(0, 120, 1000),
+                                np.random.uniform(0, 80, 1000), bins=(6, 4))
+    widths = list(range(20, 90))
+
+    def render(width):
+        return pitch.heatmap_image(stats, width=width, background=False, markings=False)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        images = list(executor.map(render, widths))
+    assert [image.shape[1] for image in images] == widths
+    assert np.array_equal(images[0], render(widths[0]))
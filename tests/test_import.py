@@ -0,0 +1,66 @@
+""" Test importing mplsoccer is lazy, so it is fast when only the pitches are used."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import mplsoccer
+
+# third-party modules that are slow to import and only used by some methods
+HEAVY_MODULES = ['seaborn', 'scipy.stats', 'scipy.spatial', 'requests', 'pandas']
+
+
+def _run(code):
+    """ Run code in a new interpreter and return what it printed."""
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                          check=True).stdout
+
+
+def _imported_modules(code):
+    """ Run code in a new interpreter and return the heavy modules it imported."""
+    return _run(f'import sys\n{code}\n'
+                f'print(" ".join(module for module in {HEAVY_MODULES!r} '
+                f'if module in sys.modules))').split()
+
+
+def test_import_is_lazy():
+    """ Test importing mplsoccer and using the pitches does not import the heavy modules."""
+    assert _imported_modules('import mplsoccer') == []
+    code = ('from mplsoccer import Pitch, Standardizer\n'
+            'Pitch(pitch_type="opta").draw()\n'
+            'Standardizer(pitch_from="opta", pitch_to="uefa").transform([10], [20])')
+    assert _imported_modules(code) == []
+    assert _imported_modules('from mplsoccer import Sbopen') == ['requests', 'pandas']
+
+
+def test_lazy_names():
+    """ Test all the names and submodules are available from the top-level."""
+    for name in mplsoccer.__all__:
+        assert getattr(mplsoccer, name) is not None
+    assert set(dir(mplsoccer)) == set(mplsoccer.__all__) | mplsoccer._SUBMODULES
+    assert mplsoccer.utils.inset_image is mplsoccer.inset_image
+    assert mplsoccer._grid_dimensions is not None
+    namespace = {}
+    exec('from mplsoccer import *', namespace)
+    assert 'VerticalPitch' in namespace
+    assert '_grid_dimensions' in namespace
+    with pytest.raises(AttributeError):
+        mplsoccer.not_a_name
+
+
+def test_grid_not_replaced_by_submodule():
+    """ Test the grid function is not replaced by the grid submodule when it is imported."""
+    code = ('import mplsoccer.grid\n'
+            'from mplsoccer import Pitch\n'
+            'print(callable(mplsoccer.grid), callable(mplsoccer.heatmap_image))')
+    assert _run(code).split() == ['True', 'True']
+
+
+def test_lazy_names_match_submodules():
+    """ Test the lazily imported names are the __all__ of each submodule."""
+    for submodule, names in mplsoccer._SUBMODULE_NAMES.items():
+        module = importlib.import_module(submodule, 'mplsoccer')
+        assert sorted(names) == sorted(module.__all__), submodule
+    assert set(importlib.import_module('mplsoccer.grid').__all__) <= set(mplsoccer.__all__)
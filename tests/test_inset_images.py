@@ -0,0 +1,121 @@
+""" Test the image cache and adding many inset images."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from mplsoccer import ImageCache, Pitch, VerticalPitch, inset_images
+
+
+def _badge(size=512):
+    """ A test image with a blue marker in the top-left corner."""
+    yy, xx = np.mgrid[0:size, 0:size]
+    badge = np.zeros((size, size, 4), dtype=np.uint8)
+    badge[..., 0] = xx * 255 // size
+    badge[..., 1] = yy * 255 // size
+    badge[..., 3] = 255
+    badge[:size // 5, :size // 5, 2] = 255
+    return badge
+
+
+def test_image_cache_decodes_once(tmp_path):
+    """ Test a file is decoded once and resized arrays are reused."""
+    path = tmp_path / 'badge.png'
+    Image.fromarray(_badge()).save(path)
+    cache = ImageCache()
+    assert cache.decode(path) is cache.decode(str(path))
+    small = cache.get(path, size=(50, 50))
+    assert small.shape == (50, 50, 4)
+    assert cache.get(path, size=(50.2, 49.8)) is small
+
+
+def test_image_cache_never_enlarges():
+    """ Test images smaller than the target size are not resized."""
+    cache = ImageCache()
+    badge = _badge(64)
+    assert cache.get(badge, size=(200, 200)).shape == (64, 64, 4)
+    assert cache.get(badge).shape == (64, 64, 4)
+
+
+def test_image_cache_maxsize():
+    """ Test the least recently used images are removed."""
+    cache = ImageCache(maxsize=2, cache_arrays=True)
+    badges = [_badge(32) for _ in range(3)]
+    for badge in badges:
+        cache.get(badge)
+    assert len(cache._cache) == 2
+    cache.clear()
+    assert len(cache._cache) == 0
+
+
+def test_image_cache_arrays():
+    """ Test arrays are not cached by default, so changes to the array are used."""
+    cache = ImageCache()
+    badge = _badge(32)
+    assert cache.get(badge)[0, 0, 2] == 255
+    badge[..., 2] = 0
+    assert cache.get(badge)[0, 0, 2] == 0
+    assert len(cache._cache) == 0
+    cache = ImageCache(cache_arrays=True)
+    assert cache.get(badge) is cache.get(badge)
+
+
+def test_image_cache_threads(tmp_path):
+    """ Test an image used from many threads is decoded and resized once."""
+    path = tmp_path / 'badge.png'
+    Image.fromarray(_badge(1024)).save(path)
+    cache = ImageCache()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: cache.get(path, size=(50, 50)), range(32)))
+    assert all(result is results[0] for result in results)
+    assert len(cache._cache) == 2
+
+
+@pytest.mark.parametrize('pitch', [Pitch(), VerticalPitch(pitch_type='opta')])
+def test_inset_images_match_inset_image(pitch):
+    """ Test the images are drawn in the same place and orientation as inset_image."""
+    x = [20, 50, 90]
+    y = [20, 40, 60]
+    badge = _badge()
+    rendered = []
+    for batch in [False, True]:
+        fig, ax = pitch.draw(figsize=(8, 6))
+        if batch:
+            artists = pitch.inset_images(x, y, badge, width=8, ax=ax)
+            assert len(artists) == 3
+            assert len(fig.axes) == 1
+        else:
+            for x_center, y_center in zip(x, y):
+                pitch.inset_image(x_center, y_center, badge, width=8, ax=ax)
+        fig.canvas.draw()
+        rendered.append(np.asarray(fig.canvas.buffer_rgba()).astype(int))
+        plt.close(fig)
+    difference = np.abs(rendered[0] - rendered[1]).max(axis=-1)
+    assert (difference > 80).mean() < 0.001
+
+
+def test_inset_images_downsampled():
+    """ Test the images are downsampled to their on-screen size."""
+    fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
+    ax.set_aspect('equal')
+    image, = inset_images(0.5, 0.5, [_badge(1024)], width=0.2, cache=ImageCache(), ax=ax)
+    height, width = image.get_array().shape[:2]
+    assert width < 100
+    assert height == width
+    plt.close(fig)
+
+
+def test_inset_images_invalid():
+    """ Test invalid arguments raise errors."""
+    fig, ax = plt.subplots()
+    badge = _badge(32)
+    with pytest.raises(TypeError):
+        inset_images([0.5], [0.5], badge, ax=ax)
+    with pytest.raises(TypeError):
+        inset_images([0.5], [0.5], badge, width=0.1, height=0.1, ax=ax)
+    with pytest.raises(ValueError):
+        inset_images([0.2, 0.5], [0.5, 0.5], [badge] * 3, width=0.1, ax=ax)
+    plt.close(fig)
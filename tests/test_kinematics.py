@@ -0,0 +1,107 @@
+""" Test calculating the kinematics of tracking data."""
+
+import numpy as np
+import pytest
+
+from mplsoccer import Kinematics
+
+FRAME_RATE = 25
+
+
+def _tracking(n_frames=2000):
+    """ A player running at 3 m/s and a player who sprints at 8 m/s three times."""
+    time = np.arange(n_frames) / FRAME_RATE
+    speed = np.zeros(n_frames)
+    speed[200:250] = 8  # two seconds
+    speed[1200:1250] = 8  # two seconds
+    speed[1600:1610] = 8  # too short to be a sprint
+    runner = np.stack([-4000 + 300 * time, np.full(n_frames, 1000)], axis=-1)
+    sprinter = np.stack([-3000 + 100 * np.cumsum(speed) / FRAME_RATE,
+                         np.full(n_frames, -1000)], axis=-1)
+    return np.stack([runner, sprinter], axis=1)
+
+
+def test_transform():
+    """ Test the speed, heading and acceleration in meters from tracab coordinates."""
+    kinematics = Kinematics(frame_rate=FRAME_RATE, pitch_type='tracab', pitch_length=105,
+                            pitch_width=68)
+    frames = _tracking()
+    result = kinematics.transform(frames)
+    assert result['velocity'].shape == frames.shape
+    assert result['speed'].shape == frames.shape[:2]
+    assert np.allclose(result['speed'][:, 0], 3)
+    assert np.allclose(result['heading'][:, 0], 0)
+    assert np.allclose(result['acceleration'][:, 0], 0)
+    assert np.isclose(result['speed'][:, 1].max(), 8)
+    # the runner leaves the pitch, but the coordinates are not clipped
+    assert np.isclose(result['position'][-1, 0, 0], (-4000 + 300 * 1999 / FRAME_RATE) / 100 +
+                      52.5)
+    result32 = kinematics.transform(frames.astype(np.float32))
+    assert result32['speed'].dtype == np.float32
+    assert np.allclose(result32['speed'], result['speed'], atol=1e-3)
+
+
+def test_gaps_and_periods():
+    """ Test missing coordinates and period breaks are not smoothed or differentiated across."""
+    kinematics = Kinematics(frame_rate=FRAME_RATE, pitch_type='uefa')
+    frames = _tracking() / 100 + [52.5, 34]
+    frames[500:510, 0] = np.nan
+    # the runner is moved 10 meters at the start of the second period
+    periods = np.repeat([1, 2], 1000)
+    frames[1000:, 0, 0] += 10
+    result = kinematics.transform(frames, periods=periods)
+    assert np.isnan(result['speed'][500:510, 0]).all()
+    assert np.allclose(result['speed'][:500, 0], 3)
+    assert np.allclose(result['speed'][510:, 0], 3)
+
+
+def test_summary():
+    """ Test the distance, high-speed running and sprints of each player."""
+    kinematics = Kinematics(frame_rate=FRAME_RATE, pitch_type='tracab', pitch_length=105,
+                            pitch_width=68, window=1)
+    frames = _tracking()
+    periods = np.repeat([1, 2], 1000)
+    summary = kinematics.summary(frames, periods=periods)
+    assert np.allclose(summary['distance'], [3 * 80, 8 * 4.4], rtol=0.01)
+    assert np.allclose(summary['sprints'], [0, 2])
+    assert np.allclose(summary['high_speed_distance'][0], 0)
+    assert np.allclose(summary['max_speed'], [3, 8])
+    # 1998 intervals between the 2000 frames in two periods
+    assert np.allclose(summary['time'], 1998 / FRAME_RATE)
+    summary = kinematics.summary(frames[:250])
+    assert np.allclose(summary['time'], 9.96)
+    assert np.allclose(summary['distance'][0], 3 * 9.96)
+    # a sprint is not continued across a change of period
+    kinematics = Kinematics(frame_rate=FRAME_RATE, pitch_type='tracab', pitch_length=105,
+                            pitch_width=68, sprint_duration=1.5)
+    assert np.allclose(kinematics.summary(frames[:450])['sprints'], [0, 1])
+    periods = np.repeat([1, 2], 225)
+    assert np.allclose(kinematics.summary(frames[:450], periods=periods)['sprints'], [0, 0])
+
+
+def test_even_window():
+    """ Test an even window smooths the velocities with one more frame before the center."""
+    frames = _tracking() / 100 + [52.5, 34]
+    for window in [2, 4]:
+        kinematics = Kinematics(frame_rate=FRAME_RATE, pitch_type='uefa', window=window)
+        result = kinematics.transform(frames)
+        assert result['speed'].shape == frames.shape[:2]
+        assert np.allclose(result['speed'][:, 0], 3)
+    # the speed changes from 0 to 8 m/s between frames 199 and 200
+    speed = Kinematics(frame_rate=FRAME_RATE, pitch_type='uefa', window=1,
+                       max_speed=20).transform(frames)['speed'][:, 1]
+    smoothed = Kinematics(frame_rate=FRAME_RATE, pitch_type='uefa', window=4,
+                          max_speed=20).transform(frames)['speed'][:, 1]
+    assert np.isclose(smoothed[200], speed[198:202].mean())
+
+
+def test_invalid():
+    """ Test invalid arguments."""
+    with pytest.raises(TypeError):
+        Kinematics(pitch_type='tracab')
+    with pytest.raises(ValueError):
+        Kinematics(window=0)
+    with pytest.raises(ValueError):
+        Kinematics().transform(np.zeros((10, 3)))
+    with pytest.raises(ValueError):
+        Kinematics().transform(np.zeros((10, 2, 2)), periods=[1, 2])
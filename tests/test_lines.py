@@ -0,0 +1,48 @@
+""" Test the lines function, which plots lines with a LineCollection."""
+
+import numpy as np
+import pytest
+
+from mplsoccer import Pitch, VerticalPitch
+
+
+def random_lines(num_lines):
+    rng = np.random.default_rng(0)
+    xstart = rng.uniform(0, 120, num_lines)
+    ystart = rng.uniform(0, 80, num_lines)
+    xend = np.clip(xstart + rng.normal(0, 15, num_lines), 0, 120)
+    yend = np.clip(ystart + rng.normal(0, 15, num_lines), 0, 80)
+    return xstart, ystart, xend, yend
+
+
+def test_auto_segments():
+    """ The auto segments should be fewer and still cover each line from start to end."""
+    xstart, ystart, xend, yend = random_lines(500)
+    for pitch in [Pitch(), VerticalPitch()]:
+        fig, ax = pitch.draw()
+        fixed = pitch.lines(xstart, ystart, xend, yend, comet=True, transparent=True,
+                            color='red', lw=10, ax=ax)
+        auto = pitch.lines(xstart, ystart, xend, yend, comet=True, transparent=True,
+                           color='red', lw=10, n_segments='auto', ax=ax)
+        auto_segments = auto.get_segments()
+        assert len(auto_segments) < len(fixed.get_segments()) / 2
+
+        # the segments within each line are joined
+        segments = np.array(auto_segments)
+        starts = np.flatnonzero(np.isclose(auto.get_linewidth(), 1))
+        ends = np.append(starts[1:] - 1, len(segments) - 1)
+        assert starts.size == xstart.size
+        assert np.allclose(segments[starts, 0], pitch._reverse_vertices_if_vertical(
+            np.column_stack([xstart, ystart])))
+        assert np.allclose(segments[ends, -1], pitch._reverse_vertices_if_vertical(
+            np.column_stack([xend, yend])))
+        within_line = np.setdiff1d(np.arange(1, len(segments)), starts)
+        assert np.allclose(segments[within_line, 0], segments[within_line - 1, 1])
+        assert np.isclose(np.max(auto.get_linewidth()), 10)
+
+
+def test_invalid_n_segments():
+    pitch = Pitch()
+    fig, ax = pitch.draw()
+    with pytest.raises(TypeError):
+        pitch.lines(1, 1, 10, 10, comet=True, n_segments='many', ax=ax)
@@ -0,0 +1,40 @@
+""" Test plotting polygons as patches or a single collection."""
+
+import numpy as np
+from matplotlib.collections import PolyCollection
+
+from mplsoccer import Pitch, VerticalPitch
+
+
+def test_collection_matches_patches():
+    """ The collection should be drawn in the same place as the patches."""
+    x = np.random.uniform(0, 120, 50)
+    y = np.random.uniform(0, 80, 50)
+    for pitch in [Pitch(), VerticalPitch()]:
+        fig, ax = pitch.draw()
+        patches = pitch.goal_angle(x, y, ax=ax)
+        collection = pitch.goal_angle(x, y, ax=ax, collection=True, array=x, cmap='viridis')
+        assert isinstance(collection, PolyCollection)
+        assert len(collection.get_paths()) == len(patches)
+        transform = collection.get_transform()
+        for patch, path in zip(patches, collection.get_paths()):
+            display_patch = patch.get_patch_transform().transform(patch.get_path().vertices)
+            display_patch = ax.transData.transform(display_patch)
+            assert np.allclose(display_patch, transform.transform(path.vertices))
+
+
+def test_update_vertices():
+    """ The vertices stay in pitch coordinates so they can be updated in place."""
+    pitch = VerticalPitch()
+    fig, ax = pitch.draw()
+    x = np.random.uniform(0, 120, 22)
+    y = np.random.uniform(0, 80, 22)
+    team1, team2 = pitch.voronoi(x, y, np.repeat([0, 1], 11))
+    collection = pitch.polygon(list(team1), collection=True, facecolor=['red'] * len(team1),
+                               ax=ax)
+    x = np.random.uniform(0, 120, 22)
+    y = np.random.uniform(0, 80, 22)
+    team1, team2 = pitch.voronoi(x, y, np.repeat([0, 1], 11))
+    collection.set_verts(list(team2))
+    assert all(np.allclose(path.vertices[:len(vert)], vert.astype(float))
+               for path, vert in zip(collection.get_paths(), team2))
@@ -0,0 +1,72 @@
+""" Test the automatic rasterization of large data layers."""
+
+import pickle
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from mplsoccer import Pitch, VerticalPitch
+from mplsoccer._pitch_base import _MAX_RASTERIZED_LAYERS
+
+
+def test_rasterize_threshold():
+    """ Layers with more elements than the threshold should be rasterized
+    and recorded, while smaller layers and the pitch markings stay as vectors."""
+    for pitch_class in [Pitch, VerticalPitch]:
+        pitch = pitch_class(rasterize_threshold=1000)
+        fig, ax = pitch.draw()
+        markings = ax.get_children()
+        x = np.random.uniform(0, 120, 2000)
+        y = np.random.uniform(0, 80, 2000)
+        small_scatter = pitch.scatter(x[:10], y[:10], ax=ax)
+        scatter = pitch.scatter(x, y, ax=ax)
+        lines = pitch.lines(x[:20], y[:20], x[20:40], y[20:40], comet=True, ax=ax)
+        quiver = pitch.arrows(x, y, x[::-1], y[::-1], ax=ax)
+        hexbin = pitch.hexbin(x, y, gridsize=(60, 40), ax=ax)
+        stats = pitch.bin_statistic(x, y, bins=(50, 40))
+        mesh = pitch.heatmap(stats, ax=ax)
+        explicit = pitch.scatter(x, y, rasterized=False, ax=ax)
+        assert not small_scatter.get_rasterized()
+        assert not explicit.get_rasterized()
+        for artist in [scatter, lines, quiver, hexbin, mesh]:
+            assert artist.get_rasterized()
+        assert not any(artist.get_rasterized() for artist in markings)
+        assert [layer['layer'] for layer in pitch.rasterized_layers] == \
+               ['scatter', 'lines', 'arrows', 'hexbin', 'heatmap']
+        assert pitch.rasterized_layers[0] == {'layer': 'scatter', 'elements': 2000}
+        assert pickle.loads(pickle.dumps(pitch)).rasterized_layers == pitch.rasterized_layers
+
+
+def test_rasterize_kdeplot():
+    """ The kdeplot contours should be rasterized based on the number of vertices."""
+    pitch = Pitch(rasterize_threshold=100)
+    fig, ax = pitch.draw()
+    x = np.random.uniform(0, 120, 100)
+    y = np.random.uniform(0, 80, 100)
+    pitch.kdeplot(x, y, fill=True, levels=20, ax=ax)
+    assert [layer['layer'] for layer in pitch.rasterized_layers] == ['kdeplot']
+    assert all(collection.get_rasterized() for collection in ax.collections)
+
+
+def test_rasterized_layers_capped():
+    """ The records do not keep the artists alive and only the most recent are kept."""
+    pitch = Pitch(rasterize_threshold=1)
+    for _ in range(_MAX_RASTERIZED_LAYERS + 5):
+        fig, ax = pitch.draw()
+        pitch.scatter([1, 2], [1, 2], ax=ax)
+        plt.close(fig)
+    assert len(pitch.rasterized_layers) == _MAX_RASTERIZED_LAYERS
+    assert all(set(layer) == {'layer', 'elements'} for layer in pitch.rasterized_layers)
+
+
+def test_rasterize_threshold_default():
+    """ Nothing is rasterized by default."""
+    pitch = Pitch()
+    fig, ax = pitch.draw()
+    scatter = pitch.scatter(np.random.uniform(0, 120, 10000),
+                            np.random.uniform(0, 80, 10000), ax=ax)
+    assert not scatter.get_rasterized()
+    assert pitch.rasterized_layers == []
+    with pytest.raises(TypeError):
+        Pitch(rasterize_threshold='100')
@@ -0,0 +1,52 @@
+""" Test the density raster for plotting millions of points."""
+
+import numpy as np
+
+from mplsoccer import Pitch, VerticalPitch, DensityImage
+
+
+def test_counts_match_points():
+    """ Every point inside the view should be counted once at the screen resolution."""
+    x = np.random.uniform(0, 120, 10000)
+    y = np.random.uniform(0, 80, 10000)
+    for pitch in [Pitch(), VerticalPitch()]:
+        fig, ax = pitch.draw(figsize=(6, 4))
+        image = pitch.scatter_density(x, y, ax=ax)
+        assert isinstance(image, DensityImage)
+        fig.canvas.draw()
+        counts = image.counts()
+        width, height = np.ceil(ax.bbox.width), np.ceil(ax.bbox.height)
+        assert counts.shape == (height, width)
+        assert counts.sum() == x.size
+        assert image.get_extent() == tuple(ax.get_xlim()) + tuple(ax.get_ylim())
+
+
+def test_recompute_on_zoom():
+    """ Zooming in should rebin only the points in view at the screen resolution."""
+    pitch = Pitch()
+    fig, ax = pitch.draw(figsize=(6, 4))
+    x = np.random.uniform(0, 120, 10000)
+    y = np.random.uniform(0, 80, 10000)
+    image = pitch.scatter_density(x, y, ax=ax, pixel_size=2)
+    fig.canvas.draw()
+    ax.set_xlim(0, 60)
+    fig.canvas.draw()
+    assert image.get_extent()[:2] == (0, 60)
+    assert image.get_array().sum() == (x < 60).sum()
+
+
+def test_categories():
+    """ Pixels with a single category should have that category's color."""
+    pitch = Pitch()
+    fig, ax = pitch.draw()
+    x = np.r_[np.full(100, 30.), np.full(100, 90.)]
+    y = np.full(200, 40.)
+    team = np.repeat(['home', 'away'], 100)
+    image = pitch.scatter_density(x, y, categories=team, ax=ax,
+                                  colors={'home': 'red', 'away': 'blue'})
+    fig.canvas.draw()
+    rgba = image.get_array()
+    assert list(image.categories) == ['away', 'home']
+    filled = rgba[..., 3] > 0
+    assert filled.sum() == 2
+    assert {tuple(color) for color in rgba[filled][:, :3]} == {(1., 0., 0.), (0., 0., 1.)}
@@ -0,0 +1,70 @@
+""" Test the rotated scatter markers."""
+
+import gc
+import weakref
+
+import matplotlib.markers as mmarkers
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from mplsoccer import Pitch, VerticalPitch, rotate_markers, arrowhead_marker
+from mplsoccer.scatterutils import _ROTATED_MARKERS
+
+
+def rotated_marker_vertices(marker, rotation_degrees, vertical):
+    """ Rotate a MarkerStyle for each point (clockwise with zero facing the direction of play)."""
+    vertices = []
+    for degrees in rotation_degrees:
+        marker_style = mmarkers.MarkerStyle(marker)
+        transform = marker_style.get_transform().rotate_deg(-degrees if vertical else -degrees - 90)
+        vertices.append(marker_style.get_path().transformed(transform).vertices)
+    return vertices
+
+
+def test_rotated_markers():
+    """ The batched rotation should match rotating each MarkerStyle."""
+    for pitch in [Pitch(), VerticalPitch()]:
+        for marker in ['^', 'h', arrowhead_marker]:
+            fig, ax = pitch.draw()
+            x = np.random.uniform(0, 120, 100)
+            y = np.random.uniform(0, 80, 100)
+            rotation = np.random.uniform(0, 360, 100)
+            sc = pitch.scatter(x, y, rotation_degrees=rotation, marker=marker, ax=ax)
+            expected = rotated_marker_vertices(marker, rotation, pitch.vertical)
+            assert all(np.allclose(path.vertices, vertices)
+                       for path, vertices in zip(sc.get_paths(), expected))
+
+            # update the rotations
+            rotation = np.random.uniform(0, 360, 100)
+            assert rotate_markers(sc, rotation) is sc
+            expected = rotated_marker_vertices(marker, rotation, pitch.vertical)
+            assert all(np.allclose(path.vertices, vertices)
+                       for path, vertices in zip(sc.get_paths(), expected))
+
+            # different number of markers
+            rotate_markers(sc, rotation[:10])
+            assert len(sc.get_paths()) == 10
+            plt.close(fig)
+
+
+def test_rotated_markers_released():
+    """ The rotated marker state is removed with the scatter."""
+    pitch = Pitch()
+    fig, ax = pitch.draw()
+    sc = pitch.scatter([1, 2], [1, 2], rotation_degrees=[0, 90], marker='^', ax=ax)
+    assert sc in _ROTATED_MARKERS
+    scatter_ref = weakref.ref(sc)
+    sc.remove()
+    plt.close(fig)
+    del fig, ax, sc
+    gc.collect()
+    assert scatter_ref() is None
+
+
+def test_rotate_markers_invalid():
+    pitch = Pitch()
+    fig, ax = pitch.draw()
+    sc = pitch.scatter([1, 2], [1, 2], ax=ax)
+    with pytest.raises(TypeError):
+        rotate_markers(sc, [0, 90])
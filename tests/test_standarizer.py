@@ -3,8 +3,11 @@
 import random
 
 import numpy as np
+import pandas as pd
+import pytest
 
-from mplsoccer import Standardizer
+from mplsoccer import Pitch, Standardizer
+from mplsoccer._lattice import lattice_map
 from mplsoccer.soccer.dimensions import valid, size_varies, create_pitch_dims
 
 
@@ -67,3 +70,157 @@ def test_standardizer_reverse():
         x_reverse, y_reverse = standard.transform(x_std, y_std, reverse=True)
         assert np.isclose(np.abs(x - x_reverse).sum(), 0, atol=1e-05)
         assert np.isclose(np.abs(y - y_reverse).sum(), 0, atol=1e-05)
+
+
+def test_transform_frame_matches_transform():
+    """ Test transforming dataframe columns matches transforming each pair of columns."""
+    rng = np.random.default_rng(42)
+    size = 1000
+    df = pd.DataFrame({'x': rng.uniform(0, 120, size), 'y': rng.uniform(0, 80, size),
+                       'end_x': rng.uniform(0, 120, size), 'end_y': rng.uniform(0, 80, size),
+                       'team': 'a'})
+    df.loc[::7, ['end_x', 'end_y']] = np.nan
+    original = df.copy()
+    standard = Standardizer(pitch_from='statsbomb', pitch_to='uefa')
+    result = standard.transform_frame(df, inplace=False)
+    for x_column, y_column in [('x', 'y'), ('end_x', 'end_y')]:
+        x, y = standard.transform(df[x_column], df[y_column])
+        assert np.allclose(result[x_column], x, equal_nan=True)
+        assert np.allclose(result[y_column], y, equal_nan=True)
+    # the original dataframe is unchanged unless inplace=True
+    assert df['x'].max() > 105
+    assert standard.transform_frame(df, pairs=[('x', 'y'), ('end_x', 'end_y')]) is None
+    assert np.allclose(df[['x', 'y', 'end_x', 'end_y']], result[['x', 'y', 'end_x', 'end_y']],
+                       equal_nan=True)
+    standard.transform_frame(df, reverse=True)
+    assert np.allclose(df['x'], original['x'])
+    assert np.allclose(df['end_y'], original['end_y'], equal_nan=True)
+
+
+def test_transform_frame_dtypes():
+    """ Test each float column keeps its dtype, and integer and missing columns are handled."""
+    df = pd.DataFrame({'x': np.array([0, 50, 100], dtype=np.float32),
+                       'y': np.array([0, 50, 100]),
+                       'end_x': pd.array([0, None, 100], dtype='Float64'),
+                       'end_y': np.array([0., 50, 100])})
+    standard = Standardizer(pitch_from='opta', pitch_to='uefa')
+    standard.transform_frame(df)
+    assert df['x'].dtype == np.float32
+    assert df['y'].dtype == np.float64
+    assert np.allclose(df['x'], [0, 52.5, 105])
+    assert np.allclose(df['y'], [0, 34, 68])
+    assert np.isnan(df['end_x'][1])
+    df32 = pd.DataFrame({'x': np.float32([0, 50]), 'y': np.float32([0, 50])})
+    standard.transform_frame(df32)
+    assert df32['x'].dtype == np.float32
+    with pytest.raises(ValueError):
+        standard.transform_frame(df, pairs=[('x', 'missing')])
+
+
+def test_transform_array_tracking(tmp_path):
+    """ Test transforming (frames, players, 2) arrays in chunks, in place and memory-mapped."""
+    rng = np.random.default_rng(42)
+    frames = rng.uniform(-5500, 5500, size=(500, 23, 2))
+    frames[::3, 5] = np.nan
+    standard = Standardizer(pitch_from='tracab', pitch_to='uefa',
+                            length_from=105, width_from=68)
+    x, y = standard.transform(frames[..., 0].copy(), frames[..., 1].copy())
+    expected = np.stack([x, y], axis=-1)
+    result = standard.transform_array(frames, chunk_size=1000)
+    assert np.allclose(result, expected, equal_nan=True)
+    assert np.isnan(result[::3, 5]).all()
+
+    in_place = frames.copy()
+    assert standard.transform_array(in_place, out=in_place, chunk_size=1000) is in_place
+    assert np.allclose(in_place, expected, equal_nan=True)
+
+    path = tmp_path / 'tracking.npy'
+    np.save(path, frames.astype(np.float32))
+    mapped = np.load(path, mmap_mode='r+')
+    standard.transform_array(mapped, out=mapped)
+    mapped.flush()
+    assert np.allclose(np.load(path), expected, atol=1e-3, equal_nan=True)
+    # reverse from a read-only memory-mapped array into a new array
+    result = standard.transform_array(np.load(path, mmap_mode='r'), reverse=True)
+    assert result.dtype == np.float32
+    assert np.allclose(result, np.clip(frames, [-5250, -3400], [5250, 3400]), atol=1,
+                       equal_nan=True)
+
+
+def test_transform_array_invalid():
+    """ Test a single point and invalid shapes."""
+    standard = Standardizer(pitch_from='opta', pitch_to='uefa')
+    assert np.allclose(standard.transform_array(np.array([50, 50])), [52.5, 34])
+    with pytest.raises(ValueError):
+        standard.transform_array(np.zeros((10, 3)))
+    with pytest.raises(ValueError):
+        standard.transform_array(np.zeros((10, 2)), out=np.zeros((5, 2)))
+    with pytest.raises(TypeError):
+        standard.transform_array(np.zeros((10, 2)), out=np.zeros((10, 2), dtype=int))
+
+
+def test_transform_dtype():
+    """ Test transforming float32 coordinates without converting them to float64."""
+    standard = Standardizer(pitch_from='opta', pitch_to='uefa')
+    rng = np.random.default_rng(42)
+    x = rng.uniform(-5, 105, 1000).astype(np.float32)
+    y = rng.uniform(-5, 105, 1000).astype(np.float32)
+    x[::10] = np.nan
+    x_std, y_std = standard.transform(x, y, dtype=np.float32)
+    assert x_std.dtype == np.float32 and y_std.dtype == np.float32
+    x_expected, y_expected = standard.transform(x, y)
+    assert np.allclose(x_std, x_expected, atol=1e-4, equal_nan=True)
+    assert np.allclose(y_std, y_expected, atol=1e-4)
+
+    pitch = Pitch(pitch_type='opta')
+    angle, distance = pitch.calculate_angle_and_distance(x, y, y, x, dtype=np.float32)
+    assert angle.dtype == np.float32 and distance.dtype == np.float32
+    x_flip, y_flip = pitch.flip_side(x, y, x > 50, dtype=np.float32)
+    assert x_flip.dtype == np.float32 and y_flip.dtype == np.float32
+    assert np.allclose(x_flip, np.where(x > 50, 100 - x, x), equal_nan=True)
+
+
+@pytest.mark.parametrize('pitch_from', ['opta', 'wyscout', 'statsbomb'])
+def test_transform_lattice(pitch_from):
+    """ Test looking up the standardized lattice points gives the same coordinates."""
+    standard = Standardizer(pitch_from=pitch_from, pitch_to='uefa')
+    dim = standard.dim_from
+    rng = np.random.default_rng(42)
+    x = np.round(rng.uniform(dim.left - 2, dim.right + 2, 10000), 1)
+    y = np.round(rng.uniform(dim.pitch_extent[2] - 2, dim.pitch_extent[3] + 2, 10000), 1)
+    # missing and off-lattice coordinates are standardized as usual
+    x[::100] = np.nan
+    y[::99] = 50.123
+    x_expected, y_expected = standard.transform(x, y)
+    for lattice in [0.1, 'auto']:
+        x_std, y_std = standard.transform(x, y, lattice=lattice)
+        assert np.array_equal(x_std, x_expected, equal_nan=True)
+        assert np.array_equal(y_std, y_expected)
+    x_int = rng.integers(0, 101, 1000)
+    assert np.array_equal(standard.transform(x_int, x_int, lattice=1, reverse=True),
+                          standard.transform(x_int, x_int, reverse=True))
+    x_std, _ = standard.transform(x, y, lattice='auto', dtype=np.float32)
+    assert x_std.dtype == np.float32
+
+
+def test_transform_lattice_large_table():
+    """ Test a lattice with more points than the coordinates is not looked up."""
+    standard = Standardizer(pitch_from='tracab', pitch_to='uefa', length_from=105,
+                            width_from=68)
+    x = np.array([-5250.12, 1234.56])
+    y = np.array([3400.0, -17.25])
+    expected = standard.transform(x, y)
+    for lattice in [1e-5, 0.01, 'auto']:
+        assert np.array_equal(standard.transform(x, y, lattice=lattice), expected)
+    calls = []
+
+    def function(values):
+        calls.append(np.size(values))
+        return values * 2
+
+    assert np.array_equal(lattice_map(x, function, -5250, 5250, 100), x * 2)
+    assert calls == [2]
+    values = np.round(np.random.default_rng(0).uniform(0, 100, 1000))
+    calls.clear()
+    assert np.array_equal(lattice_map(values, function, 0, 100, 1), values * 2)
+    assert calls == [101]
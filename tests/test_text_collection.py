@@ -0,0 +1,81 @@
+""" Test drawing heatmap labels as a single collection."""
+
+import matplotlib.patheffects as path_effects
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PathCollection
+
+from mplsoccer import Pitch, VerticalPitch, text_collection
+
+
+def test_label_heatmap_collection_matches_text():
+    """ The collection labels should be drawn in the same place as the Text labels."""
+    x = np.random.uniform(0, 120, 500)
+    y = np.random.uniform(0, 80, 500)
+    for pitch in [Pitch(), VerticalPitch()]:
+        stats = pitch.bin_statistic(x, y, bins=(6, 4))
+        fig, ax = pitch.draw()
+        texts = pitch.label_heatmap(stats, str_format='{:.0f}', fontsize=12, ax=ax)
+        collection = pitch.label_heatmap(stats, str_format='{:.0f}', fontsize=12, ax=ax,
+                                         collection=True)
+        assert isinstance(collection, PathCollection)
+        assert len(collection.get_paths()) == len(texts) == 24
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        transform = collection.get_transform()
+        offsets = ax.transData.transform(collection.get_offsets())
+        for text, path, offset in zip(texts, collection.get_paths(), offsets):
+            glyphs = transform.transform(path.vertices) + offset
+            extent = text.get_window_extent(renderer)
+            # the glyph outlines sit inside the text extent
+            assert glyphs[:, 0].min() >= extent.x0 - 1
+            assert glyphs[:, 0].max() <= extent.x1 + 1
+            assert glyphs[:, 1].min() >= extent.y0 - 1
+            assert glyphs[:, 1].max() <= extent.y1 + 1
+        plt.close(fig)
+
+
+def test_glyphs_shared_between_labels():
+    """ Repeated labels should reuse the same glyph path."""
+    fig, ax = plt.subplots()
+    collection = text_collection([0.1, 0.5, 0.9], [0.5, 0.5, 0.5], ['1', '2', '1'],
+                                 fontsize=20, color='red', ax=ax)
+    paths = collection.get_paths()
+    assert paths[0] is paths[2]
+    assert paths[0] is not paths[1]
+    plt.close(fig)
+
+
+def test_label_heatmap_collection_fallback():
+    """ Features only supported by Text should fall back to a list of Text."""
+    pitch = Pitch()
+    stats = pitch.bin_statistic(np.random.uniform(0, 120, 50),
+                                np.random.uniform(0, 80, 50), bins=(3, 2))
+    fig, ax = pitch.draw()
+    path_eff = [path_effects.Stroke(linewidth=2, foreground='black'), path_effects.Normal()]
+    texts = pitch.label_heatmap(stats, ax=ax, collection=True, path_effects=path_eff)
+    assert isinstance(texts, list)
+    assert len(texts) == 6
+    texts = pitch.label_heatmap(stats, ax=ax, collection=True, str_format='${:.0f}$')
+    assert isinstance(texts, list)
+    plt.close(fig)
+
+
+def test_label_heatmap_collection_keywords():
+    """ The long alignment aliases are used by the collection and keywords
+    not accepted by a PathCollection fall back to a list of Text."""
+    pitch = Pitch()
+    stats = pitch.bin_statistic(np.random.uniform(0, 120, 50),
+                                np.random.uniform(0, 80, 50), bins=(3, 2))
+    fig, ax = pitch.draw()
+    short = pitch.label_heatmap(stats, ax=ax, collection=True, ha='left', va='top')
+    long = pitch.label_heatmap(stats, ax=ax, collection=True, horizontalalignment='left',
+                               verticalalignment='top', fontfamily='DejaVu Sans')
+    assert isinstance(long, PathCollection)
+    assert all(np.array_equal(path_short.vertices, path_long.vertices)
+               for path_short, path_long in zip(short.get_paths(), long.get_paths()))
+    for key in ['ma', 'multialignment']:
+        texts = pitch.label_heatmap(stats, ax=ax, collection=True, **{key: 'left'})
+        assert isinstance(texts, list)
+        assert len(texts) == 6
+    plt.close(fig)
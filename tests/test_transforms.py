@@ -0,0 +1,103 @@
+""" Test the fused coordinate transforms."""
+
+import numpy as np
+import pytest
+
+from mplsoccer import CoordinateTransform, Pitch, Standardizer
+
+PITCH_PAIRS = [('opta', 'uefa'), ('statsbomb', 'uefa'), ('wyscout', 'statsbomb'),
+               ('statsbomb', 'wyscout'), ('opta', 'tracab')]
+
+
+def _locations(dim, size=5000, seed=42):
+    """ Locations on the pitch, a few outside the pitch and some missing values."""
+    rng = np.random.default_rng(seed)
+    ymin, ymax = sorted(dim.pitch_extent[2:])
+    x = rng.uniform(dim.left - 5, dim.right + 5, size)
+    y = rng.uniform(ymin - 5, ymax + 5, size)
+    x[::50] = np.nan
+    y[::70] = np.nan
+    return x, y
+
+
+@pytest.mark.parametrize('pitch_from, pitch_to', PITCH_PAIRS)
+def test_from_standardizer_matches_standardizer(pitch_from, pitch_to):
+    """ Test the transform and its inverse match Standardizer.transform."""
+    kwargs = {'length_to': 105, 'width_to': 68} if pitch_to == 'tracab' else {}
+    standardizer = Standardizer(pitch_from=pitch_from, pitch_to=pitch_to, **kwargs)
+    transform = CoordinateTransform.from_standardizer(standardizer)
+    x, y = _locations(standardizer.dim_from)
+    expected = standardizer.transform(x.copy(), y.copy())
+    result = transform.transform(x, y)
+    assert np.allclose(result, expected, equal_nan=True)
+    expected = standardizer.transform(*[coordinate.copy() for coordinate in expected],
+                                      reverse=True)
+    assert np.allclose(transform.inverse().transform(*result), expected, equal_nan=True)
+
+
+def test_flip_and_vertical_chain():
+    """ Test a per-coordinate flip and a vertical pitch match flip_side then standardizing."""
+    pitch = Pitch(pitch_type='opta')
+    standardizer = Standardizer(pitch_from='opta', pitch_to='uefa')
+    x, y = _locations(pitch.dim)
+    x, y = np.clip(x, 0, 100), np.clip(y, 0, 100)
+    flip = np.random.default_rng(0).random(x.size) < 0.5
+    x_flip, y_flip = pitch.flip_side(x, y, flip)
+    x_expected, y_expected = standardizer.transform(x_flip.copy(), y_flip.copy())
+
+    to_uefa = CoordinateTransform.from_standardizer(standardizer)
+    vertical = to_uefa.then(CoordinateTransform.vertical())
+    x_vertical, y_vertical = vertical.transform(x, y, flip=flip)
+    assert np.allclose(x_vertical, y_expected, equal_nan=True)
+    assert np.allclose(y_vertical, x_expected, equal_nan=True)
+    x_inverse, y_inverse = vertical.inverse().transform(x_vertical, y_vertical)
+    assert np.allclose(x_inverse, x_flip, equal_nan=True)
+    assert np.allclose(y_inverse, y_flip, equal_nan=True)
+
+    # flipping every coordinate is the same as chaining the flip transform
+    flipped = CoordinateTransform.flip(pitch.dim).then(to_uefa)
+    assert np.allclose(flipped.transform(x, y), to_uefa.transform(x, y, flip=True),
+                       equal_nan=True)
+
+
+def test_chain_is_simplified():
+    """ Test chaining adds no knots and inverting the y-axis twice is the identity."""
+    standardizer = Standardizer(pitch_from='statsbomb', pitch_to='uefa')
+    to_uefa = CoordinateTransform.from_standardizer(standardizer)
+    chain = to_uefa.then(CoordinateTransform.vertical()).then(CoordinateTransform.vertical())
+    for axis in range(2):
+        assert chain.knots[axis].size == to_uefa.knots[axis].size
+    dim = standardizer.dim_to
+    double = CoordinateTransform.invert_y(dim).then(CoordinateTransform.invert_y(dim))
+    assert double.knots[1].size == 2
+    assert np.allclose(double.values[1], double.knots[1])
+
+
+def test_transform_out_float32():
+    """ Test transforming float32 coordinates in place."""
+    standardizer = Standardizer(pitch_from='statsbomb', pitch_to='opta')
+    transform = CoordinateTransform.from_standardizer(standardizer).then(
+        CoordinateTransform.vertical())
+    x, y = _locations(standardizer.dim_from)
+    x_expected, y_expected = transform.transform(x, y)
+    x, y = x.astype(np.float32), y.astype(np.float32)
+    x_result, y_result = transform.transform(x, y, out=(x, y))
+    assert x_result is x and y_result is y
+    assert x.dtype == np.float32
+    assert np.allclose(x, x_expected, atol=1e-3, equal_nan=True)
+    assert np.allclose(y, y_expected, atol=1e-3, equal_nan=True)
+    assert transform.transform(1, 2, dtype=np.float32)[0].dtype == np.float32
+
+
+def test_invalid_transforms():
+    """ Test invalid mappings and arguments raise errors."""
+    with pytest.raises(ValueError):
+        CoordinateTransform(x_knots=(1, 0), x_values=(0, 1))
+    with pytest.raises(ValueError):
+        CoordinateTransform(x_knots=(0, 1, 2), x_values=(0, 1, 0))
+    with pytest.raises(ValueError):
+        CoordinateTransform().transform([1, 2], [1, 2], flip=True)
+    with pytest.raises(ValueError):
+        CoordinateTransform().transform([1, 2], [1, 2, 3])
+    with pytest.raises(TypeError):
+        CoordinateTransform.flip('opta')